@@ -1,6 +1,6 @@
 # encoding: utf-8
 
-from docx.api import Document  # noqa
+from docx.api import Document, open_async, validate  # noqa
 
 __version__ = "0.8.11"
 
@@ -8,7 +8,7 @@ __version__ = "0.8.11"
 # register custom Part classes with opc package reader
 
 from docx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
-from docx.opc.part import PartFactory
+from docx.opc.part import PartFactory, XmlPart
 from docx.opc.parts.coreprops import CorePropertiesPart
 
 from docx.parts.document import DocumentPart
@@ -28,7 +28,9 @@ def part_class_selector(content_type, reltype):
 PartFactory.part_class_selector = part_class_selector
 PartFactory.part_type_for[CT.OPC_CORE_PROPERTIES] = CorePropertiesPart
 PartFactory.part_type_for[CT.WML_DOCUMENT_MAIN] = DocumentPart
+PartFactory.part_type_for[CT.WML_ENDNOTES] = XmlPart
 PartFactory.part_type_for[CT.WML_FOOTER] = FooterPart
+PartFactory.part_type_for[CT.WML_FOOTNOTES] = XmlPart
 PartFactory.part_type_for[CT.WML_HEADER] = HeaderPart
 PartFactory.part_type_for[CT.WML_NUMBERING] = NumberingPart
 PartFactory.part_type_for[CT.WML_SETTINGS] = SettingsPart
@@ -44,5 +46,6 @@ del (
     PartFactory,
     SettingsPart,
     StylesPart,
+    XmlPart,
     part_class_selector,
 )
@@ -0,0 +1,129 @@
+# encoding: utf-8
+
+"""Coroutines opening and saving documents without blocking the asyncio event loop.
+
+Reading, parsing, serializing and compressing a package are done in an executor
+thread, so other tasks on the event loop keep running meanwhile. This module needs
+Python 3.5 or later and is imported only when one of its coroutines is first used,
+through `docx.open_async()` or `Document.save_async()`.
+"""
+
+import asyncio
+import inspect
+import weakref
+from io import BytesIO
+
+from docx.api import Document
+
+# ---size of each write to an asynchronous sink, so a slow consumer can apply
+#    back-pressure between writes---
+_CHUNK_SIZE = 64 * 1024
+
+_executor = None
+_max_concurrency = None
+_semaphores = weakref.WeakKeyDictionary()
+
+try:
+    _running_loop = asyncio.get_running_loop
+except AttributeError:  # pragma: no cover
+    # ---Python 3.5 and 3.6, where inside a coroutine this is the running loop---
+    _running_loop = asyncio.get_event_loop
+
+
+def configure(executor=None, max_concurrency=None):
+    """Set the executor used to open and save documents and how many may run at once.
+
+    *executor* is a `concurrent.futures.Executor`; the default executor of the event
+    loop is used when it is |None|. When *max_concurrency* is not |None|, at most
+    that many open and save operations are in progress at once on an event loop,
+    others waiting their turn. This bounds the memory taken by packages being read
+    and written when a service is under load.
+    """
+    global _executor, _max_concurrency
+    _executor = executor
+    _max_concurrency = max_concurrency
+    _semaphores.clear()
+
+
+async def open_document(docx=None):
+    """Return a |Document| loaded from *docx* without blocking the event loop.
+
+    *docx* is anything `docx.Document()` accepts, the bytes of a `.docx` file, or
+    an asynchronous file-like object, having a coroutine `read()` method.
+    """
+    semaphore = _semaphore()
+    if semaphore is None:
+        return await _open(docx)
+    async with semaphore:
+        return await _open(docx)
+
+
+async def save_document(document, path_or_stream):
+    """Save *document* to *path_or_stream* without blocking the event loop.
+
+    *path_or_stream* is a path, a file-like object, or an asynchronous sink: an
+    object having a coroutine `write()` method, like an `aiofiles` file, or having
+    a coroutine `drain()` method, like an `asyncio.StreamWriter`. *document* must
+    not be changed until saving is done.
+    """
+    semaphore = _semaphore()
+    if semaphore is None:
+        return await _save(document, path_or_stream)
+    async with semaphore:
+        return await _save(document, path_or_stream)
+
+
+def _is_async_sink(stream):
+    """True if *stream* is written to with coroutines rather than blocking calls."""
+    return inspect.iscoroutinefunction(
+        getattr(stream, "write", None)
+    ) or inspect.iscoroutinefunction(getattr(stream, "drain", None))
+
+
+async def _open(docx):
+    """Return |Document| loaded from *docx*, see `open_document()`."""
+    if isinstance(docx, bytes):
+        docx = BytesIO(docx)
+    elif inspect.iscoroutinefunction(getattr(docx, "read", None)):
+        docx = BytesIO(await docx.read())
+    return await _run(Document, docx)
+
+
+async def _run(func, *args):
+    """Return result of calling *func* with *args* in the configured executor."""
+    loop = _running_loop()
+    return await loop.run_in_executor(_executor, func, *args)
+
+
+async def _save(document, path_or_stream):
+    """Save *document* to *path_or_stream*, see `save_document()`."""
+    if not _is_async_sink(path_or_stream):
+        await _run(document.save, path_or_stream)
+        return
+
+    stream = BytesIO()
+    await _run(document.save, stream)
+    blob = stream.getvalue()
+    drain = getattr(path_or_stream, "drain", None)
+    if not inspect.iscoroutinefunction(drain):
+        drain = None
+    for offset in range(0, len(blob), _CHUNK_SIZE):
+        result = path_or_stream.write(blob[offset:offset + _CHUNK_SIZE])
+        if inspect.isawaitable(result):
+            await result
+        if drain is not None:
+            await drain()
+
+
+def _semaphore():
+    """Return semaphore bounding concurrent operations on the running event loop.
+
+    Returns |None| when concurrency is not bounded.
+    """
+    if _max_concurrency is None:
+        return None
+    loop = _running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(_max_concurrency)
+    return semaphore
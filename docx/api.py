@@ -1,7 +1,8 @@
 # encoding: utf-8
 
 """
-Directly exposed API functions and classes, :func:`Document` for now.
+Directly exposed API functions and classes, :func:`Document`,
+:func:`open_async` and :func:`validate` for now.
 Provides a syntactically more convenient API for interacting with the
 OpcPackage graph.
 """
@@ -14,14 +15,36 @@ from docx.opc.constants import CONTENT_TYPE as CT
 from docx.package import Package
 
 
-def Document(docx=None):
+def Document(docx=None, read_only=False):
     """
     Return a |Document| object loaded from *docx*, where *docx* can be
     either a path to a ``.docx`` file (a string) or a file-like object. If
     *docx* is missing or ``None``, the built-in default document "template"
-    is loaded.
+    is loaded. *docx* can also be a buffer holding a ``.docx`` file, such as
+    a |bytes|, |memoryview| or :class:`mmap.mmap` object. A buffer is read in
+    place, without being copied, and images stored uncompressed in the
+    package are kept as slices of it. A buffer must not change while the
+    document is in use; in particular, a file mapped with :mod:`mmap` must not
+    be overwritten, as by saving the document back to it.
+
+    Separate |Document| objects can be opened, changed and saved in separate
+    threads at once, as with a :class:`concurrent.futures.ThreadPoolExecutor`;
+    each thread parses XML with its own parser. A single document, or any
+    object obtained from it, must not be used by more than one thread at
+    a time without locking.
+
+    When *read_only* is True, a |ReadOnlyDocument| object is returned
+    instead, giving the text and style ids of the paragraphs, runs and tables
+    of the document along with its core properties. It is parsed without
+    the custom element classes and only its document and core properties
+    parts are read, which is considerably faster for extracting text from
+    many documents. Use :meth:`.ReadOnlyDocument.open` directly to lift the
+    parser limits for very large documents.
     """
     docx = _default_docx_path() if docx is None else docx
+    if read_only:
+        from docx.readonly import ReadOnlyDocument
+        return ReadOnlyDocument.open(docx)
     document_part = Package.open(docx).main_document_part
     if document_part.content_type != CT.WML_DOCUMENT_MAIN:
         tmpl = "file '%s' is not a Word file, content type is '%s'"
@@ -29,6 +52,35 @@ def Document(docx=None):
     return document_part.document
 
 
+def open_async(docx=None):
+    """
+    Return an awaitable loading a |Document| from *docx* in an executor
+    thread, so an asyncio event loop is not blocked meanwhile. *docx* can be
+    anything :func:`Document` accepts, the bytes of a ``.docx`` file, or an
+    asynchronous file-like object. See :func:`docx.aio.configure` for setting
+    the executor and bounding how many documents are opened at once. Requires
+    Python 3.5 or later.
+    """
+    from docx.aio import open_document
+    return open_document(docx)
+
+
+def validate(document, schema_dir=None):
+    """
+    Return a list of |SchemaViolation| objects, one for each error found
+    validating the XML parts of *document* against the WordprocessingML
+    schemas; the list is empty when the document is valid. Each gives the
+    partname and element path of the error. The schemas are compiled once in
+    each thread of a pool validating parts in parallel, so validating many
+    documents does not compile them again. *schema_dir* is the directory of
+    ECMA-376 XSD files, the ``ref/xsd`` directory of the python-docx source
+    tree by default, which is not installed with the package. Raises
+    |IOError| when they are not found there. See :mod:`docx.validation`.
+    """
+    from docx.validation import validate
+    return validate(document, schema_dir)
+
+
 def _default_docx_path():
     """
     Return the path to the built-in default .docx package.
@@ -21,18 +21,24 @@ class BlockItemContainer(Parented):
     a paragraph or table.
     """
 
+    __slots__ = ('_element',)
+
     def __init__(self, element, parent):
         super(BlockItemContainer, self).__init__(parent)
         self._element = element
 
-    def add_paragraph(self, text='', style=None):
+    def add_paragraph(self, text='', style=None, format=None):
         """
         Return a paragraph newly added to the end of the content in this
         container, having *text* in a single run if present, and having
         paragraph style *style*. If *style* is |None|, no paragraph style is
         applied, which has the same effect as applying the 'Normal' style.
+        *format* is an optional |ParagraphFormatSpec| object whose paragraph
+        formatting is directly applied to the new paragraph.
         """
         paragraph = self._add_paragraph()
+        if format is not None:
+            format.apply(paragraph)
         if text:
             paragraph.add_run(text)
         if style is not None:
@@ -48,7 +54,7 @@ class BlockItemContainer(Parented):
         from .table import Table
         tbl = CT_Tbl.new_tbl(rows, cols, width)
         self._element._insert_tbl(tbl)
-        return Table(tbl, self)
+        return self._proxy_factory(Table)(tbl)
 
     @property
     def paragraphs(self):
@@ -56,7 +62,7 @@ class BlockItemContainer(Parented):
         A list containing the paragraphs in this container, in document
         order. Read-only.
         """
-        return [Paragraph(p, self) for p in self._element.p_lst]
+        return list(map(self._proxy_factory(Paragraph), self._element.p_lst))
 
     @property
     def tables(self):
@@ -65,11 +71,11 @@ class BlockItemContainer(Parented):
         Read-only.
         """
         from .table import Table
-        return [Table(tbl, self) for tbl in self._element.tbl_lst]
+        return list(map(self._proxy_factory(Table), self._element.tbl_lst))
 
     def _add_paragraph(self):
         """
         Return a paragraph newly added to the end of the content in this
         container.
         """
-        return Paragraph(self._element.add_p(), self)
+        return self._proxy_factory(Paragraph)(self._element.add_p())
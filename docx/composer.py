@@ -0,0 +1,446 @@
+# encoding: utf-8
+
+"""Composing a document from the content of other documents."""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import hashlib
+import itertools
+import re
+from copy import deepcopy
+from io import BytesIO
+
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.part import XmlPart
+from docx.oxml.ns import nsmap, qn
+from docx.oxml.xmlchemy import serialize_for_reading
+from docx.parts.story import BaseStoryPart
+from docx.shared import lazyproperty
+
+# ---tags of elements whose `w:val` refers to a style, from content and from
+#    another style respectively---
+_STYLE_REF_TAGS = (qn("w:pStyle"), qn("w:rStyle"), qn("w:tblStyle"))
+_STYLE_LINK_TAGS = (qn("w:basedOn"), qn("w:link"), qn("w:next"))
+
+_R_NAMESPACE_PREFIX = "{%s}" % nsmap["r"]
+
+# ---relationship type and element name of each kind of note---
+_NOTE_TYPES = ((RT.FOOTNOTES, "footnote"), (RT.ENDNOTES, "endnote"))
+
+
+class Composer(object):
+    """Appends the content of source documents to the end of a *master* document.
+
+    Each source is added in one pass over its body. The styles, list definitions and
+    related parts, like images and headers, that the copied content refers to are
+    brought along, as are the footnotes and endnotes it refers to. Relationship ids,
+    numIds, note ids and drawing ids are remapped so they are unique in the master. A
+    style, image or abstract list definition already present, possibly from an
+    earlier source, is reused; these are matched by a hash of their content. A source
+    style having the id of a different master style is added under a new id and name.
+    A source can be discarded once appended, so any number of documents can be
+    composed while only one source at a time is held in memory.
+    """
+
+    def __init__(self, master):
+        super(Composer, self).__init__()
+        self._master = master
+        self._part = master.part
+
+    def append(self, document):
+        """Append the body content of *document* to the end of the master document.
+
+        The final section properties of *document* are not copied; its content takes
+        on the page setup of the last section of the master.
+        """
+        source_part = document.part
+        body = self._part.element.body
+        elements = [
+            deepcopy(child) for child in document.element.body
+            if child.tag != qn("w:sectPr")
+        ]
+
+        parts = {}
+        notes = self._copy_notes(source_part, elements)
+        note_elements = [note for _, _, note_lst in notes for note in note_lst]
+        styles = self._copy_styles(source_part, elements + note_elements)
+        self._remap_numIds(source_part, elements + note_elements + styles)
+        self._remap_rIds(source_part, self._part, elements, parts)
+        for source_notes_part, notes_part, note_lst in notes:
+            self._remap_rIds(source_notes_part, notes_part, note_lst, parts)
+        self._renumber_docPrs(elements + note_elements)
+
+        # ---the body `w:sectPr`, when present, is always its last child---
+        try:
+            last_child = body[-1]
+        except IndexError:
+            last_child = None
+        for elm in elements:
+            if last_child is None or last_child.tag != qn("w:sectPr"):
+                body.append(elm)
+            else:
+                last_child.addprevious(elm)
+
+        # ---copied content can add sections and shapes to the master---
+        self._part.reset_section_index()
+        self._part.reset_inline_index()
+
+    @lazyproperty
+    def _abstractNumIds_by_digest(self):
+        """dict mapping digest of each master `w:abstractNum` to its abstractNumId."""
+        return {
+            _abstractNum_digest(abstractNum): abstractNum.abstractNumId
+            for abstractNum in self._numbering.abstractNum_lst
+        }
+
+    def _copy_abstractNum(self, abstractNum):
+        """Return abstractNumId of master `w:abstractNum` matching *abstractNum*.
+
+        A copy of *abstractNum* is added to the master when no match is present.
+        """
+        digest = _abstractNum_digest(abstractNum)
+        abstractNumIds = self._abstractNumIds_by_digest
+        if digest not in abstractNumIds:
+            abstractNumId = max(
+                [-1] + [a.abstractNumId for a in self._numbering.abstractNum_lst]
+            ) + 1
+            new_abstractNum = deepcopy(abstractNum)
+            new_abstractNum.abstractNumId = abstractNumId
+            self._numbering._insert_abstractNum(new_abstractNum)
+            abstractNumIds[digest] = abstractNumId
+        return abstractNumIds[digest]
+
+    def _copy_notes(self, source_part, elements):
+        """Return list of the notes copied to the master for *elements*.
+
+        Each item is a `(source_notes_part, notes_part, notes)` 3-tuple, *notes* being
+        the footnotes or endnotes referred to in *elements*, as copied into master
+        *notes_part*. Each copy is numbered after the notes of the master, and the
+        reference to it in *elements* changed to match.
+        """
+        copied_notes = []
+        for reltype, tag in _NOTE_TYPES:
+            refs = [
+                ref for root in elements for ref in root.iter(qn("w:%sReference" % tag))
+            ]
+            if not refs:
+                continue
+            try:
+                source_notes_part = source_part.part_related_by(reltype)
+            except KeyError:
+                continue
+            source_notes = {
+                note.get(qn("w:id")): note
+                for note in source_notes_part.element.iterchildren(qn("w:%s" % tag))
+            }
+            notes_part = self._get_or_add_notes_part(source_notes_part, reltype)
+            notes_root = notes_part.element
+            next_id = max(
+                [0] + [
+                    int(note.get(qn("w:id")))
+                    for note in notes_root.iterchildren(qn("w:%s" % tag))
+                ]
+            ) + 1
+            notes = []
+            for ref in refs:
+                note = source_notes.get(ref.get(qn("w:id")))
+                if note is None:
+                    continue
+                new_note = deepcopy(note)
+                new_note.set(qn("w:id"), str(next_id))
+                ref.set(qn("w:id"), str(next_id))
+                notes_root.append(new_note)
+                notes.append(new_note)
+                next_id += 1
+            copied_notes.append((source_notes_part, notes_part, notes))
+        return copied_notes
+
+    def _copy_part(self, source_part, parts):
+        """Return copy of *source_part* newly added to the master package.
+
+        The relationships of the copy are copied too, each related part being copied
+        once per source document, as recorded in *parts*.
+        """
+        package = self._part.package
+        partname = package.next_partname(
+            re.sub(r"\d*(\.\w+)$", r"%d\1", source_part.partname)
+        )
+        part_cls = type(source_part)
+        if isinstance(source_part, XmlPart):
+            part = part_cls(
+                partname,
+                source_part.content_type,
+                deepcopy(source_part.element),
+                package,
+            )
+            self._renumber_docPrs([part.element])
+        else:
+            part = part_cls.load(
+                partname, source_part.content_type, source_part.blob, package
+            )
+        parts[source_part] = part
+        for rel in source_part.rels.values():
+            target = self._copy_target(rel, parts)
+            part.load_rel(rel.reltype, target, rel.rId, rel.is_external)
+        return part
+
+    def _copy_style(self, source_styles, styleId, styleIds, copied_styles):
+        """Return id of the master style matching source style *styleId*.
+
+        The source style is copied to the master when no master style has the same
+        content, under a new id and name when its id is already used in the master.
+        Any style it is based on is matched first. *styleIds* maps each source style
+        id already matched to its master id and *copied_styles* collects the copies.
+        """
+        if styleId in styleIds:
+            return styleIds[styleId]
+        # ---an undefined style is left as is, which also ends a `w:basedOn` loop---
+        styleIds[styleId] = styleId
+        style = source_styles.get(styleId)
+        if style is None:
+            return styleId
+
+        new_style = deepcopy(style)
+        basedOn = new_style.basedOn
+        if basedOn is not None:
+            basedOn.val = self._copy_style(
+                source_styles, basedOn.val, styleIds, copied_styles
+            )
+        digest = _style_digest(new_style)
+        styleIds_by_digest = self._styleIds_by_digest
+        if digest not in styleIds_by_digest:
+            if new_style.styleId in self._styleIds:
+                self._rename_style(new_style)
+            self._styles._insert_style(new_style)
+            self._styleIds.add(new_style.styleId)
+            copied_styles.append(new_style)
+            styleIds_by_digest[digest] = new_style.styleId
+        styleIds[styleId] = styleIds_by_digest[digest]
+
+        for tag in (qn("w:link"), qn("w:next")):
+            for elm in style.iterchildren(tag):
+                self._copy_style(
+                    source_styles, elm.get(qn("w:val")), styleIds, copied_styles
+                )
+        return styleIds[styleId]
+
+    def _copy_styles(self, source_part, elements):
+        """Return list of the styles copied to the master for *elements*.
+
+        Each style referred to by *elements* is matched to a master style having the
+        same content, or copied when there is none, along with any style it is based
+        on or linked to. The style references in *elements* and in the copied styles
+        are changed to the ids of the matching master styles.
+        """
+        refs = [elm for root in elements for elm in root.iter(*_STYLE_REF_TAGS)]
+        if not refs:
+            return []
+        source_styles = {
+            style.styleId: style for style in source_part.styles.element.style_lst
+        }
+        styleIds = {}
+        copied_styles = []
+        for elm in refs:
+            elm.set(
+                qn("w:val"),
+                self._copy_style(
+                    source_styles, elm.get(qn("w:val")), styleIds, copied_styles
+                ),
+            )
+        for style in copied_styles:
+            for elm in style.iter(qn("w:link"), qn("w:next")):
+                styleId = elm.get(qn("w:val"))
+                elm.set(qn("w:val"), styleIds.get(styleId, styleId))
+        return copied_styles
+
+    def _copy_target(self, rel, parts):
+        """Return target in the master package for source relationship *rel*.
+
+        An image is matched to an identical image already in the master, other
+        parts are copied. *parts* maps each source part already copied to its copy.
+        """
+        if rel.is_external:
+            return rel.target_ref
+        source_part = rel.target_part
+        if source_part in parts:
+            return parts[source_part]
+        if rel.reltype == RT.IMAGE:
+            return self._get_or_add_image_part(source_part)
+        return self._copy_part(source_part, parts)
+
+    @lazyproperty
+    def _docPr_ids(self):
+        """Iterator of drawing ids, each after those in the stories of the master."""
+        ids = [
+            int(id_)
+            for part in self._part.package.iter_parts()
+            if isinstance(part, BaseStoryPart)
+            for id_ in part.element.xpath("//wp:docPr/@id")
+            if id_.isdigit()
+        ]
+        return itertools.count(max([0] + ids) + 1)
+
+    def _get_or_add_image_part(self, source_image_part):
+        """Return master |ImagePart| having the same image as *source_image_part*."""
+        sha1 = source_image_part.sha1
+        image_parts = self._image_parts_by_sha1
+        if sha1 not in image_parts:
+            image_parts[sha1] = self._part.package.get_or_add_image_part(
+                BytesIO(source_image_part.blob)
+            )
+        return image_parts[sha1]
+
+    def _get_or_add_notes_part(self, source_notes_part, reltype):
+        """Return the master notes part related by *reltype*, added when not present.
+
+        An added part has the separator notes of *source_notes_part* and no others.
+        """
+        try:
+            return self._part.part_related_by(reltype)
+        except KeyError:
+            pass
+        element = deepcopy(source_notes_part.element)
+        for note in list(element):
+            if note.get(qn("w:type"), "normal") == "normal":
+                element.remove(note)
+        package = self._part.package
+        partname = package.next_partname(
+            re.sub(r"\d*(\.\w+)$", r"%d\1", source_notes_part.partname)
+        )
+        notes_part = XmlPart(
+            partname, source_notes_part.content_type, element, package
+        )
+        self._part.relate_to(notes_part, reltype)
+        return notes_part
+
+    @lazyproperty
+    def _image_parts_by_sha1(self):
+        """dict mapping SHA1 hash of each image in the master to its |ImagePart|."""
+        return {
+            image_part.sha1: image_part
+            for image_part in self._part.package.image_parts
+        }
+
+    @lazyproperty
+    def _numbering(self):
+        """`w:numbering` element of the master, added when not yet present."""
+        return self._part.numbering_part.element
+
+    def _remap_numIds(self, source_part, elements):
+        """Change each numId in *elements* to that of its copy in the master."""
+        numIds = {}
+        for root in elements:
+            for numId in root.iter(qn("w:numId")):
+                source_numId = numId.val
+                if not source_numId:
+                    continue
+                if source_numId not in numIds:
+                    numIds[source_numId] = self._copy_num(source_part, source_numId)
+                if numIds[source_numId] is not None:
+                    numId.val = numIds[source_numId]
+
+    def _copy_num(self, source_part, numId):
+        """Return numId of a new master `w:num` copied from source list *numId*.
+
+        Returns |None| when *numId* does not identify a list of the source.
+        """
+        try:
+            source_numbering = source_part.part_related_by(RT.NUMBERING).element
+            num = source_numbering.num_having_numId(numId)
+        except KeyError:
+            return None
+        abstractNumId = num.abstractNumId.val
+        for abstractNum in source_numbering.abstractNum_lst:
+            if abstractNum.abstractNumId == abstractNumId:
+                break
+        else:
+            return None
+        new_num = self._numbering.add_num(self._copy_abstractNum(abstractNum))
+        for lvlOverride in num.lvlOverride_lst:
+            new_num.append(deepcopy(lvlOverride))
+        return new_num.numId
+
+    def _remap_rIds(self, source_part, part, elements, parts):
+        """Change each rId in *elements* to the matching relationship of *part*.
+
+        The relationships are looked up in *source_part*, and their targets copied as
+        needed.
+        """
+        rIds = {}
+        source_rels = source_part.rels
+        for root in elements:
+            for elm in root.iter():
+                for name, value in elm.attrib.items():
+                    if not name.startswith(_R_NAMESPACE_PREFIX):
+                        continue
+                    if value not in rIds:
+                        rel = source_rels.get(value)
+                        if rel is None:
+                            continue
+                        target = self._copy_target(rel, parts)
+                        rIds[value] = part.relate_to(
+                            target, rel.reltype, rel.is_external
+                        )
+                    elm.set(name, rIds[value])
+
+    def _rename_style(self, style):
+        """Give *style* an id and name not used by any master style."""
+        names = {s.name_val for s in self._styles.style_lst}
+        styleId, name = style.styleId, style.name_val
+        for n in itertools.count(1):
+            new_styleId = "%s%d" % (styleId, n)
+            new_name = None if name is None else "%s %d" % (name, n)
+            if new_styleId not in self._styleIds and new_name not in names:
+                break
+        style.styleId = new_styleId
+        if new_name is not None:
+            style.name_val = new_name
+
+    def _renumber_docPrs(self, elements):
+        """Give each drawing in *elements* an id not yet used in the master."""
+        for root in elements:
+            for docPr in root.iter(qn("wp:docPr")):
+                docPr.set("id", str(next(self._docPr_ids)))
+
+    @lazyproperty
+    def _styleIds(self):
+        """Set of the style ids defined in the master."""
+        return {style.styleId for style in self._styles.style_lst}
+
+    @lazyproperty
+    def _styleIds_by_digest(self):
+        """dict mapping digest of each master `w:style` to its styleId."""
+        return {_style_digest(style): style.styleId for style in self._styles.style_lst}
+
+    @lazyproperty
+    def _styles(self):
+        """`w:styles` element of the master."""
+        return self._master.styles.element
+
+
+def _abstractNum_digest(abstractNum):
+    """Return hash of the list formatting defined by *abstractNum*.
+
+    The abstractNumId and the `w:nsid` and `w:tmpl` ids, which differ between
+    otherwise identical definitions, are left out.
+    """
+    abstractNum = deepcopy(abstractNum)
+    del abstractNum.attrib[qn("w:abstractNumId")]
+    for child in abstractNum.findall(qn("w:nsid")) + abstractNum.findall(qn("w:tmpl")):
+        abstractNum.remove(child)
+    return hashlib.sha1(serialize_for_reading(abstractNum).encode("utf-8")).hexdigest()
+
+
+def _style_digest(style):
+    """Return hash of the definition of *style*.
+
+    The `w:rsid` revision id, which differs between otherwise identical definitions,
+    and the `w:link` and `w:next` references, which can refer back to *style*, are
+    left out.
+    """
+    style = deepcopy(style)
+    for child in style.findall(qn("w:rsid")) + style.findall(qn("w:link")) + (
+        style.findall(qn("w:next"))
+    ):
+        style.remove(child)
+    return hashlib.sha1(serialize_for_reading(style).encode("utf-8")).hexdigest()
@@ -4,11 +4,17 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import re
+
 from docx.blkcntnr import BlockItemContainer
 from docx.enum.section import WD_SECTION
 from docx.enum.text import WD_BREAK
+from docx.oxml.ns import qn
+from docx.oxml.text.textmap import TextMap
 from docx.section import Section, Sections
 from docx.shared import ElementProxy, Emu
+from docx.table import Table, _Cell
+from docx.text.paragraph import Paragraph
 
 
 class Document(ElementProxy):
@@ -25,6 +31,14 @@ class Document(ElementProxy):
         self._part = part
         self.__body = None
 
+    def __reduce__(self):
+        """Support pickling, the package of this document being pickled along with it.
+
+        See `OpcPackage.__reduce__()`. Objects obtained from this document, like
+        paragraphs, cannot themselves be pickled.
+        """
+        return _main_document, (self._part.package,)
+
     def add_heading(self, text="", level=1):
         """Return a heading paragraph newly added to the end of the document.
 
@@ -44,16 +58,17 @@ class Document(ElementProxy):
         paragraph.add_run().add_break(WD_BREAK.PAGE)
         return paragraph
 
-    def add_paragraph(self, text='', style=None):
+    def add_paragraph(self, text='', style=None, format=None):
         """
         Return a paragraph newly added to the end of the document, populated
         with *text* and having paragraph style *style*. *text* can contain
         tab (``\\t``) characters, which are converted to the appropriate XML
         form for a tab. *text* can also include newline (``\\n``) or carriage
         return (``\\r``) characters, each of which is converted to a line
-        break.
+        break. *format* is an optional |ParagraphFormatSpec| object whose
+        paragraph formatting is directly applied to the new paragraph.
         """
-        return self._body.add_paragraph(text, style)
+        return self._body.add_paragraph(text, style, format)
 
     def add_picture(self, image_path_or_stream, width=None, height=None):
         """
@@ -78,7 +93,7 @@ class Document(ElementProxy):
         of the :ref:`WdSectionStart` enumeration, and defaults to
         ``WD_SECTION.NEW_PAGE`` if not provided.
         """
-        new_sectPr = self._element.body.add_section_break()
+        new_sectPr = self._part.add_section_break()
         new_sectPr.start_type = start_type
         return Section(new_sectPr, self._part)
 
@@ -93,6 +108,23 @@ class Document(ElementProxy):
         table.style = style
         return table
 
+    @property
+    def cache_proxies(self):
+        """True if proxy objects like paragraphs and runs are reused while referenced.
+
+        Read/write, False by default. When True, getting the paragraphs, runs, tables,
+        rows, or cells of this document returns the same object for an element each
+        time, as long as that object is still referenced elsewhere, rather than a new
+        one each time. Each story, the body and each header and footer, keeps its own
+        weak references to the objects made for it, so caching costs no memory for
+        objects no longer in use.
+        """
+        return self._part.cache_proxies
+
+    @cache_proxies.setter
+    def cache_proxies(self, value):
+        self._part.cache_proxies = value
+
     @property
     def core_properties(self):
         """
@@ -101,6 +133,30 @@ class Document(ElementProxy):
         """
         return self._part.core_properties
 
+    def drop_caches(self):
+        """Discard values held only to avoid computing them again, to save memory.
+
+        These are parsed image headers, serialized XML and the indexes of sections and
+        shapes, each rebuilt when next needed. The content of the document is not
+        changed.
+        """
+        self._part.package.drop_caches()
+
+    @property
+    def image_policy(self):
+        """|ImagePolicy| resampling each picture added to this document, or |None|.
+
+        Read/write. When set, a picture added afterward having more pixels per inch of
+        its shown size than the policy allows is resampled before it is stored. Pictures
+        already in the document are not changed. |None|, the default, stores each
+        picture as it is.
+        """
+        return self._part.package.image_parts.policy
+
+    @image_policy.setter
+    def image_policy(self, value):
+        self._part.package.image_parts.policy = value
+
     @property
     def inline_shapes(self):
         """
@@ -111,6 +167,43 @@ class Document(ElementProxy):
         """
         return self._part.inline_shapes
 
+    def iter_list_labels(self):
+        """
+        Generate a ``(paragraph, label)`` pair for each paragraph in this
+        document, in document order, including the paragraphs in tables.
+        *label* is the list label Word renders for a numbered paragraph, like
+        ``'3.a.ii'``, or |None| for a paragraph that is not numbered. The
+        labels of the whole document are computed in a single pass. The
+        parent of a paragraph in a table cell is that |_Cell|, as in
+        ``cell.paragraphs``; any other paragraph has the document body as its
+        parent.
+        """
+        list_labeler = self._part.new_list_labeler()
+        cells = {}
+        for p in self._element.body.iter(qn('w:p')):
+            container = self._block_container(p, cells)
+            yield container._proxy_factory(Paragraph)(p), list_labeler.label(p)
+
+    def memory_report(self):
+        """Return list of |PartMemoryUsage| objects, one for each part of the document.
+
+        Each reports the element count and estimated XML size of an XML part, the size
+        of the blob a part holds, and the names of the rebuildable values it caches,
+        which `drop_caches()` discards. Takes time proportional to the size of the
+        document.
+        """
+        return self._part.package.memory_report()
+
+    def normalize_runs(self):
+        """Merge adjacent runs having the same formatting throughout this document.
+
+        Each paragraph of the body, including those in tables, and of each header and
+        footer is normalized as `Paragraph.normalize_runs()` describes. |Run| objects
+        obtained before the call may no longer be part of the document.
+        """
+        for story_part in self._part.iter_story_parts():
+            story_part.normalize_runs()
+
     @property
     def paragraphs(self):
         """
@@ -127,6 +220,32 @@ class Document(ElementProxy):
         """
         return self._part
 
+    def replace(self, pattern, repl, count=0):
+        """
+        Replace each match of regular expression *pattern* in the text of
+        this document with *repl* and return the number of matches replaced.
+
+        *pattern* and *repl* are as for `re.sub()`; *pattern* is a string or
+        compiled regular expression and *repl* is a string, which can have
+        backreferences like ``\\1``, or a callable taking the match object.
+        At most *count* matches are replaced when *count* is not zero. Each
+        paragraph of the body, including those in tables, and of each header
+        and footer is searched, and a match can span several runs. Its
+        replacement takes the character formatting of the first run holding
+        matched text and the rest of the matched text is removed from the
+        runs it spans. Matches do not cross paragraph boundaries.
+        """
+        regex = re.compile(pattern)
+        replaced_count = 0
+        for story_part in self._part.iter_story_parts():
+            story_part.reset_inline_index()
+            for p in story_part.element.iter(qn('w:p')):
+                remaining_count = count - replaced_count if count else 0
+                replaced_count += TextMap(p).replace(regex, repl, remaining_count)
+                if count and replaced_count >= count:
+                    return replaced_count
+        return replaced_count
+
     def save(self, path_or_stream):
         """
         Save this document to *path_or_stream*, which can be either a path to
@@ -134,6 +253,17 @@ class Document(ElementProxy):
         """
         self._part.save(path_or_stream)
 
+    def save_async(self, path_or_stream):
+        """Return an awaitable saving this document to *path_or_stream*.
+
+        The document is serialized and written in an executor thread, so an asyncio
+        event loop is not blocked meanwhile. *path_or_stream* can also be an
+        asynchronous sink, like an `asyncio.StreamWriter`. The document must not be
+        changed until saving is done. Requires Python 3.5 or later.
+        """
+        from docx.aio import save_document
+        return save_document(self, path_or_stream)
+
     @property
     def sections(self):
         """|Sections| object providing access to each section in this document."""
@@ -165,6 +295,22 @@ class Document(ElementProxy):
         """
         return self._body.tables
 
+    def _block_container(self, elm, cells):
+        """
+        Return the |_Cell| or |_Body| proxy containing block item *elm*, like
+        a `w:p` element. *cells* maps each `w:tc` element to the |_Cell| made
+        for it, so each cell and table is made once in a pass.
+        """
+        tc = elm.getparent()
+        if tc.tag != qn('w:tc'):
+            return self._body
+        cell = cells.get(tc)
+        if cell is None:
+            tbl = next(tc.iterancestors(qn('w:tbl')))
+            table = self._block_container(tbl, cells)._proxy_factory(Table)(tbl)
+            cell = cells[tc] = table._proxy_factory(_Cell)(tc)
+        return cell
+
     @property
     def _block_width(self):
         """
@@ -176,6 +322,11 @@ class Document(ElementProxy):
             section.page_width - section.left_margin - section.right_margin
         )
 
+    @property
+    def _proxy_cache(self):
+        """|ProxyCache| of the document part, |None| when proxy caching is off."""
+        return self._part._proxy_cache
+
     @property
     def _body(self):
         """
@@ -191,6 +342,9 @@ class _Body(BlockItemContainer):
     Proxy for ``<w:body>`` element in this document, having primarily a
     container role.
     """
+
+    __slots__ = ('_body',)
+
     def __init__(self, body_elm, parent):
         super(_Body, self).__init__(body_elm, parent)
         self._body = body_elm
@@ -202,4 +356,11 @@ class _Body(BlockItemContainer):
         preserved.
         """
         self._body.clear_content()
+        self.part.reset_section_index()
+        self.part.reset_inline_index()
         return self
+
+
+def _main_document(package):
+    """Return the |Document| object of *package*, used for unpickling."""
+    return package.main_document_part.document
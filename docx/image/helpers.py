@@ -2,7 +2,7 @@
 
 from __future__ import absolute_import, division, print_function
 
-from struct import Struct
+from struct import Struct, error as StructError
 
 from .exceptions import UnexpectedEndOfFileError
 
@@ -11,11 +11,21 @@ BIG_ENDIAN = '>'
 LITTLE_ENDIAN = '<'
 
 
+_BYTE = Struct('B')
+_SHORT = {BIG_ENDIAN: Struct('>H'), LITTLE_ENDIAN: Struct('<H')}
+_LONG = {BIG_ENDIAN: Struct('>L'), LITTLE_ENDIAN: Struct('<L')}
+
+
 class StreamReader(object):
     """
     Wraps a file-like object to provide access to structured data from a
     binary file. Byte-order is configurable. *base_offset* is added to any
     base value provided to calculate actual location for reads.
+
+    The bytes of *stream* are read once, when constructed, and each value
+    is unpacked directly from them, without seeking in *stream*. For
+    a |BytesIO| stream, like the one |Image| parses a blob from, those bytes
+    are the ones the stream was created from, so no copy is made.
     """
     def __init__(self, stream, byte_order, base_offset=0):
         super(StreamReader, self).__init__()
@@ -24,74 +34,88 @@ class StreamReader(object):
             LITTLE_ENDIAN if byte_order == LITTLE_ENDIAN else BIG_ENDIAN
         )
         self._base_offset = base_offset
+        self._bytes = _bytes_of(stream)
+        self._position = 0
+
+    def find(self, sub, base, offset=0):
+        """
+        Return the offset, relative to the base offset of this reader, of the
+        first occurrence of bytes *sub* at or after the position defined by
+        self._base_offset + *base* + *offset*. Raises
+        |UnexpectedEndOfFileError| when *sub* does not occur.
+        """
+        location = self._bytes.find(sub, self._base_offset + base + offset)
+        if location < 0:
+            raise UnexpectedEndOfFileError
+        return location - self._base_offset
 
     def read(self, count):
         """
-        Allow pass-through read() call
+        Return the *count* bytes, or fewer at the end of the stream, starting
+        at the current position, and move past them.
         """
-        return self._stream.read(count)
+        start = self._position
+        self._position = start + count
+        return self._bytes[start:self._position]
 
     def read_byte(self, base, offset=0):
         """
         Return the int value of the byte at the file position defined by
-        self._base_offset + *base* + *offset*. If *base* is None, the byte is
-        read from the current position in the stream.
+        self._base_offset + *base* + *offset*.
         """
-        fmt = 'B'
-        return self._read_int(fmt, base, offset)
+        return self._unpack_item(_BYTE, base, offset)
 
     def read_long(self, base, offset=0):
         """
         Return the int value of the four bytes at the file position defined by
-        self._base_offset + *base* + *offset*. If *base* is None, the long is
-        read from the current position in the stream. The endian setting of
-        this instance is used to interpret the byte layout of the long.
+        self._base_offset + *base* + *offset*. The endian setting of this
+        instance is used to interpret the byte layout of the long.
         """
-        fmt = '<L' if self._byte_order is LITTLE_ENDIAN else '>L'
-        return self._read_int(fmt, base, offset)
+        return self._unpack_item(_LONG[self._byte_order], base, offset)
 
     def read_short(self, base, offset=0):
         """
         Return the int value of the two bytes at the file position determined
         by *base* and *offset*, similarly to ``read_long()`` above.
         """
-        fmt = b'<H' if self._byte_order is LITTLE_ENDIAN else b'>H'
-        return self._read_int(fmt, base, offset)
+        return self._unpack_item(_SHORT[self._byte_order], base, offset)
 
     def read_str(self, char_count, base, offset=0):
         """
         Return a string containing the *char_count* bytes at the file
         position determined by self._base_offset + *base* + *offset*.
         """
-        def str_struct(char_count):
-            format_ = '%ds' % char_count
-            return Struct(format_)
-        struct = str_struct(char_count)
+        struct = Struct('%ds' % char_count)
         chars = self._unpack_item(struct, base, offset)
         unicode_str = chars.decode('UTF-8')
         return unicode_str
 
     def seek(self, base, offset=0):
-        location = self._base_offset + base + offset
-        self._stream.seek(location)
+        self._position = self._base_offset + base + offset
 
     def tell(self):
         """
-        Allow pass-through tell() call
+        Return the current position, as set by `seek()` and advanced by
+        `read()`.
         """
-        return self._stream.tell()
+        return self._position
 
-    def _read_bytes(self, byte_count, base, offset):
-        self.seek(base, offset)
-        bytes_ = self._stream.read(byte_count)
-        if len(bytes_) < byte_count:
+    def _unpack_item(self, struct, base, offset):
+        try:
+            return struct.unpack_from(
+                self._bytes, self._base_offset + base + offset
+            )[0]
+        except StructError:
             raise UnexpectedEndOfFileError
-        return bytes_
 
-    def _read_int(self, fmt, base, offset):
-        struct = Struct(fmt)
-        return self._unpack_item(struct, base, offset)
 
-    def _unpack_item(self, struct, base, offset):
-        bytes_ = self._read_bytes(struct.size, base, offset)
-        return struct.unpack(bytes_)[0]
+def _bytes_of(stream):
+    """
+    Return the bytes of *stream*, without copying them when *stream* is
+    a |BytesIO| object.
+    """
+    getvalue = getattr(stream, 'getvalue', None)
+    if getvalue is not None:
+        return getvalue()
+    stream.seek(0)
+    return stream.read()
@@ -27,13 +27,14 @@ class Image(object):
         self._image_header = image_header
 
     @classmethod
-    def from_blob(cls, blob):
+    def from_blob(cls, blob, filename=None):
         """
         Return a new |Image| subclass instance parsed from the image binary
-        contained in *blob*.
+        contained in *blob*. A generic *filename* like 'image.png' is used
+        when none is given.
         """
         stream = BytesIO(blob)
-        return cls._from_stream(stream, blob)
+        return cls._from_stream(stream, blob, filename)
 
     @classmethod
     def from_file(cls, image_descriptor):
@@ -0,0 +1,132 @@
+# encoding: utf-8
+
+"""Downscaling of large images to the size they are shown at, when they are added.
+
+A photo of many megapixels shown two inches wide is stored at full resolution unless
+resampled, making the package larger and each save slower. An |ImagePolicy| assigned
+to `Document.image_policy` resamples each picture added afterward to no more than
+a given number of pixels per inch of its shown size. Resampling needs Pillow; when
+Pillow is not installed, images are added unchanged.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import math
+import os
+from io import BytesIO
+
+from docx.image.image import Image
+from docx.shared import Inches
+
+try:
+    from PIL import Image as PILImage
+except ImportError:  # pragma: no cover
+    PILImage = None
+    _PIL_ERRORS = ()
+else:
+    # ---raised by Pillow for an image it cannot read, decode, or save in the
+    #    format chosen---
+    _PIL_ERRORS = (IOError, OSError, ValueError, PILImage.DecompressionBombError)
+
+
+class ImagePolicy(object):
+    """Limits on the resolution of pictures added to a document.
+
+    *max_dpi* is the most pixels stored per inch of the width and height a picture is
+    shown at; an image having more is resampled to that resolution. *jpeg_quality*,
+    from 1 to 95, is the quality JPEG images are saved at when resampled, the Pillow
+    default of 75 when |None|. JPEG images remain JPEG; images of other formats
+    become PNG when resampled. An image needing no resampling is added unchanged.
+    """
+
+    def __init__(self, max_dpi=220, jpeg_quality=None):
+        super(ImagePolicy, self).__init__()
+        if max_dpi <= 0:
+            raise ValueError("max_dpi must be positive, got %r" % max_dpi)
+        if jpeg_quality is not None and not 1 <= jpeg_quality <= 95:
+            raise ValueError("jpeg_quality must be 1 to 95, got %r" % jpeg_quality)
+        self._max_dpi = max_dpi
+        self._jpeg_quality = jpeg_quality
+
+    def __eq__(self, other):
+        if not isinstance(other, ImagePolicy):
+            return NotImplemented
+        return self._key == other._key
+
+    def __hash__(self):
+        return hash(self._key)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return "ImagePolicy(max_dpi=%r, jpeg_quality=%r)" % self._key
+
+    @property
+    def jpeg_quality(self):
+        """Quality resampled JPEG images are saved at, |None| for the Pillow default."""
+        return self._jpeg_quality
+
+    @property
+    def max_dpi(self):
+        """Most pixels stored per inch of the size a picture is shown at."""
+        return self._max_dpi
+
+    def target_px_size(self, image, width=None, height=None):
+        """Return (px_width, px_height) pair *image* is resampled to, |None| if not.
+
+        *width* and *height* are the |Length| values the picture is added with, as
+        `Image.scaled_dimensions()` takes them.
+        """
+        cx, cy = image.scaled_dimensions(width, height)
+        px_width = int(math.ceil(cx * self._max_dpi / Inches(1)))
+        px_height = int(math.ceil(cy * self._max_dpi / Inches(1)))
+        if px_width >= image.px_width and px_height >= image.px_height:
+            return None
+        return max(px_width, 1), max(px_height, 1)
+
+    def transform(self, image, px_width, px_height):
+        """Return a new |Image| of *image* resampled to *px_width* by *px_height*.
+
+        Its dpi is set to `max_dpi`, so its native size is still the size it is shown
+        at, and its filename keeps the name of *image*. Returns *image* itself when
+        Pillow is not installed or cannot read, resample, or save it, as for a WMF
+        image or a damaged one.
+        """
+        if PILImage is None:
+            return image
+        try:
+            return self._transform(image, px_width, px_height)
+        except _PIL_ERRORS:
+            return image
+
+    def _transform(self, image, px_width, px_height):
+        """Return *image* resampled by Pillow, see `transform()`."""
+        source = PILImage.open(BytesIO(image.blob))
+        is_jpeg = source.format == "JPEG"
+        icc_profile = source.info.get("icc_profile")
+        if source.mode not in (("RGB", "L", "CMYK") if is_jpeg else ("RGB", "RGBA")):
+            source = source.convert(
+                "RGB" if is_jpeg else "RGBA" if _has_alpha(source) else "RGB"
+            )
+        resampled = source.resize((px_width, px_height), PILImage.LANCZOS)
+        options = {"dpi": (self._max_dpi, self._max_dpi)}
+        if icc_profile:
+            options["icc_profile"] = icc_profile
+        if is_jpeg and self._jpeg_quality is not None:
+            options["quality"] = self._jpeg_quality
+        stream = BytesIO()
+        resampled.save(stream, "JPEG" if is_jpeg else "PNG", **options)
+        filename = "%s.%s" % (
+            os.path.splitext(image.filename)[0], "jpg" if is_jpeg else "png"
+        )
+        return Image._from_stream(stream, stream.getvalue(), filename)
+
+    @property
+    def _key(self):
+        return (self._max_dpi, self._jpeg_quality)
+
+
+def _has_alpha(pil_image):
+    """True if *pil_image* has transparency, in an alpha band or a palette."""
+    return pil_image.mode in ("RGBA", "LA", "PA") or "transparency" in pil_image.info
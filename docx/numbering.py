@@ -0,0 +1,257 @@
+# encoding: utf-8
+
+"""List numbering, computing the rendered label of numbered paragraphs."""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import re
+from copy import copy
+
+from docx.enum.style import WD_STYLE_TYPE
+from docx.shared import lazyproperty
+
+
+class ListLabeler(object):
+    """Computes the list label, like "3.a.ii", of each paragraph in a story.
+
+    The numbering definition of a list is resolved once, when first needed, from its
+    `w:num` and `w:abstractNum` elements, including level and start overrides. The
+    counters of each list are carried from one paragraph to the next, so labeling every
+    paragraph of a document takes a single pass. Paragraphs must be passed to
+    :meth:`label` in document order, and a labeler serves a single such pass.
+    """
+
+    # ---a list has at most nine levels, 0-8---
+    _LEVEL_COUNT = 9
+
+    def __init__(self, numbering, styles):
+        super(ListLabeler, self).__init__()
+        self._numbering = numbering
+        self._styles = styles
+        self._counters = {}
+        self._started_numIds = set()
+        self._list_defs = {}
+        self._style_numPrs = {}
+
+    def label(self, p):
+        """Return the rendered list label of paragraph *p*, or |None| if not numbered.
+
+        *p* is a `w:p` element. Its numbering properties are taken from its own `w:pPr`
+        or else from its paragraph style. Calling this method advances the counters of
+        the list *p* belongs to.
+        """
+        numId, ilvl, style_id = self._numPr_vals(p)
+        list_def = self._list_def(numId)
+        if list_def is None:
+            return None
+        list_key, levels, start_overridden_ilvls = list_def
+        if ilvl is None:
+            ilvl = self._ilvl_for_style(levels, style_id)
+        level = levels.get(ilvl)
+        if level is None:
+            return None
+
+        counters = self._counters.setdefault(list_key, [None] * self._LEVEL_COUNT)
+        if numId not in self._started_numIds:
+            self._started_numIds.add(numId)
+            for overridden_ilvl in start_overridden_ilvls:
+                counters[overridden_ilvl] = None
+        counters[ilvl] = level.start if counters[ilvl] is None else counters[ilvl] + 1
+        for deeper_ilvl in range(ilvl + 1, self._LEVEL_COUNT):
+            deeper_level = levels.get(deeper_ilvl)
+            restart = deeper_ilvl if deeper_level is None else deeper_level.restart
+            if ilvl < restart:
+                counters[deeper_ilvl] = None
+
+        return self._render(level, levels, counters)
+
+    @lazyproperty
+    def _abstractNums(self):
+        """dict mapping each abstractNumId to its `w:abstractNum` element."""
+        return {
+            abstractNum.abstractNumId: abstractNum
+            for abstractNum in self._numbering.abstractNum_lst
+        }
+
+    def _ilvl_for_style(self, levels, style_id):
+        """Return ilvl of the level in *levels* linked to *style_id*, 0 if none is."""
+        if style_id is not None:
+            for ilvl, level in levels.items():
+                if level.style_id == style_id:
+                    return ilvl
+        return 0
+
+    def _list_def(self, numId):
+        """Return (list_key, levels, start_overridden_ilvls) triple for *numId*.
+
+        *list_key* identifies the counters shared by every `w:num` of the same abstract
+        definition. *levels* maps each ilvl to its |_Level|, with any level overrides of
+        the `w:num` applied. Returns |None| when *numId* does not identify a list.
+        """
+        if not numId or self._numbering is None:
+            return None
+        try:
+            return self._list_defs[numId]
+        except KeyError:
+            pass
+        list_def = self._list_defs[numId] = self._resolve_list_def(numId, set())
+        return list_def
+
+    @lazyproperty
+    def _nums(self):
+        """dict mapping each numId to its `w:num` element."""
+        return {num.numId: num for num in self._numbering.num_lst}
+
+    def _numPr_vals(self, p):
+        """Return (numId, ilvl, style_id) triple for numbering of `w:p` element *p*.
+
+        Values not set directly on *p* are inherited from its paragraph style. *numId*
+        is |None| when *p* is not numbered and *ilvl* is |None| when neither *p* nor its
+        style specifies one.
+        """
+        numId = ilvl = None
+        pPr = p.pPr
+        style_id = None if pPr is None else pPr.style
+        numPr = None if pPr is None else pPr.numPr
+        if numPr is not None:
+            numId = None if numPr.numId is None else numPr.numId.val
+            ilvl = None if numPr.ilvl is None else numPr.ilvl.val
+        if numId is None:
+            numId, style_ilvl = self._style_numPr_vals(style_id)
+            ilvl = style_ilvl if ilvl is None else ilvl
+        return numId, ilvl, style_id
+
+    def _render(self, level, levels, counters):
+        """Return label of *level* given the current value of each of *counters*."""
+
+        def replace(match):
+            ilvl = int(match.group(1)) - 1
+            ref_level = levels.get(ilvl)
+            if ref_level is None:
+                return ""
+            value = counters[ilvl]
+            if value is None:
+                value = ref_level.start
+            num_fmt = "decimal" if level.is_legal else ref_level.num_fmt
+            return _format_number(value, num_fmt)
+
+        return _LVL_TEXT_REF.sub(replace, level.text)
+
+    def _resolve_list_def(self, numId, visited_numIds):
+        """Return newly resolved list definition for *numId*, see `_list_def()`."""
+        num = self._nums.get(numId)
+        if num is None or numId in visited_numIds:
+            return None
+        visited_numIds.add(numId)
+        abstractNum = self._abstractNums.get(num.abstractNumId.val)
+        if abstractNum is None:
+            return None
+
+        if abstractNum.numStyleLink is not None:
+            # ---levels are defined by the list that the numbering style refers to---
+            linked_numId, _ = self._style_numPr_vals(abstractNum.numStyleLink.val)
+            linked_def = self._resolve_list_def(linked_numId, visited_numIds)
+            if linked_def is None:
+                return None
+            list_key, levels, _ = linked_def
+            levels = dict(levels)
+        else:
+            list_key = abstractNum.abstractNumId
+            levels = {lvl.ilvl: _Level(lvl) for lvl in abstractNum.lvl_lst}
+
+        start_overridden_ilvls = []
+        for lvlOverride in num.lvlOverride_lst:
+            ilvl = lvlOverride.ilvl
+            if lvlOverride.lvl is not None:
+                levels[ilvl] = _Level(lvlOverride.lvl)
+            if lvlOverride.startOverride is not None and ilvl in levels:
+                levels[ilvl] = levels[ilvl].restarting_at(
+                    lvlOverride.startOverride.val
+                )
+                start_overridden_ilvls.append(ilvl)
+        return list_key, levels, start_overridden_ilvls
+
+    def _style_numPr_vals(self, style_id):
+        """Return (numId, ilvl) pair inherited from the paragraph style *style_id*.
+
+        The style hierarchy is followed through `w:basedOn` until a style having
+        numbering properties is found. The default paragraph style is used when
+        *style_id* is |None|. Either value is |None| when not specified.
+        """
+        try:
+            return self._style_numPrs[style_id]
+        except KeyError:
+            pass
+
+        styles = self._styles
+        style = (
+            styles.default_for(WD_STYLE_TYPE.PARAGRAPH)
+            if style_id is None
+            else styles.get_by_id(style_id)
+        )
+        numId = ilvl = None
+        visited_styles = set()
+        while style is not None and style not in visited_styles:
+            visited_styles.add(style)
+            numPr = None if style.pPr is None else style.pPr.numPr
+            if numPr is not None and numPr.numId is not None:
+                numId = numPr.numId.val
+                ilvl = None if numPr.ilvl is None else numPr.ilvl.val
+                break
+            style = style.base_style
+
+        numPr_vals = self._style_numPrs[style_id] = numId, ilvl
+        return numPr_vals
+
+
+class _Level(object):
+    """Numbering format of one level of a list, as resolved from a `w:lvl` element."""
+
+    def __init__(self, lvl):
+        super(_Level, self).__init__()
+        self.start = lvl.start_val
+        self.num_fmt = lvl.numFmt_val
+        self.text = lvl.lvlText_val
+        self.is_legal = lvl.isLgl_val
+        self.style_id = lvl.pStyle_val
+        restart = lvl.lvlRestart_val
+        # ---by default a level restarts after any level above it is used---
+        self.restart = lvl.ilvl if restart is None else restart
+
+    def restarting_at(self, start):
+        """Return a copy of this level having *start* as its starting value."""
+        level = copy(self)
+        level.start = start
+        return level
+
+
+_LVL_TEXT_REF = re.compile(r"%([1-9])")
+
+_ROMAN_NUMERALS = (
+    (1000, "m"), (900, "cm"), (500, "d"), (400, "cd"), (100, "c"), (90, "xc"),
+    (50, "l"), (40, "xl"), (10, "x"), (9, "ix"), (5, "v"), (4, "iv"), (1, "i"),
+)
+
+
+def _format_number(value, num_fmt):
+    """Return str rendering of int *value* in number format *num_fmt*.
+
+    Formats not listed here, such as 'ordinalText' and the East Asian formats, render as
+    decimal numbers.
+    """
+    if num_fmt in ("none", "bullet"):
+        return ""
+    if num_fmt in ("lowerLetter", "upperLetter") and value > 0:
+        # ---Word repeats the letter past 'z': 'aa', 'bb', ...---
+        letter = chr(ord("a") + (value - 1) % 26) * ((value - 1) // 26 + 1)
+        return letter if num_fmt == "lowerLetter" else letter.upper()
+    if num_fmt in ("lowerRoman", "upperRoman") and value > 0:
+        numerals = []
+        for amount, numeral in _ROMAN_NUMERALS:
+            count, value = divmod(value, amount)
+            numerals.append(numeral * count)
+        roman = "".join(numerals)
+        return roman if num_fmt == "lowerRoman" else roman.upper()
+    if num_fmt == "decimalZero" and 0 <= value < 10:
+        return "0%d" % value
+    return "%d" % value
@@ -0,0 +1,95 @@
+# encoding: utf-8
+
+"""Hooks reporting the time spent in each phase of opening and saving a package.
+
+A hook is a callable taking one |PhaseEvent|. It is called once each time a phase
+completes, like parsing one XML part or writing the whole package::
+
+    def on_phase(event):
+        print(event.phase, event.duration, event.details)
+
+    docx.opc.instrument.add_hook(on_phase)
+
+Phases reported, and the entries of `details` for each, are:
+
+* ``"package.open"``: ``part_count``, timing the whole of reading a package.
+* ``"package.unmarshal"``: ``part_count``, timing construction of the parts and
+  relationships from the package items read.
+* ``"part.parse"``: ``partname``, ``size`` in bytes and ``element_count``, for
+  each XML part parsed.
+* ``"part.serialize"``: ``partname`` and ``size`` in bytes, for each part written.
+* ``"package.write"``: ``part_count``, timing the whole of writing a package.
+* ``"image.add"``: ``size`` in bytes and ``is_new``, False when a matching image
+  was already present.
+
+When no hook is registered, the only cost at each phase is a check of an empty
+list; no clock is read and no details are gathered. A hook is called on the
+thread doing the work and should return quickly; an exception it raises is not
+caught.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from timeit import default_timer
+
+_hooks = []
+
+
+def add_hook(hook):
+    """Register *hook* to be called with a |PhaseEvent| as each phase completes."""
+    if hook not in _hooks:
+        _hooks.append(hook)
+
+
+def remove_hook(hook):
+    """Stop calling *hook*. Raises |ValueError| if *hook* is not registered."""
+    _hooks.remove(hook)
+
+
+def emit(phase, started, **details):
+    """Call each hook with a |PhaseEvent| for *phase*, begun at time *started*.
+
+    *started* is the value `start()` returned when the phase began.
+    """
+    event = PhaseEvent(phase, default_timer() - started, details)
+    for hook in list(_hooks):
+        hook(event)
+
+
+def start():
+    """Return current time for a phase beginning, or |None| when no hook is set.
+
+    Callers skip the call to `emit()`, and gathering its details, when this returns
+    |None|.
+    """
+    if not _hooks:
+        return None
+    return default_timer()
+
+
+class PhaseEvent(object):
+    """Value object describing one completed phase of opening or saving a package."""
+
+    def __init__(self, phase, duration, details):
+        super(PhaseEvent, self).__init__()
+        self._phase = phase
+        self._duration = duration
+        self._details = details
+
+    def __repr__(self):
+        return "PhaseEvent(%r, %.6f, %r)" % (self._phase, self._duration, self._details)
+
+    @property
+    def details(self):
+        """dict of measurements particular to the phase, like `partname` and `size`."""
+        return self._details
+
+    @property
+    def duration(self):
+        """Wall-clock time the phase took, in seconds, as a float."""
+        return self._duration
+
+    @property
+    def phase(self):
+        """Name of the phase, like ``"part.parse"``."""
+        return self._phase
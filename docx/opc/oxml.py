@@ -11,13 +11,16 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 from lxml import etree
 
+from ..oxml import _OxmlParsers
 from .constants import NAMESPACE as NS, RELATIONSHIP_TARGET_MODE as RTM
 
 
 # configure XML parser
 element_class_lookup = etree.ElementNamespaceClassLookup()
-oxml_parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
-oxml_parser.set_element_class_lookup(element_class_lookup)
+
+# ---parser of each thread, so packages can be read in several threads at once---
+_oxml_parsers = _OxmlParsers(element_class_lookup)
+oxml_parser = _oxml_parsers.parser
 
 nsmap = {
     'ct': NS.OPC_CONTENT_TYPES,
@@ -34,7 +37,7 @@ def parse_xml(text):
     """
     ``etree.fromstring()`` replacement that uses oxml parser
     """
-    return etree.fromstring(text, oxml_parser)
+    return etree.fromstring(text, _oxml_parsers.parser)
 
 
 def qn(tag):
@@ -4,9 +4,10 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from docx.opc import instrument
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.packuri import PACKAGE_URI, PackURI
-from docx.opc.part import PartFactory
+from docx.opc.part import PartFactory, XmlPart
 from docx.opc.parts.coreprops import CorePropertiesPart
 from docx.opc.pkgreader import PackageReader
 from docx.opc.pkgwriter import PackageWriter
@@ -23,6 +24,47 @@ class OpcPackage(object):
 
     def __init__(self):
         super(OpcPackage, self).__init__()
+        self._partname_counters = {}
+        self._allocated_partnames = set()
+
+    def __reduce__(self):
+        """
+        Support pickling, as the serialized XML or binary content of each
+        part, along with the relationships between them. The serialized XML
+        cached by a part since it last changed is reused. The XML of each
+        part of the unpickled package is parsed only when first needed.
+        """
+        parts = self.parts
+        for part in parts:
+            part.before_marshal()
+        part_idxs = dict((part, idx) for idx, part in enumerate(parts))
+
+        def rel_states(rels):
+            return [
+                (
+                    rel.rId,
+                    rel.reltype,
+                    rel.target_ref if rel.is_external else part_idxs[rel.target_part],
+                    rel.is_external,
+                )
+                for rel in rels.values()
+            ]
+
+        part_states = []
+        for part in parts:
+            blob = part.blob
+            if isinstance(blob, memoryview):
+                blob = blob.tobytes()
+            part_states.append(
+                (
+                    type(part),
+                    str(part.partname),
+                    part.content_type,
+                    blob,
+                    rel_states(part.rels),
+                )
+            )
+        return _unpickle_package, (type(self), part_states, rel_states(self.rels))
 
     def after_unmarshal(self):
         """
@@ -41,6 +83,16 @@ class OpcPackage(object):
         """
         return self._core_properties_part.core_properties
 
+    def drop_caches(self):
+        """
+        Discard the values each part holds only to avoid computing them
+        again, like parsed image headers and serialized XML, to reduce the
+        memory held by this package. Each is rebuilt when next needed.
+        """
+        for part in self.iter_parts():
+            part.drop_caches()
+        self.reset_partname_index()
+
     def iter_rels(self):
         """
         Generate exactly one reference to each relationship in the package by
@@ -93,7 +145,10 @@ class OpcPackage(object):
         methods exist for adding a new relationship to the package during
         processing.
         """
-        return self.rels.add_relationship(reltype, target, rId, is_external)
+        rel = self.rels.add_relationship(reltype, target, rId, is_external)
+        if not is_external:
+            self.note_related_part(target)
+        return rel
 
     @property
     def main_document_part(self):
@@ -105,6 +160,14 @@ class OpcPackage(object):
         """
         return self.part_related_by(RT.OFFICE_DOCUMENT)
 
+    def memory_report(self):
+        """
+        Return a list of |PartMemoryUsage| objects, one for each part in this
+        package, describing the blob, element tree and cached values each
+        part holds.
+        """
+        return [part.memory_usage() for part in self.iter_parts()]
+
     def next_partname(self, template):
         """Return a |PackURI| instance representing partname matching *template*.
 
@@ -112,12 +175,32 @@ class OpcPackage(object):
         from other parts of its type. *template* is a printf (%)-style template string
         containing a single replacement item, a '%d' to be used to insert the integer
         portion of the partname. Example: "/word/header%d.xml"
+
+        Parts are only walked on the first call for a given *template*, to find the
+        suffixes already taken. Later calls continue from a per-template counter, so a
+        partname allocated here is never handed out twice, even when its part has since
+        been dropped. The parts are walked again after `reset_partname_index()`, which
+        is called when a part not named here is related or a part is renamed.
+        """
+        partnames, n = self._partname_counters.get(template) or (
+            {part.partname for part in self.iter_parts()} | self._allocated_partnames,
+            1,
+        )
+        while template % n in partnames:
+            n += 1
+        self._partname_counters[template] = (partnames, n + 1)
+        partname = PackURI(template % n)
+        self._allocated_partnames.add(partname)
+        return partname
+
+    def note_related_part(self, part):
+        """Called when a relationship to *part* is newly added within this package.
+
+        The partnames found by `next_partname()` are discarded unless *part* was named
+        by it, as the part may bring partnames not yet seen into the package.
         """
-        partnames = {part.partname for part in self.iter_parts()}
-        for n in range(1, len(partnames) + 2):
-            candidate_partname = template % n
-            if candidate_partname not in partnames:
-                return PackURI(candidate_partname)
+        if part.partname not in self._allocated_partnames:
+            self.reset_partname_index()
 
     @classmethod
     def open(cls, pkg_file):
@@ -125,9 +208,14 @@ class OpcPackage(object):
         Return an |OpcPackage| instance loaded with the contents of
         *pkg_file*.
         """
+        started = instrument.start()
         pkg_reader = PackageReader.from_file(pkg_file)
         package = cls()
         Unmarshaller.unmarshal(pkg_reader, package, PartFactory)
+        if started is not None:
+            instrument.emit(
+                "package.open", started, part_count=len(list(package.iter_parts()))
+            )
         return package
 
     def part_related_by(self, reltype):
@@ -151,7 +239,11 @@ class OpcPackage(object):
         Return rId key of relationship to *part*, from the existing
         relationship if there is one, otherwise a newly created one.
         """
-        rel = self.rels.get_or_add(reltype, part)
+        rels = self.rels
+        rel_count = len(rels)
+        rel = rels.get_or_add(reltype, part)
+        if len(rels) > rel_count:
+            self.note_related_part(part)
         return rel.rId
 
     @lazyproperty
@@ -162,6 +254,10 @@ class OpcPackage(object):
         """
         return Relationships(PACKAGE_URI.baseURI)
 
+    def reset_partname_index(self):
+        """Discard the partnames found by `next_partname()`, to be found again."""
+        self._partname_counters = {}
+
     def save(self, pkg_file):
         """
         Save this package to *pkg_file*, where *file* can be either a path to
@@ -185,6 +281,32 @@ class OpcPackage(object):
             return core_properties_part
 
 
+def _unpickle_package(package_cls, part_states, pkg_rel_states):
+    """
+    Return a *package_cls* package rebuilt from the state produced by
+    `OpcPackage.__reduce__()`. Relationship targets within the package are
+    recorded as indexes into *part_states*.
+    """
+    package = package_cls()
+    parts = []
+    for part_cls, partname, content_type, blob, _ in part_states:
+        load = part_cls.load_lazily if issubclass(part_cls, XmlPart) else part_cls.load
+        parts.append(load(PackURI(partname), content_type, blob, package))
+
+    def load_rels(source, rel_states):
+        for rId, reltype, target, is_external in rel_states:
+            target = target if is_external else parts[target]
+            source.load_rel(reltype, target, rId, is_external)
+
+    for part, part_state in zip(parts, part_states):
+        load_rels(part, part_state[4])
+    load_rels(package, pkg_rel_states)
+    for part in parts:
+        part.after_unmarshal()
+    package.after_unmarshal()
+    return package
+
+
 class Unmarshaller(object):
     """Hosts static methods for unmarshalling a package from a |PackageReader|."""
 
@@ -195,6 +317,7 @@ class Unmarshaller(object):
         contents of *pkg_reader*, delegating construction of each part to
         *part_factory*. Package relationships are added to *pkg*.
         """
+        started = instrument.start()
         parts = Unmarshaller._unmarshal_parts(
             pkg_reader, package, part_factory
         )
@@ -202,6 +325,8 @@ class Unmarshaller(object):
         for part in parts.values():
             part.after_unmarshal()
         package.after_unmarshal()
+        if started is not None:
+            instrument.emit("package.unmarshal", started, part_count=len(parts))
 
     @staticmethod
     def _unmarshal_parts(pkg_reader, package, part_factory):
@@ -7,20 +7,36 @@ such as PACKAGE_URI.
 
 import posixpath
 import re
+from weakref import WeakValueDictionary
+
+from .shared import lazyproperty
 
 
 class PackURI(str):
     """
     Provides access to pack URI components such as the baseURI and the
     filename slice. Behaves as |str| otherwise.
+
+    Instances are interned, so all pack URIs having the same value in use at
+    a time are the same object. Each component is computed once, when first
+    accessed, as is each relative reference, so the path arithmetic for
+    a partname is not repeated for every relationship targeting it.
     """
     _filename_re = re.compile('([a-zA-Z]+)([1-9][0-9]*)?')
+    _interned = WeakValueDictionary()
 
     def __new__(cls, pack_uri_str):
+        pack_uri = cls._interned.get(pack_uri_str)
+        if pack_uri is not None:
+            return pack_uri
         if not pack_uri_str[0] == '/':
             tmpl = "PackURI must begin with slash, got '%s'"
             raise ValueError(tmpl % pack_uri_str)
-        return str.__new__(cls, pack_uri_str)
+        pack_uri = str.__new__(cls, pack_uri_str)
+        pack_uri._relative_refs = {}
+        # ---keyed by a plain str, which holds no reference to the instance---
+        cls._interned[str(pack_uri_str)] = pack_uri
+        return pack_uri
 
     @staticmethod
     def from_rel_ref(baseURI, relative_ref):
@@ -32,7 +48,7 @@ class PackURI(str):
         abs_uri = posixpath.abspath(joined_uri)
         return PackURI(abs_uri)
 
-    @property
+    @lazyproperty
     def baseURI(self):
         """
         The base URI of this pack URI, the directory portion, roughly
@@ -41,7 +57,7 @@ class PackURI(str):
         """
         return posixpath.split(self)[0]
 
-    @property
+    @lazyproperty
     def ext(self):
         """
         The extension portion of this pack URI, e.g. ``'xml'`` for
@@ -51,7 +67,7 @@ class PackURI(str):
         raw_ext = posixpath.splitext(self)[1]
         return raw_ext[1:] if raw_ext.startswith('.') else raw_ext
 
-    @property
+    @lazyproperty
     def filename(self):
         """
         The "filename" portion of this pack URI, e.g. ``'slide1.xml'`` for
@@ -60,7 +76,7 @@ class PackURI(str):
         """
         return posixpath.split(self)[1]
 
-    @property
+    @lazyproperty
     def idx(self):
         """
         Return partname index as integer for tuple partname or None for
@@ -78,7 +94,7 @@ class PackURI(str):
             return int(match.group(2))
         return None
 
-    @property
+    @lazyproperty
     def membername(self):
         """
         The pack URI with the leading slash stripped off, the form used as
@@ -93,15 +109,20 @@ class PackURI(str):
         *baseURI*. E.g. PackURI('/ppt/slideLayouts/slideLayout1.xml') would
         return '../slideLayouts/slideLayout1.xml' for baseURI '/ppt/slides'.
         """
+        try:
+            return self._relative_refs[baseURI]
+        except KeyError:
+            pass
         # workaround for posixpath bug in 2.6, doesn't generate correct
         # relative path when *start* (second) parameter is root ('/')
         if baseURI == '/':
             relpath = self[1:]
         else:
             relpath = posixpath.relpath(self, baseURI)
+        self._relative_refs[baseURI] = relpath
         return relpath
 
-    @property
+    @lazyproperty
     def rels_uri(self):
         """
         The pack URI of the .rels part corresponding to the current pack URI.
@@ -8,7 +8,8 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
-from .compat import cls_method_fn
+from . import instrument
+from .compat import cls_method_fn, is_string
 from .oxml import serialize_part_xml
 from ..oxml import parse_xml
 from .packuri import PackURI
@@ -65,6 +66,15 @@ class Part(object):
         """
         return self._content_type
 
+    def drop_caches(self):
+        """
+        Discard the values this part holds only to avoid computing them
+        again, like parsed image headers or serialized XML. Each is rebuilt
+        when next needed. Intended to be extended by subclasses holding such
+        values.
+        """
+        pass
+
     def drop_rel(self, rId):
         """
         Remove the relationship identified by *rId* if its reference count
@@ -87,7 +97,22 @@ class Part(object):
         methods exist for adding a new relationship to a part when
         manipulating a part.
         """
-        return self.rels.add_relationship(reltype, target, rId, is_external)
+        rel = self.rels.add_relationship(reltype, target, rId, is_external)
+        if not is_external and self._package is not None:
+            self._package.note_related_part(target)
+        return rel
+
+    def memory_usage(self):
+        """
+        Return a |PartMemoryUsage| object describing the memory held by this
+        part.
+        """
+        return PartMemoryUsage(
+            self._partname,
+            self._content_type,
+            0 if self._blob is None else len(self._blob),
+            self._cache_names,
+        )
 
     @property
     def package(self):
@@ -110,6 +135,8 @@ class Part(object):
             tmpl = "partname must be instance of PackURI, got '%s'"
             raise TypeError(tmpl % type(partname).__name__)
         self._partname = partname
+        if self._package is not None:
+            self._package.reset_partname_index()
 
     def part_related_by(self, reltype):
         """
@@ -127,9 +154,12 @@ class Part(object):
         """
         if is_external:
             return self.rels.get_or_add_ext_rel(reltype, target)
-        else:
-            rel = self.rels.get_or_add(reltype, target)
-            return rel.rId
+        rels = self.rels
+        rel_count = len(rels)
+        rel = rels.get_or_add(reltype, target)
+        if len(rels) > rel_count and self._package is not None:
+            self._package.note_related_part(target)
+        return rel.rId
 
     @property
     def related_parts(self):
@@ -155,6 +185,15 @@ class Part(object):
         rel = self.rels[rId]
         return rel.target_ref
 
+    @property
+    def _cache_names(self):
+        """
+        Tuple of names of the rebuildable values this part currently holds,
+        those `drop_caches()` discards. Intended to be extended by
+        subclasses holding such values.
+        """
+        return ()
+
     def _rel_ref_count(self, rId):
         """
         Return the count of references in this part's XML to the relationship
@@ -176,6 +215,10 @@ class PartFactory(object):
     defined in ``PartFactory.part_type_for``. If no class is returned from
     either of these, the class contained in ``PartFactory.default_part_type``
     is used to construct the part, which is by default ``opc.package.Part``.
+
+    These settings are meant to be made once, at import time; they are only
+    read while a package loads, so packages can be loaded in several threads
+    at once.
     """
     part_class_selector = None
     part_type_for = {}
@@ -208,29 +251,113 @@ class XmlPart(Part):
     them. Provides additional methods to the |Part| base class that take care
     of parsing and reserializing the XML payload and managing relationships
     to other parts.
+
+    The serialized XML is kept and reused by later saves for as long as the
+    element tree cannot have changed, that is until the tree is handed out
+    through the `element` property, after which any proxy object could
+    change it, or until `mark_dirty()` is called. A part loaded and never
+    changed, like the styles of a document being generated, is so serialized
+    only once however many times the document is saved.
     """
     def __init__(self, partname, content_type, element, package):
         super(XmlPart, self).__init__(
             partname, content_type, package=package
         )
         self._element = element
+        self._element_is_shared = False
+
+    def __getattr__(self, name):
+        """
+        Parse the XML of a part made by `load_lazily()` when its element is
+        first needed. Only called for an attribute not otherwise found.
+        """
+        if name != '_element':
+            raise AttributeError(
+                "'%s' object has no attribute '%s'" % (type(self).__name__, name)
+            )
+        element = self._element = _parse_part_xml(self._partname, self._blob)
+        return element
 
     @property
     def blob(self):
-        return serialize_part_xml(self._element)
+        """
+        The XML of this part serialized as bytes, produced again only when
+        the element tree may have changed since it was last serialized.
+        """
+        blob = self._blob
+        if blob is None:
+            blob = serialize_part_xml(self._element)
+            if not self._element_is_shared:
+                self._blob = blob
+        return blob
 
     @property
     def element(self):
         """
-        The root XML element of this XML part.
+        The root XML element of this XML part. The element tree can be
+        changed from then on without this part knowing, so the XML of this
+        part is serialized again for each later save.
+        """
+        element = self._element
+        self._element_is_shared = True
+        self._blob = None
+        return element
+
+    def mark_dirty(self):
+        """
+        Discard the serialized XML of this part, so it is serialized again
+        when next needed. Call this after changing the element tree by means
+        other than the `element` property, such as through `_element` in
+        a subclass.
+        """
+        if self._is_parsed:
+            self._blob = None
+
+    def drop_caches(self):
+        """
+        Discard the serialized XML of this part along with other values held
+        to avoid computing them again. The XML of a part not yet parsed is
+        kept, being its only copy.
         """
-        return self._element
+        super(XmlPart, self).drop_caches()
+        if self._is_parsed:
+            self._blob = None
 
     @classmethod
     def load(cls, partname, content_type, blob, package):
-        element = parse_xml(blob)
+        element = _parse_part_xml(partname, blob)
         return cls(partname, content_type, element, package)
 
+    @classmethod
+    def load_lazily(cls, partname, content_type, blob, package):
+        """
+        Return a part of this class whose XML is parsed from *blob* only
+        when its element is first needed. Until then, *blob* is also the
+        serialized XML of the part, so saving it costs no serialization.
+        """
+        part = cls.__new__(cls)
+        Part.__init__(part, partname, content_type, blob, package)
+        part._element_is_shared = False
+        return part
+
+    def memory_usage(self):
+        """
+        Return a |PartMemoryUsage| object describing the memory held by this
+        part, including the size of its element tree. Takes time
+        proportional to the number of elements.
+        """
+        element_count = xml_size = None
+        if self._is_parsed:
+            element_count, xml_size = _measure_xml(self._element)
+        return PartMemoryUsage(
+            self._partname,
+            self._content_type,
+            0 if self._blob is None else len(self._blob),
+            self._cache_names,
+            element_count,
+            xml_size,
+        )
+
     @property
     def part(self):
         """
@@ -239,3 +366,134 @@ class XmlPart(Part):
         chain of delegation ends here for child objects.
         """
         return self
+
+    @property
+    def _cache_names(self):
+        """
+        Tuple of names of the rebuildable values this part currently holds.
+        """
+        names = super(XmlPart, self)._cache_names
+        if self._blob is not None and self._is_parsed:
+            names += ("blob",)
+        return names
+
+    @property
+    def _is_parsed(self):
+        """
+        True if the element tree of this part exists, False for a part made
+        by `load_lazily()` and not yet parsed.
+        """
+        return '_element' in self.__dict__
+
+
+class PartMemoryUsage(object):
+    """
+    Value object describing the memory held by a part, as reported by
+    `Part.memory_usage()`.
+    """
+    def __init__(
+        self, partname, content_type, blob_size, cache_names,
+        element_count=None, xml_size=None
+    ):
+        super(PartMemoryUsage, self).__init__()
+        self._partname = partname
+        self._content_type = content_type
+        self._blob_size = blob_size
+        self._cache_names = cache_names
+        self._element_count = element_count
+        self._xml_size = xml_size
+
+    def __repr__(self):
+        return (
+            "PartMemoryUsage(%r, blob_size=%d, element_count=%r, xml_size=%r, "
+            "cache_names=%r)" % (
+                str(self._partname), self._blob_size, self._element_count,
+                self._xml_size, self._cache_names
+            )
+        )
+
+    @property
+    def blob_size(self):
+        """
+        Number of bytes held as the blob of the part, the serialized XML
+        cached by an XML part or the content of a binary part like an image.
+        Zero when no blob is held.
+        """
+        return self._blob_size
+
+    @property
+    def cache_names(self):
+        """
+        Tuple of names of the rebuildable values held by the part, like
+        ``"blob"`` or ``"image"``, those `Part.drop_caches()` discards.
+        """
+        return self._cache_names
+
+    @property
+    def content_type(self):
+        """
+        Content type of the part.
+        """
+        return self._content_type
+
+    @property
+    def element_count(self):
+        """
+        Number of nodes in the element tree of an XML part, |None| for
+        a binary part or an XML part not yet parsed.
+        """
+        return self._element_count
+
+    @property
+    def partname(self):
+        """
+        |PackURI| partname of the part.
+        """
+        return self._partname
+
+    @property
+    def xml_size(self):
+        """
+        Estimate of the size, in characters, of the XML of an XML part when
+        serialized, made without serializing it. |None| for a binary part
+        or an XML part not yet parsed.
+        """
+        return self._xml_size
+
+
+def _parse_part_xml(partname, blob):
+    """
+    Return root element parsed from *blob*, the XML of part *partname*,
+    reporting the ``"part.parse"`` phase to instrumentation hooks.
+    """
+    started = instrument.start()
+    element = parse_xml(blob)
+    if started is not None:
+        instrument.emit(
+            "part.parse",
+            started,
+            partname=partname,
+            size=len(blob),
+            element_count=sum(1 for _ in element.iter()),
+        )
+    return element
+
+
+def _measure_xml(element):
+    """
+    Return (element_count, xml_size) pair for the tree rooted at *element*,
+    where *xml_size* estimates the length of its serialized XML, allowing
+    a two-character namespace prefix for each tag and attribute name.
+    """
+    element_count = xml_size = 0
+    for elm in element.iter():
+        element_count += 1
+        tag = elm.tag
+        if is_string(tag):
+            # ---start and end tags, like `<w:p>` and `</w:p>`---
+            xml_size += 2 * len(tag.rpartition("}")[2]) + 9
+            for name, value in elm.attrib.items():
+                # ---like ` w:val="x"`---
+                xml_size += len(name.rpartition("}")[2]) + len(value) + 6
+        xml_size += len(elm.text or "") + len(elm.tail or "")
+    return element_count, xml_size
@@ -6,9 +6,11 @@ Provides a general interface to a *physical* OPC package, such as a zip file.
 
 from __future__ import absolute_import
 
+import mmap
 import os
+import struct
 
-from zipfile import ZipFile, is_zipfile, ZIP_DEFLATED
+from zipfile import ZipFile, is_zipfile, ZIP_DEFLATED, ZIP_STORED
 
 from .compat import is_string
 from .exceptions import PackageNotFoundError
@@ -30,7 +32,7 @@ class PhysPkgReader(object):
                 raise PackageNotFoundError(
                     "Package not found at '%s'" % pkg_file
                 )
-        else:  # assume it's a stream and pass it to Zip reader to sort out
+        else:  # assume it's a stream or buffer, let Zip reader sort it out
             reader_cls = _ZipPkgReader
 
         return super(PhysPkgReader, cls).__new__(reader_cls)
@@ -95,17 +97,33 @@ class _DirPkgReader(PhysPkgReader):
 class _ZipPkgReader(PhysPkgReader):
     """
     Implements |PhysPkgReader| interface for a zip file OPC package.
+
+    *pkg_file* can also be a buffer holding the zip file, such as a |bytes|,
+    |memoryview| or :class:`mmap.mmap` object, which is read in place rather
+    than copied. The blob of a member stored without compression, as images
+    commonly are, is then a |memoryview| slice of that buffer.
     """
     def __init__(self, pkg_file):
         super(_ZipPkgReader, self).__init__()
+        if isinstance(pkg_file, (bytes, bytearray, memoryview, mmap.mmap)):
+            self._buffer = memoryview(pkg_file)
+            pkg_file = _BufferStream(self._buffer)
+        else:
+            self._buffer = None
         self._zipf = ZipFile(pkg_file, 'r')
 
     def blob_for(self, pack_uri):
         """
-        Return blob corresponding to *pack_uri*. Raises |ValueError| if no
+        Return blob corresponding to *pack_uri*. Raises |KeyError| if no
         matching member is present in zip archive.
         """
-        return self._zipf.read(pack_uri.membername)
+        membername = pack_uri.membername
+        if self._buffer is not None:
+            zip_info = self._zipf.getinfo(membername)
+            # ---an encrypted member (flag bit 0) must go through ZipFile---
+            if zip_info.compress_type == ZIP_STORED and not zip_info.flag_bits & 1:
+                return self._stored_blob(zip_info)
+        return self._zipf.read(membername)
 
     def close(self):
         """
@@ -131,6 +149,52 @@ class _ZipPkgReader(PhysPkgReader):
             rels_xml = None
         return rels_xml
 
+    def _stored_blob(self, zip_info):
+        """
+        Return |memoryview| slice of the buffer holding the data of the
+        uncompressed member described by *zip_info*. The data follows the
+        30-byte local file header and the filename and extra field, whose
+        lengths are read from that header.
+        """
+        header_offset = zip_info.header_offset
+        filename_len, extra_len = struct.unpack(
+            '<HH', self._buffer[header_offset + 26:header_offset + 30]
+        )
+        start = header_offset + 30 + filename_len + extra_len
+        return self._buffer[start:start + zip_info.compress_size]
+
+
+class _BufferStream(object):
+    """
+    Minimal read-only file-like object over a buffer, so a zip archive held in
+    memory can be read without first copying it into a |BytesIO| object.
+    """
+    def __init__(self, buffer):
+        super(_BufferStream, self).__init__()
+        self._buffer = buffer
+        self._position = 0
+
+    def read(self, n=-1):
+        start = self._position
+        end = len(self._buffer) if n is None or n < 0 else start + n
+        self._position = min(end, len(self._buffer))
+        return self._buffer[start:self._position].tobytes()
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        base = {
+            os.SEEK_SET: 0,
+            os.SEEK_CUR: self._position,
+            os.SEEK_END: len(self._buffer),
+        }[whence]
+        self._position = max(base + offset, 0)
+        return self._position
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
 
 class _ZipPkgWriter(PhysPkgWriter):
     """
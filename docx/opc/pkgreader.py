@@ -38,6 +38,34 @@ class PackageReader(object):
         phys_reader.close()
         return PackageReader(content_types, pkg_srels, sparts)
 
+    @staticmethod
+    def read_package_parts(pkg_file, reltypes):
+        """
+        Return a dict mapping each of *reltypes* to a 3-tuple `(partname,
+        content_type, blob)` for the part the package relates to by that
+        relationship type. Only those parts are read from *pkg_file*, so the
+        other parts, like images, are neither read nor decompressed.
+        A relationship type not found in the package has no entry.
+        """
+        phys_reader = PhysPkgReader(pkg_file)
+        try:
+            content_types = _ContentTypeMap.from_xml(
+                phys_reader.content_types_xml
+            )
+            parts = {}
+            for srel in PackageReader._srels_for(phys_reader, PACKAGE_URI):
+                if srel.is_external or srel.reltype not in reltypes:
+                    continue
+                partname = srel.target_partname
+                parts[srel.reltype] = (
+                    partname,
+                    content_types[partname],
+                    phys_reader.blob_for(partname),
+                )
+            return parts
+        finally:
+            phys_reader.close()
+
     def iter_sparts(self):
         """
         Generate a 4-tuple `(partname, content_type, reltype, blob)` for each
@@ -7,6 +7,7 @@ Convention (OPC) package, essentially an implementation of OpcPackage.save()
 
 from __future__ import absolute_import
 
+from . import instrument
 from .constants import CONTENT_TYPE as CT
 from .oxml import CT_Types, serialize_part_xml
 from .packuri import CONTENT_TYPES_URI, PACKAGE_URI
@@ -29,11 +30,14 @@ class PackageWriter(object):
         *pkg_rels* and *parts* and a content types stream based on the
         content types of the parts.
         """
+        started = instrument.start()
         phys_writer = PhysPkgWriter(pkg_file)
         PackageWriter._write_content_types_stream(phys_writer, parts)
         PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
         PackageWriter._write_parts(phys_writer, parts)
         phys_writer.close()
+        if started is not None:
+            instrument.emit("package.write", started, part_count=len(parts))
 
     @staticmethod
     def _write_content_types_stream(phys_writer, parts):
@@ -51,7 +55,13 @@ class PackageWriter(object):
         rels item for its relationships if and only if it has any.
         """
         for part in parts:
-            phys_writer.write(part.partname, part.blob)
+            started = instrument.start()
+            blob = part.blob
+            phys_writer.write(part.partname, blob)
+            if started is not None:
+                instrument.emit(
+                    "part.serialize", started, partname=part.partname, size=len(blob)
+                )
             if len(part._rels):
                 phys_writer.write(part.partname.rels_uri, part._rels.xml)
 
@@ -14,11 +14,38 @@ from .oxml import CT_Relationships
 class Relationships(dict):
     """
     Collection object for |_Relationship| instances, having list semantics.
+
+    Relationships are indexed by target as they are added, so finding the
+    relationship to a given target, and the next available rId, does not
+    require a search of the whole collection. This keeps adding many
+    relationships, as when content is copied between documents, linear.
     """
     def __init__(self, baseURI):
         super(Relationships, self).__init__()
         self._baseURI = baseURI
         self._target_parts_by_rId = {}
+        self._rels_by_target = {}
+        self._rId_search_start = 1
+
+    def __delitem__(self, rId):
+        rel = self[rId]
+        super(Relationships, self).__delitem__(rId)
+        self._target_parts_by_rId.pop(rId, None)
+        key = self._target_key(rel)
+        if self._rels_by_target.get(key) is rel:
+            del self._rels_by_target[key]
+            for other_rel in self.values():
+                if self._target_key(other_rel) == key:
+                    self._rels_by_target[key] = other_rel
+                    break
+        # ---the removed rId leaves a gap to be reused---
+        self._rId_search_start = 1
+
+    def __setitem__(self, rId, rel):
+        if rId in self:
+            del self[rId]
+        super(Relationships, self).__setitem__(rId, rel)
+        self._rels_by_target.setdefault(self._target_key(rel), rel)
 
     def add_relationship(self, reltype, target, rId, is_external=False):
         """
@@ -89,20 +116,7 @@ class Relationships(dict):
         Return relationship of matching *reltype*, *target*, and
         *is_external* from collection, or None if not found.
         """
-        def matches(rel, reltype, target, is_external):
-            if rel.reltype != reltype:
-                return False
-            if rel.is_external != is_external:
-                return False
-            rel_target = rel.target_ref if rel.is_external else rel.target_part
-            if rel_target != target:
-                return False
-            return True
-
-        for rel in self.values():
-            if matches(rel, reltype, target, is_external):
-                return rel
-        return None
+        return self._rels_by_target.get((reltype, bool(is_external), target))
 
     def _get_rel_of_type(self, reltype):
         """
@@ -125,10 +139,23 @@ class Relationships(dict):
         Next available rId in collection, starting from 'rId1' and making use
         of any gaps in numbering, e.g. 'rId2' for rIds ['rId1', 'rId3'].
         """
-        for n in range(1, len(self)+2):
-            rId_candidate = 'rId%d' % n  # like 'rId19'
-            if rId_candidate not in self:
-                return rId_candidate
+        n = self._rId_search_start
+        while 'rId%d' % n in self:  # like 'rId19'
+            n += 1
+        # ---rIds below this one are all in use until one is removed---
+        self._rId_search_start = n
+        return 'rId%d' % n
+
+    @staticmethod
+    def _target_key(rel):
+        """
+        Return (reltype, is_external, target) key of *rel* in the target
+        index, the target being the target part or, for an external
+        relationship, the target ref.
+        """
+        is_external = bool(rel.is_external)
+        target = rel.target_ref if is_external else rel.target_part
+        return rel.reltype, is_external, target
 
 
 class _Relationship(object):
@@ -7,6 +7,8 @@ corresponding to Open XML elements.
 
 from __future__ import absolute_import
 
+import threading
+
 from lxml import etree
 
 from .ns import NamespacePrefixedTag, nsmap
@@ -14,8 +16,27 @@ from .ns import NamespacePrefixedTag, nsmap
 
 # configure XML parser
 element_class_lookup = etree.ElementNamespaceClassLookup()
-oxml_parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
-oxml_parser.set_element_class_lookup(element_class_lookup)
+
+
+class _OxmlParsers(threading.local):
+    """
+    Holds the parser of each thread, using *element_class_lookup*. An lxml
+    parser is not reentrant, so one shared parser would allow only one thread
+    at a time to parse. Each thread instead gets its own parser on first use,
+    all sharing the one element class lookup.
+    """
+    def __init__(self, element_class_lookup):
+        super(_OxmlParsers, self).__init__()
+        self.parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
+        self.parser.set_element_class_lookup(element_class_lookup)
+
+
+_oxml_parsers = _OxmlParsers(element_class_lookup)
+
+# ---parser of the thread importing this module, retained for code using it
+#    directly; `parse_xml()` and `OxmlElement()` use the parser of the calling
+#    thread---
+oxml_parser = _oxml_parsers.parser
 
 
 def parse_xml(xml):
@@ -23,9 +44,9 @@ def parse_xml(xml):
     Return root lxml element obtained by parsing XML character string in
     *xml*, which can be either a Python 2.x string or unicode. The custom
     parser is used, so custom element classes are produced for elements in
-    *xml* that have them.
+    *xml* that have them. Safe to call from several threads at once.
     """
-    root_element = etree.fromstring(xml, oxml_parser)
+    root_element = etree.fromstring(xml, _oxml_parsers.parser)
     return root_element
 
 
@@ -55,7 +76,7 @@ def OxmlElement(nsptag_str, attrs=None, nsdecls=None):
     nsptag = NamespacePrefixedTag(nsptag_str)
     if nsdecls is None:
         nsdecls = nsptag.nsmap
-    return oxml_parser.makeelement(
+    return _oxml_parsers.parser.makeelement(
         nsptag.clark_name, attrib=attrs, nsmap=nsdecls
     )
 
@@ -76,13 +97,23 @@ from .document import CT_Body, CT_Document  # noqa
 register_element_cls('w:body',     CT_Body)
 register_element_cls('w:document', CT_Document)
 
-from .numbering import CT_Num, CT_Numbering, CT_NumLvl, CT_NumPr  # noqa
+from .numbering import (  # noqa
+    CT_AbstractNum, CT_Lvl, CT_LvlText, CT_Num, CT_Numbering, CT_NumLvl,
+    CT_NumPr
+)
+register_element_cls('w:abstractNum',   CT_AbstractNum)
 register_element_cls('w:abstractNumId', CT_DecimalNumber)
 register_element_cls('w:ilvl',          CT_DecimalNumber)
+register_element_cls('w:isLgl',         CT_OnOff)
+register_element_cls('w:lvl',           CT_Lvl)
 register_element_cls('w:lvlOverride',   CT_NumLvl)
+register_element_cls('w:lvlRestart',    CT_DecimalNumber)
+register_element_cls('w:lvlText',       CT_LvlText)
 register_element_cls('w:num',           CT_Num)
+register_element_cls('w:numFmt',        CT_String)
 register_element_cls('w:numId',         CT_DecimalNumber)
 register_element_cls('w:numPr',         CT_NumPr)
+register_element_cls('w:numStyleLink',  CT_String)
 register_element_cls('w:numbering',     CT_Numbering)
 register_element_cls('w:startOverride', CT_DecimalNumber)
 
@@ -6,12 +6,117 @@ Custom element classes related to the numbering part
 
 from . import OxmlElement
 from .shared import CT_DecimalNumber
-from .simpletypes import ST_DecimalNumber
+from .simpletypes import ST_DecimalNumber, ST_String
 from .xmlchemy import (
-    BaseOxmlElement, OneAndOnlyOne, RequiredAttribute, ZeroOrMore, ZeroOrOne
+    BaseOxmlElement, OneAndOnlyOne, OptionalAttribute, RequiredAttribute,
+    ZeroOrMore, ZeroOrOne
 )
 
 
+class CT_AbstractNum(BaseOxmlElement):
+    """
+    ``<w:abstractNum>`` element, an abstract numbering definition holding the
+    ``<w:lvl>`` definitions shared by each ``<w:num>`` that references it.
+    """
+    numStyleLink = ZeroOrOne('w:numStyleLink', successors=('w:lvl',))
+    lvl = ZeroOrMore('w:lvl', successors=())
+    abstractNumId = RequiredAttribute('w:abstractNumId', ST_DecimalNumber)
+
+
+class CT_Lvl(BaseOxmlElement):
+    """
+    ``<w:lvl>`` element, defining the numbering format of one level of a
+    list, such as its starting value and the text of its label.
+    """
+    _tag_seq = (
+        'w:start', 'w:numFmt', 'w:lvlRestart', 'w:pStyle', 'w:isLgl',
+        'w:suff', 'w:lvlText', 'w:lvlPicBulletId', 'w:legacy', 'w:lvlJc',
+        'w:pPr', 'w:rPr'
+    )
+    start = ZeroOrOne('w:start', successors=_tag_seq[1:])
+    numFmt = ZeroOrOne('w:numFmt', successors=_tag_seq[2:])
+    lvlRestart = ZeroOrOne('w:lvlRestart', successors=_tag_seq[3:])
+    pStyle = ZeroOrOne('w:pStyle', successors=_tag_seq[4:])
+    isLgl = ZeroOrOne('w:isLgl', successors=_tag_seq[5:])
+    lvlText = ZeroOrOne('w:lvlText', successors=_tag_seq[7:])
+    del _tag_seq
+    ilvl = RequiredAttribute('w:ilvl', ST_DecimalNumber)
+
+    @property
+    def isLgl_val(self):
+        """
+        True if the labels of this level show every level as a decimal
+        number, as in legal numbering, False otherwise.
+        """
+        isLgl = self.isLgl
+        if isLgl is None:
+            return False
+        return isLgl.val
+
+    @property
+    def lvlRestart_val(self):
+        """
+        One-based index of the level whose use restarts this level, |None|
+        when not specified. Zero means this level never restarts.
+        """
+        lvlRestart = self.lvlRestart
+        if lvlRestart is None:
+            return None
+        return lvlRestart.val
+
+    @property
+    def lvlText_val(self):
+        """
+        Template for the label of this level, like '%1.%2.', or the empty
+        string when not specified.
+        """
+        lvlText = self.lvlText
+        if lvlText is None or lvlText.val is None:
+            return ''
+        return lvlText.val
+
+    @property
+    def numFmt_val(self):
+        """
+        Name of the number format of this level, like 'lowerRoman',
+        defaulting to 'decimal' when not specified.
+        """
+        numFmt = self.numFmt
+        if numFmt is None:
+            return 'decimal'
+        return numFmt.val
+
+    @property
+    def pStyle_val(self):
+        """
+        Style id of the paragraph style linked to this level, or |None|.
+        """
+        pStyle = self.pStyle
+        if pStyle is None:
+            return None
+        return pStyle.val
+
+    @property
+    def start_val(self):
+        """
+        Starting value of this level, defaulting to 0 when not specified.
+        Read here rather than through an element class for ``w:start``, a tag
+        also used for the start-side border and cell margin elements.
+        """
+        vals = self.xpath('./w:start/@w:val')
+        if not vals:
+            return 0
+        return ST_DecimalNumber.from_xml(vals[0])
+
+
+class CT_LvlText(BaseOxmlElement):
+    """
+    ``<w:lvlText>`` element, holding the label template of a list level in
+    its optional ``val`` attribute.
+    """
+    val = OptionalAttribute('w:val', ST_String)
+
+
 class CT_Num(BaseOxmlElement):
     """
     ``<w:num>`` element, which represents a concrete list definition
@@ -51,6 +156,7 @@ class CT_NumLvl(BaseOxmlElement):
     definition to override with settings it contains.
     """
     startOverride = ZeroOrOne('w:startOverride', successors=('w:lvl',))
+    lvl = ZeroOrOne('w:lvl', successors=())
     ilvl = RequiredAttribute('w:ilvl', ST_DecimalNumber)
 
     def add_startOverride(self, val):
@@ -94,6 +200,9 @@ class CT_Numbering(BaseOxmlElement):
     ``<w:numbering>`` element, the root element of a numbering part, i.e.
     numbering.xml
     """
+    abstractNum = ZeroOrMore(
+        'w:abstractNum', successors=('w:num', 'w:numIdMacAtCleanup')
+    )
     num = ZeroOrMore('w:num', successors=('w:numIdMacAtCleanup',))
 
     def add_num(self, abstractNum_id):
@@ -124,7 +233,7 @@ class CT_Numbering(BaseOxmlElement):
         elements.
         """
         numId_strs = self.xpath('./w:num/@w:numId')
-        num_ids = [int(numId_str) for numId_str in numId_strs]
+        num_ids = set(int(numId_str) for numId_str in numId_strs)
         for num in range(1, len(num_ids)+2):
             if num not in num_ids:
                 break
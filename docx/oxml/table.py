@@ -6,6 +6,8 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from bisect import bisect_left, bisect_right
+
 from . import parse_xml
 from ..enum.table import WD_CELL_VERTICAL_ALIGNMENT, WD_ROW_HEIGHT_RULE
 from ..exceptions import InvalidSpanError
@@ -50,13 +52,27 @@ class CT_Row(BaseOxmlElement):
                 raise ValueError('no cell on grid column %d' % idx)
         raise ValueError('index out of bounds')
 
+    def tc_spanning_grid_col(self, idx):
+        """
+        The ``<w:tc>`` element occupying grid column *idx*, whether it
+        begins at that grid column or spans it from the left, or |None| if
+        this row has fewer than *idx* + 1 grid columns.
+        """
+        grid_col = 0
+        for tc in self.tc_lst:
+            grid_col += tc.grid_span
+            if grid_col > idx:
+                return tc
+        return None
+
     @property
     def tr_idx(self):
         """
         The index of this ``<w:tr>`` element within its parent ``<w:tbl>``
-        element.
+        element. Counted in a single XPath evaluation so no proxy is created
+        for the preceding rows.
         """
-        return self.getparent().tr_lst.index(self)
+        return int(self.xpath('count(preceding-sibling::w:tr)'))
 
     @property
     def trHeight_hRule(self):
@@ -149,6 +165,18 @@ class CT_Tbl(BaseOxmlElement):
             for tc in tr.tc_lst:
                 yield tc
 
+    def merge_ranges(self, ranges):
+        """
+        Return a list containing the top-left ``<w:tc>`` element of each span
+        formed by merging the rectangular regions in *ranges*, in the order
+        given. Each item in *ranges* is a (row_idx, col_idx, row_idx_2,
+        col_idx_2) 4-tuple locating the cells at two diagonal corners of the
+        region by row index and grid column. The cell layout of this table is
+        mapped once and kept current as each merge is applied.
+        """
+        tc_grid = _TcGrid(self)
+        return [tc_grid.merge(*range_) for range_ in ranges]
+
     @classmethod
     def new_tbl(cls, rows, cols, width):
         """
@@ -255,7 +283,7 @@ class CT_TblGridCol(BaseOxmlElement):
         The index of this ``<w:gridCol>`` element within its parent
         ``<w:tblGrid>`` element.
         """
-        return self.getparent().gridCol_lst.index(self)
+        return int(self.xpath('count(preceding-sibling::w:gridCol)'))
 
 
 class CT_TblLayoutType(BaseOxmlElement):
@@ -620,30 +648,10 @@ class CT_Tc(BaseOxmlElement):
         the merged cell formed by using this tc and *other_tc* as opposite
         corner extents.
         """
-        def raise_on_inverted_L(a, b):
-            if a.top == b.top and a.bottom != b.bottom:
-                raise InvalidSpanError('requested span not rectangular')
-            if a.left == b.left and a.right != b.right:
-                raise InvalidSpanError('requested span not rectangular')
-
-        def raise_on_tee_shaped(a, b):
-            top_most, other = (a, b) if a.top < b.top else (b, a)
-            if top_most.top < other.top and top_most.bottom > other.bottom:
-                raise InvalidSpanError('requested span not rectangular')
-
-            left_most, other = (a, b) if a.left < b.left else (b, a)
-            if left_most.left < other.left and left_most.right > other.right:
-                raise InvalidSpanError('requested span not rectangular')
-
-        raise_on_inverted_L(self, other_tc)
-        raise_on_tee_shaped(self, other_tc)
-
-        top = min(self.top, other_tc.top)
-        left = min(self.left, other_tc.left)
-        bottom = max(self.bottom, other_tc.bottom)
-        right = max(self.right, other_tc.right)
-
-        return top, left, bottom - top, right - left
+        return _span_dimensions(
+            (self.top, self.left, self.bottom, self.right),
+            (other_tc.top, other_tc.left, other_tc.bottom, other_tc.right)
+        )
 
     def _span_to_width(self, grid_width, top_tc, vMerge):
         """
@@ -892,3 +900,147 @@ class CT_VMerge(BaseOxmlElement):
     ``<w:vMerge>`` element, specifying vertical merging behavior of a cell.
     """
     val = OptionalAttribute('w:val', ST_Merge, default=ST_Merge.CONTINUE)
+
+
+class _TcGrid(object):
+    """
+    Map of the ``<w:tc>`` elements in a ``<w:tbl>`` element, by row index and
+    the grid column each begins at. Built in a single pass over the table so
+    cells can be located by grid position without re-scanning the table. The
+    map is only valid while the table is modified through this object.
+    """
+    def __init__(self, tbl):
+        self._lefts, self._tcs = [], []
+        for tr in tbl.tr_lst:
+            lefts, tcs, grid_col = [], [], 0
+            for tc in tr.tc_lst:
+                lefts.append(grid_col)
+                tcs.append(tc)
+                grid_col += tc.grid_span
+            self._lefts.append(lefts)
+            self._tcs.append(tcs)
+
+    def merge(self, row_idx, col_idx, row_idx_2, col_idx_2):
+        """
+        Return the top-left ``<w:tc>`` element of a new span formed by
+        merging the rectangular region having the cells at (*row_idx*,
+        *col_idx*) and (*row_idx_2*, *col_idx_2*) as diagonal corners.
+        """
+        top, left, height, width = _span_dimensions(
+            self._extents(row_idx, col_idx),
+            self._extents(row_idx_2, col_idx_2)
+        )
+        top_tc = self._tc_at_grid_col(top, left)
+        for offset in range(height):
+            if offset > 0:
+                vMerge = ST_Merge.CONTINUE
+            else:
+                vMerge = None if height == 1 else ST_Merge.RESTART
+            self._span_to_width(top + offset, left, width, top_tc, vMerge)
+        return top_tc
+
+    def _extents(self, row_idx, col_idx):
+        """
+        Return a (top, left, bottom, right) 4-tuple specifying the extents of
+        the cell occupying grid column *col_idx* of the row at *row_idx*,
+        with the same meaning as the like-named properties of |CT_Tc|.
+        """
+        if not 0 <= row_idx < len(self._tcs):
+            raise IndexError('row index [%d] is out of range' % row_idx)
+        lefts, tcs = self._lefts[row_idx], self._tcs[row_idx]
+        idx = bisect_right(lefts, col_idx) - 1
+        if idx < 0 or col_idx >= lefts[idx] + tcs[idx].grid_span:
+            raise IndexError('column index [%d] is out of range' % col_idx)
+        tc, left = tcs[idx], lefts[idx]
+
+        top = row_idx
+        vMerge = tc.vMerge
+        while vMerge == ST_Merge.CONTINUE and top > 0:
+            tc_above = self._tc_at_grid_col(top - 1, left)
+            if tc_above is None:
+                break
+            top -= 1
+            vMerge = tc_above.vMerge
+
+        bottom = row_idx + 1
+        if tc.vMerge is not None:
+            while bottom < len(self._tcs):
+                tc_below = self._tc_at_grid_col(bottom, left)
+                if tc_below is None or tc_below.vMerge != ST_Merge.CONTINUE:
+                    break
+                bottom += 1
+
+        return top, left, bottom, left + tc.grid_span
+
+    def _span_to_width(self, row_idx, left, grid_width, top_tc, vMerge):
+        """
+        Widen the cell beginning at grid column *left* in the row at
+        *row_idx* to span *grid_width* columns, as |CT_Tc._span_to_width|
+        does, removing each swallowed cell from this map.
+        """
+        idx = self._tc_idx(row_idx, left)
+        if idx is None:
+            raise InvalidSpanError('requested span not rectangular')
+        tc = self._tcs[row_idx][idx]
+        tc._move_content_to(top_tc)
+        while tc.grid_span < grid_width:
+            tc._swallow_next_tc(grid_width, top_tc)
+            del self._lefts[row_idx][idx+1]
+            del self._tcs[row_idx][idx+1]
+        tc.vMerge = vMerge
+
+    def _tc_at_grid_col(self, row_idx, grid_col):
+        """
+        The ``<w:tc>`` element beginning at *grid_col* in the row at
+        *row_idx*, or |None| if no cell begins at that grid column.
+        """
+        idx = self._tc_idx(row_idx, grid_col)
+        if idx is None:
+            return None
+        return self._tcs[row_idx][idx]
+
+    def _tc_idx(self, row_idx, grid_col):
+        """
+        The index within its row of the ``<w:tc>`` element beginning at
+        *grid_col* in the row at *row_idx*, or |None| if no cell begins at
+        that grid column.
+        """
+        lefts = self._lefts[row_idx]
+        idx = bisect_left(lefts, grid_col)
+        if idx == len(lefts) or lefts[idx] != grid_col:
+            return None
+        return idx
+
+
+def _span_dimensions(extents, other_extents):
+    """
+    Return a (top, left, height, width) 4-tuple specifying the extents of the
+    merged cell formed by using the cells having *extents* and
+    *other_extents* as opposite corners. Each extents value is a (top, left,
+    bottom, right) 4-tuple. Raises |InvalidSpanError| if the two cells do
+    not define a rectangular region.
+    """
+    def raise_on_inverted_L(a, b):
+        if a[0] == b[0] and a[2] != b[2]:
+            raise InvalidSpanError('requested span not rectangular')
+        if a[1] == b[1] and a[3] != b[3]:
+            raise InvalidSpanError('requested span not rectangular')
+
+    def raise_on_tee_shaped(a, b):
+        top_most, other = (a, b) if a[0] < b[0] else (b, a)
+        if top_most[0] < other[0] and top_most[2] > other[2]:
+            raise InvalidSpanError('requested span not rectangular')
+
+        left_most, other = (a, b) if a[1] < b[1] else (b, a)
+        if left_most[1] < other[1] and left_most[3] > other[3]:
+            raise InvalidSpanError('requested span not rectangular')
+
+    raise_on_inverted_L(extents, other_extents)
+    raise_on_tee_shaped(extents, other_extents)
+
+    top = min(extents[0], other_extents[0])
+    left = min(extents[1], other_extents[1])
+    bottom = max(extents[2], other_extents[2])
+    right = max(extents[3], other_extents[3])
+
+    return top, left, bottom - top, right - left
@@ -89,7 +89,19 @@ class CT_RPr(BaseOxmlElement):
     cs = ZeroOrOne('w:cs', successors=_tag_seq[34:])
     specVanish = ZeroOrOne('w:specVanish', successors=_tag_seq[38:])
     oMath = ZeroOrOne('w:oMath', successors=_tag_seq[39:])
+    _tag_order = dict((qn(tag), idx) for idx, tag in enumerate(_tag_seq))
     del _tag_seq
+    # ---children holding several properties, merged attribute by attribute---
+    _attr_groups = {qn('w:rFonts'): ()}
+
+    def merge(self, template):
+        """
+        Replace the children of this ``<w:rPr>`` having a counterpart in
+        *template*, another ``<w:rPr>`` element, by copies of them, adding
+        those not present. The attributes of a ``<w:rFonts>`` child are
+        merged, so fonts *template* does not set are kept.
+        """
+        self.merge_copies_of(template, self._tag_order, self._attr_groups)
 
     def _new_color(self):
         """
@@ -7,6 +7,17 @@ Custom element classes related to paragraphs (CT_P).
 from ..ns import qn
 from ..xmlchemy import BaseOxmlElement, OxmlElement, ZeroOrMore, ZeroOrOne
 
+# ---run content that can be moved into an adjacent run of the same formatting---
+_MERGEABLE_TAGS = frozenset(
+    qn(tag) for tag in (
+        'w:t', 'w:tab', 'w:br', 'w:cr', 'w:noBreakHyphen', 'w:softHyphen'
+    )
+)
+# ---elements that only record editing history or layout, discarded as noise---
+_NOISE_TAGS = (qn('w:proofErr'), qn('w:lastRenderedPageBreak'))
+
+_R, _RPR, _T = qn('w:r'), qn('w:rPr'), qn('w:t')
+
 
 class CT_P(BaseOxmlElement):
     """
@@ -52,6 +63,20 @@ class CT_P(BaseOxmlElement):
                 continue
             self.remove(child)
 
+    def normalize_runs(self):
+        """
+        Merge each run into the run before it when both have the same
+        formatting and only text-like content, in one pass over this
+        paragraph and the hyperlinks in it. Adjacent ``<w:t>`` elements are
+        joined, and empty runs, ``<w:proofErr>`` and
+        ``<w:lastRenderedPageBreak>`` elements are removed.
+        """
+        for elm in self.iter(*_NOISE_TAGS):
+            elm.getparent().remove(elm)
+        _normalize_runs_in(self)
+        for hyperlink in self.iterchildren(qn('w:hyperlink')):
+            _normalize_runs_in(hyperlink)
+
     def set_sectPr(self, sectPr):
         """
         Unconditionally replace or add *sectPr* as a grandchild in the
@@ -76,3 +101,67 @@ class CT_P(BaseOxmlElement):
     def style(self, style):
         pPr = self.get_or_add_pPr()
         pPr.style = style
+
+
+def _join_text(r):
+    """
+    Join each run of adjacent ``<w:t>`` children of *r* into one, removing
+    empty ones.
+    """
+    prev_t = None
+    for child in r[:]:
+        if child.tag != _T:
+            prev_t = None
+        elif not child.text:
+            r.remove(child)
+        elif prev_t is None:
+            prev_t = child
+        else:
+            prev_t.set_text(prev_t.text + child.text)
+            r.remove(child)
+
+
+def _normalize_runs_in(parent):
+    """
+    Merge the adjacent runs of the same formatting among the children of
+    *parent*, dropping runs left empty.
+    """
+    prev_r = prev_key = None
+    # ---text of each `w:t` extended by merging, joined once at the end to
+    #    keep the pass linear---
+    texts = {}
+    for child in parent[:]:
+        if child.tag != _R:
+            prev_r = None
+            continue
+        _join_text(child)
+        content = list(child)
+        rPr = content.pop(0) if content and content[0].tag == _RPR else None
+        if not content:
+            parent.remove(child)
+            continue
+        if not all(elm.tag in _MERGEABLE_TAGS for elm in content):
+            prev_r = None
+            continue
+        key = () if rPr is None else _xml_key(rPr)
+        if prev_r is None or key != prev_key:
+            prev_r, prev_key = child, key
+            continue
+        last = prev_r[-1]
+        if last.tag == _T and content[0].tag == _T:
+            texts.setdefault(last, [last.text]).append(content.pop(0).text)
+        prev_r.extend(content)
+        parent.remove(child)
+    for t, text in texts.items():
+        t.set_text(''.join(text))
+
+
+def _xml_key(elm):
+    """
+    Return hashable value equal for elements having the same children, with
+    the same attributes in any order, as *elm*.
+    """
+    return tuple(
+        (child.tag, tuple(sorted(child.attrib.items())), _xml_key(child))
+        for child in elm
+    )
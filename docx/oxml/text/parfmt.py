@@ -8,6 +8,7 @@ from ...enum.text import (
     WD_ALIGN_PARAGRAPH, WD_LINE_SPACING, WD_TAB_ALIGNMENT, WD_TAB_LEADER
 )
 from ...shared import Length
+from ..ns import qn
 from ..simpletypes import ST_SignedTwipsMeasure, ST_TwipsMeasure
 from ..xmlchemy import (
     BaseOxmlElement, OneOrMore, OptionalAttribute, RequiredAttribute,
@@ -58,7 +59,24 @@ class CT_PPr(BaseOxmlElement):
     ind = ZeroOrOne('w:ind', successors=_tag_seq[23:])
     jc = ZeroOrOne('w:jc', successors=_tag_seq[27:])
     sectPr = ZeroOrOne('w:sectPr', successors=_tag_seq[35:])
+    _tag_order = dict((qn(tag), idx) for idx, tag in enumerate(_tag_seq))
     del _tag_seq
+    # ---children holding several properties, merged attribute by attribute,
+    #    with the attributes that are alternatives to each other---
+    _attr_groups = {
+        qn('w:ind'): ((qn('w:firstLine'), qn('w:hanging')),),
+        qn('w:spacing'): ((qn('w:line'), qn('w:lineRule')),),
+    }
+
+    def merge(self, template):
+        """
+        Replace the children of this ``<w:pPr>`` having a counterpart in
+        *template*, another ``<w:pPr>`` element, by copies of them, adding
+        those not present. Other children, like ``<w:sectPr>``, are kept. The
+        attributes of ``<w:ind>`` and ``<w:spacing>`` children are merged, so
+        an indent or spacing *template* does not set is kept.
+        """
+        self.merge_copies_of(template, self._tag_order, self._attr_groups)
 
     @property
     def first_line_indent(self):
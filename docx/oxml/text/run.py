@@ -108,6 +108,14 @@ class CT_Text(BaseOxmlElement):
     """
     ``<w:t>`` element, containing a sequence of characters within a run.
     """
+    def set_text(self, text):
+        """
+        Set the text of this element to *text*, marking it to preserve any
+        leading or trailing whitespace.
+        """
+        self.text = text
+        if len(text.strip()) < len(text):
+            self.set(qn('xml:space'), 'preserve')
 
 
 class _RunContentAppender(object):
@@ -0,0 +1,174 @@
+# encoding: utf-8
+
+"""
+Character-offset map of the text of a ``<w:p>`` element onto its run content
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+from bisect import bisect_right
+from itertools import islice
+
+from .. import OxmlElement
+from ..ns import qn
+
+
+class TextMap(object):
+    """
+    Maps each character offset in the text of a ``<w:p>`` element to the run
+    content element it comes from, such that text spanning several runs can
+    be found and replaced in place. The text is formed the same way as
+    `Paragraph.text`, ``<w:tab/>`` mapping to ``'\\t'`` and ``<w:br/>`` and
+    ``<w:cr/>`` to ``'\\n'``, but also includes the runs of hyperlinks.
+    """
+    def __init__(self, p):
+        super(TextMap, self).__init__()
+        self._p = p
+        self._pieces = []
+        offset = 0
+        for r in p.xpath('./w:r | ./w:hyperlink/w:r'):
+            for child in r:
+                if child.tag == qn('w:t'):
+                    text = child.text or ''
+                elif child.tag == qn('w:tab'):
+                    text = '\t'
+                elif child.tag in (qn('w:br'), qn('w:cr')):
+                    text = '\n'
+                else:
+                    continue
+                self._pieces.append(_Piece(child, offset, text))
+                offset += len(text)
+        self._starts = [piece.start for piece in self._pieces]
+        self.text = ''.join(piece.text for piece in self._pieces)
+
+    def pieces_in(self, start, end):
+        """
+        Return list of the |_Piece| objects holding the characters from
+        offset *start* up to *end*, in document order.
+        """
+        idx = max(bisect_right(self._starts, start) - 1, 0)
+        pieces = []
+        for piece in islice(self._pieces, idx, None):
+            if piece.start >= end:
+                break
+            if piece.end > start:
+                pieces.append(piece)
+        return pieces
+
+    def replace(self, regex, repl, count=0):
+        """
+        Replace each match of compiled *regex* in the text of this paragraph
+        with *repl*, either a string possibly having backreferences, like
+        ``\\1``, or a callable taking the match object, as for `re.sub()`.
+        At most *count* matches are replaced when *count* is not zero.
+        Replacement text goes into the first ``<w:t>`` element of its match,
+        taking the formatting of that run; the rest of the matched text is
+        removed from the runs it spans. Returns the number of matches replaced.
+        """
+        matches = list(islice(regex.finditer(self.text), count or None))
+        # ---later matches are replaced first so the offsets of earlier ones
+        #    still locate their text---
+        for match in reversed(matches):
+            new_text = repl(match) if callable(repl) else match.expand(repl)
+            self._substitute(match.start(), match.end(), new_text)
+        for piece in self._pieces:
+            piece.write()
+        return len(matches)
+
+    def _add_t(self, offset, text):
+        """
+        Add a new ``<w:t>`` element holding *text* at *offset*, for when no
+        existing ``<w:t>`` element is there to take it.
+        """
+        t = OxmlElement('w:t')
+        t.set_text(text)
+        following = [piece for piece in self._pieces if piece.start >= offset]
+        if following:
+            following[0].elm.addprevious(t)
+        elif self._pieces:
+            self._pieces[-1].elm.addnext(t)
+        else:
+            self._p.add_r().append(t)
+
+    def _insert(self, offset, new_text):
+        """
+        Insert *new_text* at *offset*, in the ``<w:t>`` element holding the
+        character before it or else the one holding the character after.
+        """
+        if not new_text:
+            return
+        for piece in self._pieces:
+            if piece.is_text and piece.start <= offset <= piece.end:
+                piece.splice(offset, offset, new_text)
+                return
+        self._add_t(offset, new_text)
+
+    def _substitute(self, start, end, new_text):
+        """
+        Replace the characters from offset *start* up to *end* with
+        *new_text*, placed in the first ``<w:t>`` element holding one of
+        them.
+        """
+        if start == end:
+            self._insert(start, new_text)
+            return
+        target = None
+        for piece in self.pieces_in(start, end):
+            lo, hi = max(start, piece.start), min(end, piece.end)
+            if piece.is_text and target is None:
+                piece.splice(lo, hi, new_text)
+                target = piece
+            else:
+                piece.splice(lo, hi, '')
+        if target is None and new_text:
+            # ---match held no <w:t>, like a lone tab---
+            self._add_t(start, new_text)
+
+
+class _Piece(object):
+    """
+    The text of one run content element of a paragraph, at its offset in the
+    text of that paragraph. Only the text of a ``<w:t>`` element can be
+    changed; any other element is removed when its character is replaced.
+    """
+    def __init__(self, elm, start, text):
+        super(_Piece, self).__init__()
+        self.elm = elm
+        self.start = start
+        self.end = start + len(text)
+        self.is_text = elm.tag == qn('w:t')
+        self.text = text
+        self._changed = False
+
+    def splice(self, lo, hi, new_text):
+        """
+        Replace the characters of this piece from paragraph offset *lo* up to
+        *hi* with *new_text*. Offsets are those of the unchanged paragraph
+        text, so splices must be made from the end of the paragraph toward
+        its start.
+        """
+        text = self.text
+        self.text = (
+            text[:lo - self.start] + new_text + text[hi - self.start:]
+        )
+        self._changed = True
+
+    def write(self):
+        """
+        Write the changed text of this piece to its element, removing the
+        element, and its run when left empty, when no text remains.
+        """
+        if not self._changed:
+            return
+        elm, text = self.elm, self.text
+        if not text:
+            r = elm.getparent()
+            r.remove(elm)
+            # ---a run left with no content is removed too---
+            if all(child.tag == qn('w:rPr') for child in r):
+                r.getparent().remove(r)
+        else:
+            elm.set_text(text)
+        self._changed = False
@@ -7,6 +7,8 @@ element classes.
 
 from __future__ import absolute_import
 
+from copy import deepcopy
+
 from lxml import etree
 
 import re
@@ -721,6 +723,42 @@ class _OxmlElementBase(etree.ElementBase):
             self.append(elm)
         return elm
 
+    def merge_copies_of(self, template, tag_order, attr_groups=None):
+        """
+        Replace each child of this element having the tag of a child of
+        *template* by a deep copy of that template child, inserting the copy
+        in schema sequence when no such child is present. *tag_order* maps
+        each Clark-notation child tag to its position in the schema sequence.
+        Children of this element *template* has no counterpart for are left
+        as they are.
+
+        *attr_groups* maps the tag of each child holding several properties
+        in its attributes, like ``<w:ind>``, to a sequence of groups of
+        Clark-notation attribute names that are alternatives to each other.
+        The attributes of such a template child are merged into an existing
+        child rather than replacing it, after removing from it each group of
+        attributes the template child sets one of.
+        """
+        attr_groups = {} if attr_groups is None else attr_groups
+        last = len(tag_order)
+        for child in template:
+            tag = child.tag
+            existing = self.find(tag)
+            if existing is not None and tag in attr_groups:
+                _merge_attrs(existing, child, attr_groups[tag])
+                continue
+            copy = deepcopy(child)
+            if existing is not None:
+                self.replace(existing, copy)
+                continue
+            position = tag_order.get(tag, last)
+            for successor in self:
+                if tag_order.get(successor.tag, -1) > position:
+                    successor.addprevious(copy)
+                    break
+            else:
+                self.append(copy)
+
     def remove_all(self, *tagnames):
         """
         Remove all child elements whose tagname (e.g. 'a:p') appears in
@@ -757,3 +795,16 @@ class _OxmlElementBase(etree.ElementBase):
 BaseOxmlElement = MetaOxmlElement(
     'BaseOxmlElement', (etree.ElementBase,), dict(_OxmlElementBase.__dict__)
 )
+
+
+def _merge_attrs(elm, template, groups):
+    """
+    Set each attribute of *template* on *elm*, first removing from *elm* each
+    of *groups* of alternative attribute names *template* has one of.
+    """
+    for group in groups:
+        if any(name in template.attrib for name in group):
+            for name in group:
+                elm.attrib.pop(name, None)
+    for name, value in template.attrib.items():
+        elm.set(name, value)
@@ -5,6 +5,7 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from docx.image.image import Image
+from docx.opc import instrument
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.package import OpcPackage
 from docx.opc.packuri import PackURI
@@ -22,13 +23,19 @@ class Package(OpcPackage):
         """
         self._gather_image_parts()
 
-    def get_or_add_image_part(self, image_descriptor):
+    def drop_caches(self):
+        """Discard cached part values and the record of images already resampled."""
+        super(Package, self).drop_caches()
+        self.image_parts.drop_caches()
+
+    def get_or_add_image_part(self, image_descriptor, width=None, height=None):
         """Return |ImagePart| containing image specified by *image_descriptor*.
 
         The image-part is newly created if a matching one is not already present in the
-        collection.
+        collection. *width* and *height* are the size the image is shown at, which the
+        image policy, if any, resamples it for.
         """
-        return self.image_parts.get_or_add_image_part(image_descriptor)
+        return self.image_parts.get_or_add_image_part(image_descriptor, width, height)
 
     @lazyproperty
     def image_parts(self):
@@ -52,6 +59,8 @@ class ImageParts(object):
 
     def __init__(self):
         self._image_parts = []
+        self._transformed_images = {}
+        self.policy = None
 
     def __contains__(self, item):
         return self._image_parts.__contains__(item)
@@ -65,17 +74,33 @@ class ImageParts(object):
     def append(self, item):
         self._image_parts.append(item)
 
-    def get_or_add_image_part(self, image_descriptor):
+    def drop_caches(self):
+        """Forget which images have already been resampled for the current policy."""
+        self._transformed_images.clear()
+
+    def get_or_add_image_part(self, image_descriptor, width=None, height=None):
         """Return |ImagePart| object containing image identified by *image_descriptor*.
 
         The image-part is newly created if a matching one is not present in the
-        collection.
+        collection. When `policy` is an |ImagePolicy|, the image is first resampled as
+        it requires for a picture shown at *width* and *height*, as
+        `Image.scaled_dimensions()` takes them. Each resampled image is kept, so adding
+        the same image at the same size again does not resample it again, for as long
+        as its image part remains in the package.
         """
+        started = instrument.start()
         image = Image.from_file(image_descriptor)
-        matching_image_part = self._get_by_sha1(image.sha1)
-        if matching_image_part is not None:
-            return matching_image_part
-        return self._add_image_part(image)
+        if self.policy is not None:
+            image = self._apply_policy(image, width, height)
+        image_part = self._get_by_sha1(image.sha1)
+        is_new = image_part is None
+        if is_new:
+            image_part = self._add_image_part(image)
+        if started is not None:
+            instrument.emit(
+                "image.add", started, size=len(image.blob), is_new=is_new
+            )
+        return image_part
 
     def _add_image_part(self, image):
         """
@@ -87,6 +112,25 @@ class ImageParts(object):
         self.append(image_part)
         return image_part
 
+    def _apply_policy(self, image, width, height):
+        """Return *image* resampled as `policy` requires, or *image* if it does not.
+
+        The SHA1 hash of each resampled image is kept rather than the image itself;
+        its image is that of the image part having that hash.
+        """
+        policy = self.policy
+        px_size = policy.target_px_size(image, width, height)
+        if px_size is None:
+            return image
+        key = (image.sha1, policy) + px_size
+        sha1 = self._transformed_images.get(key)
+        image_part = None if sha1 is None else self._get_by_sha1(sha1)
+        if image_part is not None:
+            return image_part.image
+        transformed = policy.transform(image, *px_size)
+        self._transformed_images[key] = transformed.sha1
+        return transformed
+
     def _get_by_sha1(self, sha1):
         """
         Return the image part in this collection having a SHA1 hash matching
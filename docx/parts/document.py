@@ -5,13 +5,15 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from docx.document import Document
+from docx.enum.section import WD_HEADER_FOOTER
+from docx.numbering import ListLabeler
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.parts.hdrftr import FooterPart, HeaderPart
 from docx.parts.numbering import NumberingPart
 from docx.parts.settings import SettingsPart
 from docx.parts.story import BaseStoryPart
 from docx.parts.styles import StylesPart
-from docx.shape import InlineShapes
+from docx.shape import InlineShape, InlineShapes
 from docx.shared import lazyproperty
 
 
@@ -24,18 +26,64 @@ class DocumentPart(BaseStoryPart):
     objects provides access to this part object for that purpose.
     """
 
+    _cache_proxies = False
+
     def add_footer_part(self):
         """Return (footer_part, rId) pair for newly-created footer part."""
         footer_part = FooterPart.new(self.package)
         rId = self.relate_to(footer_part, RT.FOOTER)
+        self._hdrftr_sources = {}
         return footer_part, rId
 
     def add_header_part(self):
         """Return (header_part, rId) pair for newly-created header part."""
         header_part = HeaderPart.new(self.package)
         rId = self.relate_to(header_part, RT.HEADER)
+        self._hdrftr_sources = {}
         return header_part, rId
 
+    def add_section_break(self):
+        """Return `w:sectPr` element for new section added at end of document.
+
+        The section index is extended with the `w:sectPr` elements of the new section
+        break rather than being rebuilt by a scan of the document.
+        """
+        sectPr_lst = self.sectPr_lst
+        sentinel_sectPr = self._element.body.add_section_break()
+        self.mark_dirty()
+        break_sectPr = sentinel_sectPr.getprevious().pPr.sectPr
+        if sectPr_lst and sectPr_lst[-1] is sentinel_sectPr:
+            sectPr_lst[-1:] = [break_sectPr, sentinel_sectPr]
+            self._body_len = len(self._element.body)
+            self._sectPr_idxs[break_sectPr] = len(sectPr_lst) - 2
+            self._sectPr_idxs[sentinel_sectPr] = len(sectPr_lst) - 1
+            self._hdrftr_sources = {}
+        else:
+            self._index_sectPrs(self._element.sectPr_lst)
+        return sentinel_sectPr
+
+    def drop_caches(self):
+        """Discard the section index along with other rebuildable values."""
+        super(DocumentPart, self).drop_caches()
+        self.reset_section_index()
+        self._sectPr_idxs = {}
+        self._hdrftr_sources = {}
+
+    @property
+    def cache_proxies(self):
+        """True if each story part of this document keeps a |ProxyCache|.
+
+        Read/write. Assigning False discards the proxy cache of each story part.
+        """
+        return self._cache_proxies
+
+    @cache_proxies.setter
+    def cache_proxies(self, value):
+        self._cache_proxies = bool(value)
+        if not value:
+            for story_part in self.iter_story_parts():
+                story_part._proxies = None
+
     @property
     def core_properties(self):
         """
@@ -49,16 +97,29 @@ class DocumentPart(BaseStoryPart):
         """
         A |Document| object providing access to the content of this document.
         """
-        return Document(self._element, self)
+        return Document(self.element, self)
+
+    def drop_footer_part(self, rId):
+        """Remove related footer part identified by *rId*."""
+        self.drop_rel(rId)
+        self._hdrftr_sources = {}
 
     def drop_header_part(self, rId):
         """Remove related header part identified by *rId*."""
         self.drop_rel(rId)
+        self._hdrftr_sources = {}
 
     def footer_part(self, rId):
         """Return |FooterPart| related by *rId*."""
         return self.related_parts[rId]
 
+    def footer_source_sectPr(self, sectPr, type_):
+        """Return `w:sectPr` element a *type_* footer of the *sectPr* section inherits.
+
+        See `header_source_sectPr()`, which this mirrors for footers.
+        """
+        return self._hdrftr_source_sectPr(sectPr, "w:footerReference", type_)
+
     def get_style(self, style_id, style_type):
         """
         Return the style in this document matching *style_id*. Returns the
@@ -81,13 +142,58 @@ class DocumentPart(BaseStoryPart):
         """Return |HeaderPart| related by *rId*."""
         return self.related_parts[rId]
 
+    def header_source_sectPr(self, sectPr, type_):
+        """Return `w:sectPr` element a *type_* header of the *sectPr* section inherits.
+
+        This is the nearest prior section that defines a header of *type_*, or the
+        first section when no prior section does, and |None| when *sectPr* belongs to
+        the first section. The sources for every section are resolved together in
+        a single pass over the sections and reused until a header or footer definition
+        is added or dropped or a section is added.
+        """
+        return self._hdrftr_source_sectPr(sectPr, "w:headerReference", type_)
+
     @lazyproperty
     def inline_shapes(self):
         """
         The |InlineShapes| instance containing the inline shapes in the
         document.
         """
-        return InlineShapes(self._element.body, self)
+        return InlineShapes(self.element.body, self)
+
+    def inline_shapes_for_image(self, sha1):
+        """Return list of |InlineShape| for each use of the image having *sha1*.
+
+        The document body, headers and footers are all searched, each through its own
+        inline-shape index, so only the image relationships of each story are visited.
+        """
+        return [
+            InlineShape(inline)
+            for story_part in self.iter_story_parts()
+            for rId, rel in story_part.rels.items()
+            if rel.reltype == RT.IMAGE
+            and not rel.is_external
+            and rel.target_part.sha1 == sha1
+            for inline in story_part.inlines_for_rId(rId)
+        ]
+
+    def iter_story_parts(self):
+        """Generate this part followed by each of its header and footer parts."""
+        yield self
+        for rel in self.rels.values():
+            if rel.reltype in (RT.HEADER, RT.FOOTER) and not rel.is_external:
+                yield rel.target_part
+
+    def new_list_labeler(self):
+        """Return a new |ListLabeler| for labeling the paragraphs of this document.
+
+        A document without a numbering part gets a labeler that labels no paragraph.
+        """
+        try:
+            numbering = self.part_related_by(RT.NUMBERING).element
+        except KeyError:
+            numbering = None
+        return ListLabeler(numbering, self._styles_part.element)
 
     @lazyproperty
     def numbering_part(self):
@@ -99,10 +205,22 @@ class DocumentPart(BaseStoryPart):
         try:
             return self.part_related_by(RT.NUMBERING)
         except KeyError:
-            numbering_part = NumberingPart.new()
+            numbering_part = NumberingPart.new(self.package)
             self.relate_to(numbering_part, RT.NUMBERING)
             return numbering_part
 
+    def preceding_sectPr(self, sectPr):
+        """Return `w:sectPr` element of the section before the one of *sectPr*.
+
+        Returns |None| if *sectPr* belongs to the first section. Located using the
+        section index, so the document is not scanned backward from *sectPr*.
+        """
+        sectPr_lst = self.sectPr_lst
+        idx = self._sectPr_idxs.get(sectPr)
+        if idx is None:
+            return sectPr.preceding_sectPr
+        return sectPr_lst[idx - 1] if idx > 0 else None
+
     def save(self, path_or_stream):
         """
         Save this document to *path_or_stream*, which can be either a path to
@@ -110,6 +228,34 @@ class DocumentPart(BaseStoryPart):
         """
         self.package.save(path_or_stream)
 
+    @property
+    def sectPr_lst(self):
+        """List of the `w:sectPr` elements in this document, in document order.
+
+        This section index is built by a scan of the document when first needed and is
+        kept current by `add_section_break()` and the other python-docx methods that
+        add or remove section breaks, like `_Body.clear_content()`. When the number of
+        body child elements has changed since, each indexed `w:sectPr` element is
+        checked for still being in the body and the index rebuilt when one is not, as
+        when the paragraph ending a section has been removed. A section break added by
+        changing the XML directly is only recognized after a call to
+        `reset_section_index()`.
+        """
+        sectPr_lst = getattr(self, "_sectPr_lst", None)
+        body = self._element.body
+        if sectPr_lst is None:
+            self._index_sectPrs(self._element.sectPr_lst)
+        elif len(body) != self._body_len:
+            if all(self._is_in_body(sectPr, body) for sectPr in sectPr_lst):
+                self._body_len = len(body)
+            else:
+                self._index_sectPrs(self._element.sectPr_lst)
+        return self._sectPr_lst
+
+    def reset_section_index(self):
+        """Discard the section index, causing it to be rebuilt on next use."""
+        self._sectPr_lst = None
+
     @property
     def settings(self):
         """
@@ -126,6 +272,66 @@ class DocumentPart(BaseStoryPart):
         """
         return self._styles_part.styles
 
+    @property
+    def _cache_names(self):
+        """Tuple of names of the rebuildable values this part currently holds."""
+        names = super(DocumentPart, self)._cache_names
+        if getattr(self, "_sectPr_lst", None) is not None:
+            names += ("section_index",)
+        return names
+
+    def _hdrftr_source_sectPr(self, sectPr, reference_tag, type_):
+        """Return `w:sectPr` element the *sectPr* section inherits a definition from.
+
+        The definition is the header or footer of *type_* referenced by
+        a *reference_tag* child element, like `w:headerReference`.
+        """
+        sectPr_lst = self.sectPr_lst
+        if sectPr not in self._sectPr_idxs:
+            return self.preceding_sectPr(sectPr)
+        key = (reference_tag, type_)
+        try:
+            sources = self._hdrftr_sources[key]
+        except KeyError:
+            sources = self._resolve_hdrftr_sources(sectPr_lst, reference_tag, type_)
+            self._hdrftr_sources[key] = sources
+        return sources[sectPr]
+
+    def _index_sectPrs(self, sectPrs):
+        """Make *sectPrs* the section index of this document."""
+        self._sectPr_lst = list(sectPrs)
+        self._body_len = len(self._element.body)
+        self._sectPr_idxs = dict(
+            (sectPr, idx) for idx, sectPr in enumerate(self._sectPr_lst)
+        )
+        self._hdrftr_sources = {}
+
+    @staticmethod
+    def _is_in_body(sectPr, body):
+        """True if *sectPr* still appears within the *body* element."""
+        elm = sectPr.getparent()
+        while elm is not None:
+            if elm is body:
+                return True
+            elm = elm.getparent()
+        return False
+
+    @staticmethod
+    def _resolve_hdrftr_sources(sectPr_lst, reference_tag, type_):
+        """Return dict mapping each of *sectPr_lst* to the `w:sectPr` it inherits from.
+
+        See `_hdrftr_source_sectPr()` for the meaning of *reference_tag* and *type_*.
+        """
+        xpath = "./%s[@w:type='%s']" % (reference_tag, WD_HEADER_FOOTER.to_xml(type_))
+        sources, source = {}, None
+        for sectPr in sectPr_lst:
+            sources[sectPr] = source
+            if sectPr.xpath(xpath):
+                source = sectPr
+            elif source is None:
+                source = sectPr_lst[0]
+        return sources
+
     @property
     def _settings_part(self):
         """
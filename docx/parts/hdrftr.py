@@ -5,6 +5,7 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import os
+from copy import deepcopy
 
 from docx.opc.constants import CONTENT_TYPE as CT
 from docx.oxml import parse_xml
@@ -14,14 +15,27 @@ from docx.parts.story import BaseStoryPart
 class FooterPart(BaseStoryPart):
     """Definition of a section footer."""
 
+    _default_ftr = None
+
     @classmethod
     def new(cls, package):
         """Return newly created footer part."""
         partname = package.next_partname("/word/footer%d.xml")
         content_type = CT.WML_FOOTER
-        element = parse_xml(cls._default_footer_xml())
+        element = cls._new_footer_element()
         return cls(partname, content_type, element, package)
 
+    @classmethod
+    def _new_footer_element(cls):
+        """Return a new `w:ftr` element tree copied from the default footer template.
+
+        The template is read and parsed once per process; each call returns a deep copy
+        of that parsed tree.
+        """
+        if cls._default_ftr is None:
+            cls._default_ftr = parse_xml(cls._default_footer_xml())
+        return deepcopy(cls._default_ftr)
+
     @classmethod
     def _default_footer_xml(cls):
         """Return bytes containing XML for a default footer part."""
@@ -36,14 +50,27 @@ class FooterPart(BaseStoryPart):
 class HeaderPart(BaseStoryPart):
     """Definition of a section header."""
 
+    _default_hdr = None
+
     @classmethod
     def new(cls, package):
         """Return newly created header part."""
         partname = package.next_partname("/word/header%d.xml")
         content_type = CT.WML_HEADER
-        element = parse_xml(cls._default_header_xml())
+        element = cls._new_header_element()
         return cls(partname, content_type, element, package)
 
+    @classmethod
+    def _new_header_element(cls):
+        """Return a new `w:hdr` element tree copied from the default header template.
+
+        The template is read and parsed once per process; each call returns a deep copy
+        of that parsed tree.
+        """
+        if cls._default_hdr is None:
+            cls._default_hdr = parse_xml(cls._default_header_xml())
+        return deepcopy(cls._default_hdr)
+
     @classmethod
     def _default_header_xml(cls):
         """Return bytes containing XML for a default header part."""
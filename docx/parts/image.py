@@ -23,6 +23,7 @@ class ImagePart(Part):
     def __init__(self, partname, content_type, blob, image=None):
         super(ImagePart, self).__init__(partname, content_type, blob)
         self._image = image
+        self._filename = None
 
     @property
     def default_cx(self):
@@ -46,6 +47,16 @@ class ImagePart(Part):
         height_in_emu = 914400 * px_height / horz_dpi
         return Emu(height_in_emu)
 
+    def drop_caches(self):
+        """
+        Discard the |Image| object parsed from the blob of this part, keeping
+        the filename it was created from.
+        """
+        super(ImagePart, self).drop_caches()
+        if self._image is not None:
+            self._filename = self._image.filename
+            self._image = None
+
     @property
     def filename(self):
         """
@@ -55,6 +66,8 @@ class ImagePart(Part):
         case a default extension is applied based on the detected MIME type
         of the image.
         """
+        if self._filename is not None:
+            return self._filename
         if self._image is not None:
             return self._image.filename
         return 'image.%s' % self.partname.ext
@@ -70,7 +83,7 @@ class ImagePart(Part):
     @property
     def image(self):
         if self._image is None:
-            self._image = Image.from_blob(self.blob)
+            self._image = Image.from_blob(self.blob, self._filename)
         return self._image
 
     @classmethod
@@ -87,3 +100,13 @@ class ImagePart(Part):
         SHA1 hash digest of the blob of this image part.
         """
         return hashlib.sha1(self._blob).hexdigest()
+
+    @property
+    def _cache_names(self):
+        """
+        Tuple of names of the rebuildable values this part currently holds.
+        """
+        names = super(ImagePart, self)._cache_names
+        if self._image is not None:
+            names += ('image',)
+        return names
@@ -8,7 +8,11 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from ..opc.constants import CONTENT_TYPE as CT
+from ..opc.packuri import PackURI
 from ..opc.part import XmlPart
+from ..oxml import parse_xml
+from ..oxml.ns import nsdecls
 from ..shared import lazyproperty
 
 
@@ -18,12 +22,15 @@ class NumberingPart(XmlPart):
     a document or glossary.
     """
     @classmethod
-    def new(cls):
+    def new(cls, package=None):
         """
         Return newly created empty numbering part, containing only the root
         ``<w:numbering>`` element.
         """
-        raise NotImplementedError
+        partname = PackURI('/word/numbering.xml')
+        content_type = CT.WML_NUMBERING
+        element = parse_xml('<w:numbering %s/>' % nsdecls('w'))
+        return cls(partname, content_type, element, package)
 
     @lazyproperty
     def numbering_definitions(self):
@@ -9,6 +9,7 @@ from __future__ import (
 )
 
 import os
+from copy import deepcopy
 
 from ..opc.constants import CONTENT_TYPE as CT
 from ..opc.packuri import PackURI
@@ -21,6 +22,9 @@ class SettingsPart(XmlPart):
     """
     Document-level settings part of a WordprocessingML (WML) package.
     """
+
+    _default_settings = None
+
     @classmethod
     def default(cls, package):
         """
@@ -29,7 +33,7 @@ class SettingsPart(XmlPart):
         """
         partname = PackURI('/word/settings.xml')
         content_type = CT.WML_SETTINGS
-        element = parse_xml(cls._default_settings_xml())
+        element = cls._new_settings_element()
         return cls(partname, content_type, element, package)
 
     @property
@@ -40,6 +44,17 @@ class SettingsPart(XmlPart):
         """
         return Settings(self.element)
 
+    @classmethod
+    def _new_settings_element(cls):
+        """
+        Return a new `w:settings` element tree copied from the default settings
+        template. The template is read and parsed once per process; each call
+        returns a deep copy of that parsed tree.
+        """
+        if cls._default_settings is None:
+            cls._default_settings = parse_xml(cls._default_settings_xml())
+        return deepcopy(cls._default_settings)
+
     @classmethod
     def _default_settings_xml(cls):
         """
@@ -6,8 +6,9 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.part import XmlPart
+from docx.oxml.ns import qn
 from docx.oxml.shape import CT_Inline
-from docx.shared import lazyproperty
+from docx.shared import lazyproperty, ProxyCache
 
 
 class BaseStoryPart(XmlPart):
@@ -18,15 +19,31 @@ class BaseStoryPart(XmlPart):
     `.add_paragraph()`, `.add_table()` etc.
     """
 
-    def get_or_add_image(self, image_descriptor):
+    # ---location step matching the inline shapes indexed for this story---
+    _inline_step = "wp:inline[parent::w:drawing/parent::w:r/parent::w:p]"
+
+    _inline_lst = None
+    _inlines_by_rId = None
+    _proxies = None
+
+    def drop_caches(self):
+        """Discard the inline-shape index along with other rebuildable values."""
+        super(BaseStoryPart, self).drop_caches()
+        self.reset_inline_index()
+        self._proxies = None
+
+    def get_or_add_image(self, image_descriptor, width=None, height=None):
         """Return (rId, image) pair for image identified by *image_descriptor*.
 
         *rId* is the str key (often like "rId7") for the relationship between this story
         part and the image part, reused if already present, newly created if not.
         *image* is an |Image| instance providing access to the properties of the image,
-        such as dimensions and image type.
+        such as dimensions and image type. *width* and *height* are the size the image
+        is shown at, for the image policy of the package.
         """
-        image_part = self._package.get_or_add_image_part(image_descriptor)
+        image_part = self._package.get_or_add_image_part(
+            image_descriptor, width, height
+        )
         rId = self.relate_to(image_part, RT.IMAGE)
         return rId, image_part.image
 
@@ -47,17 +64,82 @@ class BaseStoryPart(XmlPart):
         """
         return self._document_part.get_style_id(style_or_name, style_type)
 
+    def index_inline(self, inline):
+        """Add *inline*, just inserted into this story, to the inline-shape index.
+
+        Its position is found by counting the indexed inlines that follow it, so adding
+        a picture near the end of the story does not rescan the whole story.
+        """
+        inline_lst = self._inline_lst
+        if inline_lst is None:
+            return
+        following_count = int(inline.xpath("count(following::%s)" % self._inline_step))
+        inline_lst.insert(len(inline_lst) - following_count, inline)
+        self._inlines_by_rId = None
+
+    def inline_at(self, idx):
+        """Return the `wp:inline` element at *idx* in the inline-shape index.
+
+        Only the element returned is checked for still being in this story, the index
+        being rebuilt when it is not, so indexing costs the same however many shapes
+        the story holds. Raises |IndexError| when *idx* is out of range.
+        """
+        inline_lst = self._inline_lst
+        if inline_lst is None:
+            inline_lst = self._index_inlines()
+        inline = inline_lst[idx]
+        if not self._is_in_story(inline):
+            inline = self._index_inlines()[idx]
+        return inline
+
+    @property
+    def inline_lst(self):
+        """List of `wp:inline` elements in this story, in document order.
+
+        This inline-shape index is built by a scan of the story when first needed and is
+        kept current by `index_inline()`, which `Run.add_picture()` calls, and by
+        a call to `reset_inline_index()` from each API method that removes or moves
+        shapes, like `Paragraph.clear()` or `_Cell.merge()`. Shapes inserted, moved or
+        removed in the XML by other means are only recognized after a call to
+        `reset_inline_index()`.
+        """
+        inline_lst = self._inline_lst
+        if inline_lst is None:
+            inline_lst = self._index_inlines()
+        return inline_lst
+
+    def inlines_for_rId(self, rId):
+        """List of indexed `wp:inline` elements whose picture is embedded by *rId*."""
+        inline_lst = self.inline_lst
+        if self._inlines_by_rId is None:
+            inlines_by_rId = {}
+            for inline in inline_lst:
+                for embed_rId in inline.xpath(".//a:blip/@r:embed"):
+                    inlines_by_rId.setdefault(embed_rId, []).append(inline)
+            self._inlines_by_rId = inlines_by_rId
+        return self._inlines_by_rId.get(rId, [])
+
     def new_pic_inline(self, image_descriptor, width, height):
         """Return a newly-created `w:inline` element.
 
         The element contains the image specified by *image_descriptor* and is scaled
         based on the values of *width* and *height*.
         """
-        rId, image = self.get_or_add_image(image_descriptor)
+        rId, image = self.get_or_add_image(image_descriptor, width, height)
         cx, cy = image.scaled_dimensions(width, height)
         shape_id, filename = self.next_id, image.filename
         return CT_Inline.new_pic_inline(shape_id, rId, filename, cx, cy)
 
+    def normalize_runs(self):
+        """Merge adjacent runs of the same formatting in each paragraph of this story.
+
+        See `Paragraph.normalize_runs()`.
+        """
+        for p in list(self._element.iter(qn("w:p"))):
+            p.normalize_runs()
+        self.mark_dirty()
+        self.reset_inline_index()
+
     @property
     def next_id(self):
         """Next available positive integer id value in this story XML document.
@@ -72,7 +154,51 @@ class BaseStoryPart(XmlPart):
             return 1
         return max(used_ids) + 1
 
+    def reset_inline_index(self):
+        """Discard the inline-shape index, causing it to be rebuilt on next use."""
+        self._inline_lst = None
+        self._inlines_by_rId = None
+
+    @property
+    def _cache_names(self):
+        """Tuple of names of the rebuildable values this part currently holds."""
+        names = super(BaseStoryPart, self)._cache_names
+        if self._inline_lst is not None:
+            names += ("inline_index",)
+        if self._proxies:
+            names += ("proxy_cache",)
+        return names
+
     @lazyproperty
     def _document_part(self):
         """|DocumentPart| object for this package."""
         return self.package.main_document_part
+
+    @property
+    def _proxy_cache(self):
+        """|ProxyCache| of the proxy objects made for elements of this story.
+
+        |None| unless proxy caching is turned on for the document, see
+        `DocumentPart.cache_proxies`.
+        """
+        if not self._document_part.cache_proxies:
+            return None
+        if self._proxies is None:
+            self._proxies = ProxyCache()
+        return self._proxies
+
+    def _index_inlines(self):
+        """Return inline-shape index newly built by a scan of this story."""
+        self._inline_lst = self._element.xpath(".//%s" % self._inline_step)
+        self._inlines_by_rId = None
+        return self._inline_lst
+
+    def _is_in_story(self, element):
+        """True if *element* still appears within the root element of this story."""
+        story = self._element
+        elm = element.getparent()
+        while elm is not None:
+            if elm is story:
+                return True
+            elm = elm.getparent()
+        return False
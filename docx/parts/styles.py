@@ -9,6 +9,7 @@ from __future__ import (
 )
 
 import os
+from copy import deepcopy
 
 from ..opc.constants import CONTENT_TYPE as CT
 from ..opc.packuri import PackURI
@@ -22,6 +23,9 @@ class StylesPart(XmlPart):
     Proxy for the styles.xml part containing style definitions for a document
     or glossary.
     """
+
+    _default_styles = None
+
     @classmethod
     def default(cls, package):
         """
@@ -30,7 +34,7 @@ class StylesPart(XmlPart):
         """
         partname = PackURI('/word/styles.xml')
         content_type = CT.WML_STYLES
-        element = parse_xml(cls._default_styles_xml())
+        element = cls._new_styles_element()
         return cls(partname, content_type, element, package)
 
     @property
@@ -41,6 +45,17 @@ class StylesPart(XmlPart):
         """
         return Styles(self.element)
 
+    @classmethod
+    def _new_styles_element(cls):
+        """
+        Return a new `w:styles` element tree copied from the default styles
+        template. The template is read and parsed once per process; each call
+        returns a deep copy of that parsed tree.
+        """
+        if cls._default_styles is None:
+            cls._default_styles = parse_xml(cls._default_styles_xml())
+        return deepcopy(cls._default_styles)
+
     @classmethod
     def _default_styles_xml(cls):
         """
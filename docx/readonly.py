@@ -0,0 +1,225 @@
+# encoding: utf-8
+
+"""Read-only access to the text of a document, for bulk extraction.
+
+The document part is parsed with a plain lxml parser, without the custom element
+classes of |docx.oxml|, and only the document and core properties parts are read
+from the package. Text and style ids are gathered with precompiled XPath
+expressions. Use `docx.Document(docx, read_only=True)` to open a document this way.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import threading
+
+from lxml import etree
+
+from docx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from docx.opc.parts.coreprops import CorePropertiesPart
+from docx.opc.pkgreader import PackageReader
+from docx.oxml.ns import nsmap, qn
+from docx.shared import ElementProxy
+
+
+def _xpath(path):
+    """Return compiled XPath expression for *path*, using the standard prefixes."""
+    return etree.XPath(path, namespaces=nsmap)
+
+
+_body_paragraphs = _xpath("w:body/w:p")
+_body_tables = _xpath("w:body/w:tbl")
+_cell_paragraphs = _xpath("w:p")
+_cell_tables = _xpath("w:tbl")
+_paragraph_runs = _xpath("w:r")
+_paragraph_style_id = _xpath("string(w:pPr/w:pStyle/@w:val)")
+_paragraph_text_elms = _xpath("w:r/w:t | w:r/w:tab | w:r/w:br | w:r/w:cr")
+_row_cells = _xpath("w:tc")
+_run_style_id = _xpath("string(w:rPr/w:rStyle/@w:val)")
+_run_text_elms = _xpath("w:t | w:tab | w:br | w:cr")
+_table_rows = _xpath("w:tr")
+_table_style_id = _xpath("string(w:tblPr/w:tblStyle/@w:val)")
+
+_T, _TAB = qn("w:t"), qn("w:tab")
+
+
+class _PlainParsers(threading.local):
+    """Holds the plain XML parsers of each thread."""
+
+    def __init__(self):
+        super(_PlainParsers, self).__init__()
+        self.parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
+        self.huge_tree_parser = etree.XMLParser(
+            remove_blank_text=True, resolve_entities=False, huge_tree=True
+        )
+
+
+_plain_parsers = _PlainParsers()
+
+
+class ReadOnlyDocument(ElementProxy):
+    """Read-only view of the text, tables and core properties of a document.
+
+    Not intended to be constructed directly. Use `docx.Document(docx, read_only=True)`
+    to open a document this way.
+    """
+
+    __slots__ = ("_core_properties",)
+
+    def __init__(self, element, core_properties):
+        super(ReadOnlyDocument, self).__init__(element)
+        self._core_properties = core_properties
+
+    @classmethod
+    def open(cls, docx, huge_tree=False):
+        """Return |ReadOnlyDocument| object loaded from *docx*.
+
+        *docx* is a path, file-like object or buffer, as `docx.Document()` accepts.
+        When *huge_tree* is True, the parser limits on tree depth and text size are
+        lifted, for very large documents from a trusted source.
+        """
+        parts = PackageReader.read_package_parts(
+            docx, (RT.OFFICE_DOCUMENT, RT.CORE_PROPERTIES)
+        )
+        partname, content_type, blob = parts[RT.OFFICE_DOCUMENT]
+        if content_type != CT.WML_DOCUMENT_MAIN:
+            tmpl = "file '%s' is not a Word file, content type is '%s'"
+            raise ValueError(tmpl % (docx, content_type))
+        parser = (
+            _plain_parsers.huge_tree_parser if huge_tree else _plain_parsers.parser
+        )
+        document = etree.fromstring(blob, parser)
+        if RT.CORE_PROPERTIES in parts:
+            partname, content_type, blob = parts[RT.CORE_PROPERTIES]
+            core_properties_part = CorePropertiesPart.load(
+                partname, content_type, blob, None
+            )
+        else:
+            core_properties_part = CorePropertiesPart.default(None)
+        return cls(document, core_properties_part.core_properties)
+
+    @property
+    def core_properties(self):
+        """|CoreProperties| object for the core properties of this document.
+
+        Changes made to it are not saved anywhere.
+        """
+        return self._core_properties
+
+    @property
+    def paragraphs(self):
+        """List of |ReadOnlyParagraph| objects for the paragraphs in the body.
+
+        Paragraphs within tables are not included.
+        """
+        return [ReadOnlyParagraph(p) for p in _body_paragraphs(self._element)]
+
+    @property
+    def tables(self):
+        """List of |ReadOnlyTable| objects for the tables in the body.
+
+        Tables nested within other tables are not included.
+        """
+        return [ReadOnlyTable(tbl) for tbl in _body_tables(self._element)]
+
+
+class ReadOnlyParagraph(ElementProxy):
+    """Read-only view of a `w:p` element."""
+
+    __slots__ = ()
+
+    @property
+    def runs(self):
+        """List of |ReadOnlyRun| objects for the runs in this paragraph."""
+        return [ReadOnlyRun(r) for r in _paragraph_runs(self._element)]
+
+    @property
+    def style_id(self):
+        """Style id of the style applied to this paragraph, |None| if not set."""
+        return _paragraph_style_id(self._element) or None
+
+    @property
+    def text(self):
+        """Text of the runs in this paragraph, as `Paragraph.text` gives it."""
+        return _text(_paragraph_text_elms(self._element))
+
+
+class ReadOnlyRun(ElementProxy):
+    """Read-only view of a `w:r` element."""
+
+    __slots__ = ()
+
+    @property
+    def style_id(self):
+        """Style id of the character style applied to this run, |None| if not set."""
+        return _run_style_id(self._element) or None
+
+    @property
+    def text(self):
+        """Text of this run, as `Run.text` gives it."""
+        return _text(_run_text_elms(self._element))
+
+
+class ReadOnlyTable(ElementProxy):
+    """Read-only view of a `w:tbl` element."""
+
+    __slots__ = ()
+
+    @property
+    def rows(self):
+        """List of |_ReadOnlyRow| objects for the rows of this table."""
+        return [_ReadOnlyRow(tr) for tr in _table_rows(self._element)]
+
+    @property
+    def style_id(self):
+        """Style id of the style applied to this table, |None| if not set."""
+        return _table_style_id(self._element) or None
+
+
+class _ReadOnlyRow(ElementProxy):
+    """Read-only view of a `w:tr` element."""
+
+    __slots__ = ()
+
+    @property
+    def cells(self):
+        """List of |_ReadOnlyCell| objects for the cells of this row.
+
+        Unlike `_Row.cells`, there is one cell per `w:tc` element; a cell spanning
+        several grid columns appears once.
+        """
+        return [_ReadOnlyCell(tc) for tc in _row_cells(self._element)]
+
+
+class _ReadOnlyCell(ElementProxy):
+    """Read-only view of a `w:tc` element."""
+
+    __slots__ = ()
+
+    @property
+    def paragraphs(self):
+        """List of |ReadOnlyParagraph| objects for the paragraphs in this cell."""
+        return [ReadOnlyParagraph(p) for p in _cell_paragraphs(self._element)]
+
+    @property
+    def tables(self):
+        """List of |ReadOnlyTable| objects for the tables nested in this cell."""
+        return [ReadOnlyTable(tbl) for tbl in _cell_tables(self._element)]
+
+    @property
+    def text(self):
+        """Text of the paragraphs in this cell, separated by newlines."""
+        return "\n".join(p.text for p in self.paragraphs)
+
+
+def _text(elms):
+    """Return text of run content *elms*, tabs and breaks becoming "\\t" and "\\n"."""
+    text = []
+    for elm in elms:
+        tag = elm.tag
+        if tag == _T:
+            text.append(elm.text or "")
+        elif tag == _TAB:
+            text.append("\t")
+        else:
+            text.append("\n")
+    return "".join(text)
@@ -16,6 +16,8 @@ class Sections(Sequence):
     Supports ``len()``, iteration, and indexed access.
     """
 
+    __slots__ = ('_document_elm', '_document_part')
+
     def __init__(self, document_elm, document_part):
         super(Sections, self).__init__()
         self._document_elm = document_elm
@@ -25,16 +27,16 @@ class Sections(Sequence):
         if isinstance(key, slice):
             return [
                 Section(sectPr, self._document_part)
-                for sectPr in self._document_elm.sectPr_lst[key]
+                for sectPr in self._document_part.sectPr_lst[key]
             ]
-        return Section(self._document_elm.sectPr_lst[key], self._document_part)
+        return Section(self._document_part.sectPr_lst[key], self._document_part)
 
     def __iter__(self):
-        for sectPr in self._document_elm.sectPr_lst:
+        for sectPr in self._document_part.sectPr_lst:
             yield Section(sectPr, self._document_part)
 
     def __len__(self):
-        return len(self._document_elm.sectPr_lst)
+        return len(self._document_part.sectPr_lst)
 
 
 class Section(object):
@@ -43,6 +45,8 @@ class Section(object):
     Also provides access to headers and footers.
     """
 
+    __slots__ = ('_sectPr', '_document_part', '_footer', '_header')
+
     def __init__(self, sectPr, document_part):
         super(Section, self).__init__()
         self._sectPr = sectPr
@@ -262,6 +266,8 @@ class Section(object):
 class _BaseHeaderFooter(BlockItemContainer):
     """Base class for header and footer classes"""
 
+    __slots__ = ('_sectPr', '_document_part', '_hdrftr_index')
+
     def __init__(self, sectPr, document_part, header_footer_index):
         self._sectPr = sectPr
         self._document_part = document_part
@@ -346,11 +352,18 @@ class _BaseHeaderFooter(BlockItemContainer):
         """True if this header/footer has a related part containing its definition."""
         raise NotImplementedError("must be implemented by each subclass")
 
+    @property
+    def _proxy_cache(self):
+        """|ProxyCache| of the header/footer part, |None| when proxy caching is off."""
+        return self.part._proxy_cache
+
     @property
     def _prior_headerfooter(self):
-        """|_Header| or |_Footer| proxy on prior sectPr element.
+        """|_Header| or |_Footer| proxy on sectPr element this one inherits from.
 
-        Returns None if this is first section.
+        This is the nearest prior section having a definition, or the first section
+        when no prior section has one, such that `_get_or_add_definition()` recurses at
+        most once. Returns None if this is first section.
         """
         raise NotImplementedError("must be implemented by each subclass")
 
@@ -365,6 +378,8 @@ class _Footer(_BaseHeaderFooter):
     leave an empty paragraph above the newly added one.
     """
 
+    __slots__ = ()
+
     def _add_definition(self):
         """Return newly-added footer part."""
         footer_part, rId = self._document_part.add_footer_part()
@@ -380,7 +395,7 @@ class _Footer(_BaseHeaderFooter):
     def _drop_definition(self):
         """Remove footer definition (footer part) associated with this section."""
         rId = self._sectPr.remove_footerReference(self._hdrftr_index)
-        self._document_part.drop_rel(rId)
+        self._document_part.drop_footer_part(rId)
 
     @property
     def _has_definition(self):
@@ -390,12 +405,14 @@ class _Footer(_BaseHeaderFooter):
 
     @property
     def _prior_headerfooter(self):
-        """|_Footer| proxy on prior sectPr element or None if this is first section."""
-        preceding_sectPr = self._sectPr.preceding_sectPr
+        """|_Footer| proxy on sectPr element inherited from or None if first section."""
+        source_sectPr = self._document_part.footer_source_sectPr(
+            self._sectPr, self._hdrftr_index
+        )
         return (
             None
-            if preceding_sectPr is None
-            else _Footer(preceding_sectPr, self._document_part, self._hdrftr_index)
+            if source_sectPr is None
+            else _Footer(source_sectPr, self._document_part, self._hdrftr_index)
         )
 
 
@@ -409,6 +426,8 @@ class _Header(_BaseHeaderFooter):
     leave an empty paragraph above the newly added one.
     """
 
+    __slots__ = ()
+
     def _add_definition(self):
         """Return newly-added header part."""
         header_part, rId = self._document_part.add_header_part()
@@ -434,10 +453,12 @@ class _Header(_BaseHeaderFooter):
 
     @property
     def _prior_headerfooter(self):
-        """|_Header| proxy on prior sectPr element or None if this is first section."""
-        preceding_sectPr = self._sectPr.preceding_sectPr
+        """|_Header| proxy on sectPr element inherited from or None if first section."""
+        source_sectPr = self._document_part.header_source_sectPr(
+            self._sectPr, self._hdrftr_index
+        )
         return (
             None
-            if preceding_sectPr is None
-            else _Header(preceding_sectPr, self._document_part, self._hdrftr_index)
+            if source_sectPr is None
+            else _Header(source_sectPr, self._document_part, self._hdrftr_index)
         )
@@ -19,6 +19,9 @@ class InlineShapes(Parented):
     Sequence of |InlineShape| instances, supporting len(), iteration, and
     indexed access.
     """
+
+    __slots__ = ('_body',)
+
     def __init__(self, body_elm, parent):
         super(InlineShapes, self).__init__(parent)
         self._body = body_elm
@@ -28,7 +31,7 @@ class InlineShapes(Parented):
         Provide indexed access, e.g. 'inline_shapes[idx]'
         """
         try:
-            inline = self._inline_lst[idx]
+            inline = self.part.inline_at(idx)
         except IndexError:
             msg = "inline shape index [%d] out of range" % idx
             raise IndexError(msg)
@@ -42,9 +45,7 @@ class InlineShapes(Parented):
 
     @property
     def _inline_lst(self):
-        body = self._body
-        xpath = '//w:p/w:r/w:drawing/wp:inline'
-        return body.xpath(xpath)
+        return self.part.inline_lst
 
 
 class InlineShape(object):
@@ -52,6 +53,9 @@ class InlineShape(object):
     Proxy for an ``<wp:inline>`` element, representing the container for an
     inline graphical object.
     """
+
+    __slots__ = ('_inline',)
+
     def __init__(self, inline):
         super(InlineShape, self).__init__()
         self._inline = inline
@@ -6,6 +6,8 @@ Objects shared by docx modules.
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import weakref
+
 
 class Length(int):
     """
@@ -238,6 +240,9 @@ class Parented(object):
     such as add or drop a relationship. Provides ``self._parent`` attribute
     to subclasses.
     """
+
+    __slots__ = ('_parent', '__weakref__')
+
     def __init__(self, parent):
         super(Parented, self).__init__()
         self._parent = parent
@@ -248,3 +253,58 @@ class Parented(object):
         The package part containing this object
         """
         return self._parent.part
+
+    def _proxy_factory(self, cls):
+        """
+        Return a callable taking an element and returning the *cls* proxy for
+        it, having this object as its parent. The proxy is reused from the
+        |ProxyCache| of the containing part when proxy caching is on.
+        """
+        cache = self._proxy_cache
+        if cache is None:
+            return lambda element: cls(element, self)
+        return lambda element: cache.proxy(cls, element, self)
+
+    @property
+    def _proxy_cache(self):
+        """
+        |ProxyCache| of the part containing this object, or |None| when
+        proxy caching is off.
+        """
+        return getattr(self._parent, '_proxy_cache', None)
+
+
+class ProxyCache(object):
+    """
+    Weak-value mapping of oxml element to the proxy object made for it, so
+    a traversal reaching an element whose proxy is still referenced elsewhere
+    returns that same object. An entry lasts only as long as its proxy does.
+    """
+
+    __slots__ = ('_proxies',)
+
+    def __init__(self):
+        super(ProxyCache, self).__init__()
+        self._proxies = weakref.WeakValueDictionary()
+
+    def __len__(self):
+        return len(self._proxies)
+
+    def clear(self):
+        """
+        Forget each proxy object held.
+        """
+        self._proxies.clear()
+
+    def proxy(self, cls, element, parent):
+        """
+        Return the *cls* proxy for *element*, newly made with *parent* when
+        none is held. A proxy held for *element* with another parent is left
+        in place and a new one, not held, is returned instead.
+        """
+        proxy = self._proxies.get(element)
+        if proxy is None or type(proxy) is not cls:
+            proxy = self._proxies[element] = cls(element, parent)
+        elif proxy._parent is not parent:
+            proxy = cls(element, parent)
+        return proxy
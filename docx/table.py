@@ -8,6 +8,7 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 from .blkcntnr import BlockItemContainer
 from .enum.style import WD_STYLE_TYPE
+from .oxml.ns import qn
 from .oxml.simpletypes import ST_Merge
 from .shared import Inches, lazyproperty, Parented
 
@@ -16,6 +17,9 @@ class Table(Parented):
     """
     Proxy class for a WordprocessingML ``<w:tbl>`` element.
     """
+
+    __slots__ = ('_tbl', '_element', '_columns', '_rows')
+
     def __init__(self, tbl, parent):
         super(Table, self).__init__(parent)
         self._element = self._tbl = tbl
@@ -42,7 +46,7 @@ class Table(Parented):
         for gridCol in tbl.tblGrid.gridCol_lst:
             tc = tr.add_tc()
             tc.width = gridCol.w
-        return _Row(tr, self)
+        return self._proxy_factory(_Row)(tr)
 
     @property
     def alignment(self):
@@ -96,14 +100,28 @@ class Table(Parented):
         """
         return _Columns(self._tbl, self)
 
+    def merge_ranges(self, ranges):
+        """
+        Return a list of merged |_Cell| objects, one for each rectangular
+        region in *ranges*, merged in the order given. Each item in *ranges*
+        is a `(row_idx, col_idx, row_idx_2, col_idx_2)` 4-tuple locating the
+        cells at two diagonal corners of the region, such that
+        ``table.merge_ranges([(0, 0, 1, 2)])`` has the same effect as
+        ``table.cell(0, 0).merge(table.cell(1, 2))``. The cell layout of the
+        table is mapped only once, making this much faster than merging
+        cells one at a time when many merges are made in the same table.
+        Raises |InvalidSpanError| if a region is not rectangular, leaving
+        any merges that precede it in *ranges* in place.
+        """
+        # ---merging moves cell content, which can reorder the story's shapes---
+        self.part.reset_inline_index()
+        return list(map(self._proxy_factory(_Cell), self._tbl.merge_ranges(ranges)))
+
     def row_cells(self, row_idx):
         """
         Sequence of cells in the row at *row_idx* in this table.
         """
-        column_count = self._column_count
-        start = row_idx * column_count
-        end = start + column_count
-        return self._cells[start:end]
+        return self._tr_cells(self._tbl.tr_lst[row_idx])
 
     @lazyproperty
     def rows(self):
@@ -166,6 +184,7 @@ class Table(Parented):
         are repeated.
         """
         col_count = self._column_count
+        new_cell = self._proxy_factory(_Cell)
         cells = []
         for tc in self._tbl.iter_tcs():
             for grid_span_idx in range(tc.grid_span):
@@ -174,7 +193,7 @@ class Table(Parented):
                 elif grid_span_idx > 0:
                     cells.append(cells[-1])
                 else:
-                    cells.append(_Cell(tc, self))
+                    cells.append(new_cell(tc))
         return cells
 
     @property
@@ -184,6 +203,50 @@ class Table(Parented):
         """
         return self._tbl.col_count
 
+    def _tr_cells(self, tr):
+        """
+        A sequence of |_Cell| objects, one for each grid column of *tr*,
+        arranged as they are in `_cells` but without laying out the rest of
+        the table. A cell vertically merged from above is resolved by
+        visiting only the rows above it that the merge spans.
+        """
+        cells, cell_for_tc = [], {}
+        new_cell = self._proxy_factory(_Cell)
+
+        def cell(tc):
+            if tc not in cell_for_tc:
+                cell_for_tc[tc] = new_cell(tc)
+            return cell_for_tc[tc]
+
+        for tc in tr.tc_lst:
+            for grid_span_idx in range(tc.grid_span):
+                if tc.vMerge == ST_Merge.CONTINUE:
+                    cells.append(cell(self._vMerge_top_tc(tr, len(cells))))
+                elif grid_span_idx > 0:
+                    cells.append(cells[-1])
+                else:
+                    cells.append(cell(tc))
+        return cells
+
+    @staticmethod
+    def _vMerge_top_tc(tr, grid_col):
+        """
+        The `w:tc` element at the top of the vertical merge that occupies
+        *grid_col* in *tr*. The continuation cell in *tr* itself is returned
+        when no row above it starts the merge. In a ragged table, the search
+        stops at the last cell found above which a row has no cell at
+        *grid_col*.
+        """
+        top_tc = tr.tc_spanning_grid_col(grid_col)
+        for tr_above in tr.itersiblings(qn('w:tr'), preceding=True):
+            if top_tc.vMerge != ST_Merge.CONTINUE:
+                break
+            tc_above = tr_above.tc_spanning_grid_col(grid_col)
+            if tc_above is None:
+                break
+            top_tc = tc_above
+        return top_tc
+
     @property
     def _tblPr(self):
         return self._tbl.tblPr
@@ -192,6 +255,8 @@ class Table(Parented):
 class _Cell(BlockItemContainer):
     """Table cell"""
 
+    __slots__ = ('_tc',)
+
     def __init__(self, tc, parent):
         super(_Cell, self).__init__(tc, parent)
         self._tc = self._element = tc
@@ -229,8 +294,10 @@ class _Cell(BlockItemContainer):
         |InvalidSpanError| if the cells do not define a rectangular region.
         """
         tc, tc_2 = self._tc, other_cell._tc
+        # ---merging moves cell content, which can reorder the story's shapes---
+        self.part.reset_inline_index()
         merged_tc = tc.merge(tc_2)
-        return _Cell(merged_tc, self._parent)
+        return self._parent._proxy_factory(_Cell)(merged_tc)
 
     @property
     def paragraphs(self):
@@ -264,6 +331,8 @@ class _Cell(BlockItemContainer):
         existing content or revisions are replaced.
         """
         tc = self._tc
+        if tc.xpath(".//w:drawing"):
+            self.part.reset_inline_index()
         tc.clear_content()
         p = tc.add_p()
         r = p.add_r()
@@ -303,6 +372,9 @@ class _Column(Parented):
     """
     Table column
     """
+
+    __slots__ = ('_gridCol',)
+
     def __init__(self, gridCol, parent):
         super(_Column, self).__init__(parent)
         self._gridCol = gridCol
@@ -344,16 +416,22 @@ class _Column(Parented):
 class _Columns(Parented):
     """
     Sequence of |_Column| instances corresponding to the columns in a table.
-    Supports ``len()``, iteration and indexed access.
+    Supports ``len()``, iteration, indexed access, and slicing.
     """
+
+    __slots__ = ('_tbl',)
+
     def __init__(self, tbl, parent):
         super(_Columns, self).__init__(parent)
         self._tbl = tbl
 
     def __getitem__(self, idx):
         """
-        Provide indexed access, e.g. 'columns[0]'
+        Provide indexed access, e.g. 'columns[0]', or sliced access, e.g.
+        'columns[1:3]'.
         """
+        if isinstance(idx, slice):
+            return [_Column(gridCol, self) for gridCol in self._gridCol_lst[idx]]
         try:
             gridCol = self._gridCol_lst[idx]
         except IndexError:
@@ -389,6 +467,9 @@ class _Row(Parented):
     """
     Table row
     """
+
+    __slots__ = ('_tr', '_element')
+
     def __init__(self, tr, parent):
         super(_Row, self).__init__(parent)
         self._tr = self._element = tr
@@ -398,7 +479,7 @@ class _Row(Parented):
         """
         Sequence of |_Cell| instances corresponding to cells in this row.
         """
-        return tuple(self.table.row_cells(self._index))
+        return tuple(self.table._tr_cells(self._tr))
 
     @property
     def height(self):
@@ -445,18 +526,27 @@ class _Rows(Parented):
     Sequence of |_Row| objects corresponding to the rows in a table.
     Supports ``len()``, iteration, indexed access, and slicing.
     """
+
+    __slots__ = ('_tbl',)
+
     def __init__(self, tbl, parent):
         super(_Rows, self).__init__(parent)
         self._tbl = tbl
 
     def __getitem__(self, idx):
         """
-        Provide indexed access, (e.g. 'rows[0]')
+        Provide indexed access, (e.g. 'rows[0]') or sliced access, (e.g.
+        'rows[1:3]'). Only the rows selected are wrapped in a |_Row| object.
         """
-        return list(self)[idx]
+        tr_lst = self._tbl.tr_lst
+        new_row = self._new_row
+        if isinstance(idx, slice):
+            return [new_row(tr) for tr in tr_lst[idx]]
+        return new_row(tr_lst[idx])
 
     def __iter__(self):
-        return (_Row(tr, self) for tr in self._tbl.tr_lst)
+        new_row = self._new_row
+        return (new_row(tr) for tr in self._tbl.tr_lst)
 
     def __len__(self):
         return len(self._tbl.tr_lst)
@@ -467,3 +557,12 @@ class _Rows(Parented):
         Reference to the |Table| object this row collection belongs to.
         """
         return self._parent.table
+
+    @property
+    def _new_row(self):
+        """
+        Callable returning the |_Row| proxy for a `w:tr` element. Its parent
+        is the table, as for a row made by `Table.add_row()`, so the proxy
+        cache returns the same row whichever way it is reached.
+        """
+        return self._parent._proxy_factory(_Row)
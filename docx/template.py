@@ -0,0 +1,227 @@
+# encoding: utf-8
+
+"""Precompiled document templates for rendering many documents from data records."""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import re
+from copy import deepcopy
+
+from docx.opc.part import XmlPart
+from docx.oxml.ns import qn
+from docx.oxml.text.textmap import TextMap
+
+# ---matches a placeholder like `{{ name }}` or `{{ items.price }}`---
+PLACEHOLDER_PATTERN = r"\{\{\s*([\w.]+)\s*\}\}"
+
+
+def compile_template(document, list_fields=(), pattern=PLACEHOLDER_PATTERN):
+    """Return a |Template| for rendering copies of *document* filled from data records.
+
+    Each match of *pattern* in the text of *document* is a placeholder, including
+    a placeholder split across runs. The first group of *pattern* names the field of
+    a record that fills it. A dotted name, like "customer.name", fills from a nested
+    mapping. The body, including tables, and each header and footer are searched.
+
+    A table row holding a placeholder named "field.key", where "field" is one of
+    *list_fields*, is repeated for each item of the list in that field of a record,
+    with "key" filled from the item. *document* is not changed.
+    """
+    return Template(document.part.package, re.compile(pattern), frozenset(list_fields))
+
+
+class Template(object):
+    """A document with the location of each of its placeholders recorded.
+
+    Placeholders are located once, when the template is compiled. Rendering a record
+    copies the parsed parts of the template and rewrites only the `w:t` elements
+    holding placeholders, so it does not search the document again.
+    """
+
+    def __init__(self, package, regex, list_fields):
+        super(Template, self).__init__()
+        self._package = _clone_package(package)
+        self._regex = regex
+        self._list_fields = list_fields
+        self._t_fills = []
+        self._row_fills = []
+        for story_part in self._package.main_document_part.iter_story_parts():
+            self._compile_story(story_part.partname, story_part.element)
+
+    @property
+    def fields(self):
+        """Set of the field names of the placeholders in this template."""
+        fields = set()
+        for _, _, segments in self._t_fills:
+            fields.update(name for _, name in segments if name is not None)
+        for _, _, list_field, cell_fills in self._row_fills:
+            fields.add(list_field)
+            for _, segments in cell_fills:
+                fields.update(name for _, name in segments if name is not None)
+        return fields
+
+    def render(self, record):
+        """Return a new |Document| made from this template, filled from *record*.
+
+        *record* is a mapping from field name to value; each value is converted with
+        `str()`. A list field is a sequence of mappings, one per repeated table row.
+        Raises |KeyError| when *record* lacks a field of a placeholder.
+        """
+        package = _clone_package(self._package)
+        roots = {
+            story_part.partname: story_part.element
+            for story_part in package.main_document_part.iter_story_parts()
+        }
+        # ---all elements are located before any row is added, which would shift
+        #    the locations of the elements following it---
+        t_fills = [
+            (_element_at(roots[partname], path), segments)
+            for partname, path, segments in self._t_fills
+        ]
+        row_fills = [
+            (_element_at(roots[partname], path), list_field, cell_fills)
+            for partname, path, list_field, cell_fills in self._row_fills
+        ]
+
+        for t, segments in t_fills:
+            t.set_text(_fill(segments, record))
+        for tr, list_field, cell_fills in row_fills:
+            for item in _lookup(record, list_field):
+                new_tr = deepcopy(tr)
+                for path, segments in cell_fills:
+                    text = _fill(segments, record, list_field, item)
+                    _element_at(new_tr, path).set_text(text)
+                tr.addprevious(new_tr)
+            tr.getparent().remove(tr)
+
+        return package.main_document_part.document
+
+    def _compile_story(self, partname, root):
+        """Record the location of each placeholder in story element *root*."""
+        regex = self._regex
+        rows = {}
+        for p in root.iter(qn("w:p")):
+            text_map = TextMap(p)
+            if regex.search(text_map.text) is None:
+                continue
+            # ---gather the text of each placeholder into a single `w:t`---
+            text_map.replace(regex, lambda match: match.group(0))
+            for t in p.xpath("./w:r/w:t | ./w:hyperlink/w:r/w:t"):
+                segments = _segments(t.text or "", regex)
+                if segments is None:
+                    continue
+                tr, list_field = self._repeating_row(t, segments)
+                if tr is None:
+                    self._t_fills.append((partname, _path(root, t), segments))
+                    continue
+                if tr not in rows:
+                    rows[tr] = (list_field, [])
+                    self._row_fills.append(
+                        (partname, _path(root, tr), list_field, rows[tr][1])
+                    )
+                rows[tr][1].append((_path(tr, t), segments))
+
+    def _repeating_row(self, t, segments):
+        """Return (tr, list_field) pair for the row repeated for *t*, or (None, None).
+
+        The row is the innermost `w:tr` element holding *t* when one of the
+        placeholders in *segments* names a list field.
+        """
+        for _, name in segments:
+            list_field = None if name is None else name.split(".")[0]
+            if list_field in self._list_fields and "." in name:
+                for tr in t.iterancestors(qn("w:tr")):
+                    return tr, list_field
+                raise ValueError(
+                    "placeholder '%s' of list field is not in a table row" % name
+                )
+        return None, None
+
+
+def _clone_package(package):
+    """Return a new package having a copy of each part and relationship of *package*.
+
+    XML parts get a deep copy of their element tree, so the copy is not parsed again.
+    Other parts share the blob of the original, which is never changed in place.
+    """
+    clone = type(package)()
+    parts = {}
+    for part in package.iter_parts():
+        part_cls = type(part)
+        if isinstance(part, XmlPart):
+            parts[part] = part_cls(
+                part.partname, part.content_type, deepcopy(part.element), clone
+            )
+        else:
+            parts[part] = part_cls.load(
+                part.partname, part.content_type, part.blob, clone
+            )
+    for source, clone_source in [(package, clone)] + list(parts.items()):
+        for rel in source.rels.values():
+            target = rel.target_ref if rel.is_external else parts[rel.target_part]
+            clone_source.load_rel(rel.reltype, target, rel.rId, rel.is_external)
+    for clone_part in parts.values():
+        clone_part.after_unmarshal()
+    clone.after_unmarshal()
+    return clone
+
+
+def _element_at(root, path):
+    """Return the element reached from *root* by the child indices in *path*."""
+    elm = root
+    for idx in path:
+        elm = elm[idx]
+    return elm
+
+
+def _fill(segments, record, list_field=None, item=None):
+    """Return text of *segments* with each placeholder filled from *record*.
+
+    A placeholder of *list_field* is filled from *item* instead.
+    """
+    texts = []
+    for literal, name in segments:
+        if name is None:
+            texts.append(literal)
+        elif list_field is not None and name.split(".")[0] == list_field:
+            texts.append("%s" % _lookup(item, name.split(".", 1)[1]))
+        else:
+            texts.append("%s" % _lookup(record, name))
+    return "".join(texts)
+
+
+def _lookup(mapping, name):
+    """Return the value of dotted field *name* in nested *mapping*."""
+    value = mapping
+    for key in name.split("."):
+        value = value[key]
+    return value
+
+
+def _path(root, elm):
+    """Return tuple of the child indices leading from *root* down to *elm*."""
+    path = []
+    while elm is not root:
+        parent = elm.getparent()
+        path.append(parent.index(elm))
+        elm = parent
+    return tuple(reversed(path))
+
+
+def _segments(text, regex):
+    """Return list of (literal, name) pairs for *text*, or |None| if no placeholder.
+
+    Each pair has the literal text of a segment and |None| as its name, or an empty
+    literal and the field name of a placeholder.
+    """
+    segments, end = [], 0
+    for match in regex.finditer(text):
+        if match.start() > end:
+            segments.append((text[end:match.start()], None))
+        segments.append(("", match.group(1)))
+        end = match.end()
+    if not segments:
+        return None
+    if end < len(text):
+        segments.append((text[end:], None))
+    return segments
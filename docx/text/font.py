@@ -8,8 +8,11 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from copy import deepcopy
+
 from ..dml.color import ColorFormat
-from ..shared import ElementProxy
+from ..oxml import OxmlElement
+from ..shared import ElementProxy, RGBColor
 
 
 class Font(ElementProxy):
@@ -409,3 +412,67 @@ class Font(ElementProxy):
         """
         rPr = self._element.get_or_add_rPr()
         rPr._set_bool_val(name, value)
+
+
+class RunFormat(object):
+    """
+    Character formatting built once and applied to any number of runs.
+
+    Each keyword argument names a writable |Font| property, like
+    ``RunFormat(bold=True, size=Pt(9), name="Consolas")``, and is validated
+    as assigning it to a |Font| would be. *color* may also be given, as an
+    |RGBColor| or a member of :ref:`MsoThemeColorIndex`. A property given as
+    |None| is removed from each run, as assigning |None| to it would; |False|
+    turns a property off. The formatting is kept as a template ``<w:rPr>``
+    element; applying it copies that element rather than setting each
+    property again.
+    """
+
+    def __init__(self, **properties):
+        super(RunFormat, self).__init__()
+        r = OxmlElement('w:r')
+        font = Font(r)
+        for name, value in properties.items():
+            if name == 'color':
+                _set_color(font.color, value)
+                continue
+            prop = getattr(Font, name, None)
+            if not isinstance(prop, property) or prop.fset is None:
+                raise TypeError("'%s' is not a writable Font property" % name)
+            setattr(font, name, value)
+        rPr = r.rPr
+        self._rPr = OxmlElement('w:rPr') if rPr is None else rPr
+        self._cleared = tuple(
+            name for name, value in properties.items() if value is None
+        )
+
+    def apply(self, run):
+        """
+        Apply this formatting to *run*, a |Run| object, and return *run*.
+        Properties this formatting sets replace those directly applied to
+        *run* and those it gives as |None| are removed; other properties of
+        *run*, like its character style, are kept.
+        """
+        font = run.font
+        for name in self._cleared:
+            if name == 'color':
+                _set_color(font.color, None)
+            else:
+                setattr(font, name, None)
+        r = run._r
+        rPr = r.rPr
+        if rPr is None:
+            r._insert_rPr(deepcopy(self._rPr))
+        else:
+            rPr.merge(self._rPr)
+        return run
+
+
+def _set_color(color_format, value):
+    """
+    Assign *value*, an |RGBColor| or theme color, to *color_format*.
+    """
+    if value is None or isinstance(value, RGBColor):
+        color_format.rgb = value
+    else:
+        color_format.theme_color = value
@@ -18,21 +18,27 @@ class Paragraph(Parented):
     """
     Proxy object wrapping ``<w:p>`` element.
     """
+
+    __slots__ = ('_p', '_element')
+
     def __init__(self, p, parent):
         super(Paragraph, self).__init__(parent)
         self._p = self._element = p
 
-    def add_run(self, text=None, style=None):
+    def add_run(self, text=None, style=None, format=None):
         """
         Append a run to this paragraph containing *text* and having character
         style identified by style ID *style*. *text* can contain tab
         (``\\t``) characters, which are converted to the appropriate XML form
         for a tab. *text* can also include newline (``\\n``) or carriage
         return (``\\r``) characters, each of which is converted to a line
-        break.
+        break. *format* is an optional |RunFormat| object whose character
+        formatting is directly applied to the new run.
         """
         r = self._p.add_r()
-        run = Run(r, self)
+        run = self._proxy_factory(Run)(r)
+        if format is not None:
+            format.apply(run)
         if text:
             run.text = text
         if style:
@@ -59,6 +65,8 @@ class Paragraph(Parented):
         Return this same paragraph after removing all its content.
         Paragraph-level formatting, such as style, is preserved.
         """
+        if self._p.xpath(".//w:drawing"):
+            self.part.reset_inline_index()
         self._p.clear_content()
         return self
 
@@ -76,6 +84,18 @@ class Paragraph(Parented):
             paragraph.style = style
         return paragraph
 
+    def normalize_runs(self):
+        """
+        Return this same paragraph after merging each run into the run
+        before it when both have the same character formatting and hold only
+        text, tabs and breaks. Adjacent text elements are joined, and empty
+        runs, proofing marks and rendered page break markers are removed.
+        The text and its formatting are unchanged. |Run| objects obtained
+        before the call may no longer be part of the paragraph.
+        """
+        self._p.normalize_runs()
+        return self
+
     @property
     def paragraph_format(self):
         """
@@ -90,7 +110,7 @@ class Paragraph(Parented):
         Sequence of |Run| instances corresponding to the <w:r> elements in
         this paragraph.
         """
-        return [Run(r, self) for r in self._p.r_lst]
+        return list(map(self._proxy_factory(Run), self._p.r_lst))
 
     @property
     def style(self):
@@ -142,4 +162,4 @@ class Paragraph(Parented):
         paragraph.
         """
         p = self._p.add_p_before()
-        return Paragraph(p, self._parent)
+        return self._parent._proxy_factory(Paragraph)(p)
@@ -8,7 +8,10 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from copy import deepcopy
+
 from ..enum.text import WD_LINE_SPACING
+from ..oxml import OxmlElement
 from ..shared import ElementProxy, Emu, lazyproperty, Length, Pt, Twips
 from .tabstops import TabStops
 
@@ -301,3 +304,56 @@ class ParagraphFormat(ElementProxy):
             if line == Twips(480):
                 return WD_LINE_SPACING.DOUBLE
         return lineRule
+
+
+class ParagraphFormatSpec(object):
+    """
+    Paragraph formatting built once and applied to any number of paragraphs.
+
+    Each keyword argument names a writable |ParagraphFormat| property, like
+    ``ParagraphFormatSpec(space_after=Pt(6), keep_with_next=True)``, and is
+    validated as assigning it to a |ParagraphFormat| would be. Properties
+    are set in the order given, which matters for `line_spacing` and
+    `line_spacing_rule`. A property given as |None| is removed from each
+    paragraph, as assigning |None| to it would; |False| turns a property
+    off. The formatting is kept as a template ``<w:pPr>`` element; applying
+    it copies that element rather than setting each property again.
+    """
+
+    def __init__(self, **properties):
+        super(ParagraphFormatSpec, self).__init__()
+        p = OxmlElement('w:p')
+        paragraph_format = ParagraphFormat(p)
+        for name, value in properties.items():
+            prop = getattr(ParagraphFormat, name, None)
+            if not isinstance(prop, property) or prop.fset is None:
+                raise TypeError(
+                    "'%s' is not a writable ParagraphFormat property" % name
+                )
+            setattr(paragraph_format, name, value)
+        pPr = p.pPr
+        self._pPr = OxmlElement('w:pPr') if pPr is None else pPr
+        self._cleared = tuple(
+            name for name, value in properties.items() if value is None
+        )
+
+    def apply(self, paragraph):
+        """
+        Apply this formatting to *paragraph*, a |Paragraph| object, and
+        return *paragraph*. Properties this formatting sets replace those
+        directly applied to *paragraph* and those it gives as |None| are
+        removed; others, like its style, numbering and any section
+        properties it holds, are kept, including properties held in the same
+        element as one it sets, like `space_after` when it sets
+        `line_spacing`.
+        """
+        paragraph_format = paragraph.paragraph_format
+        for name in self._cleared:
+            setattr(paragraph_format, name, None)
+        p = paragraph._p
+        pPr = p.pPr
+        if pPr is None:
+            p._insert_pPr(deepcopy(self._pPr))
+        else:
+            pPr.merge(self._pPr)
+        return paragraph
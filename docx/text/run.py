@@ -21,6 +21,9 @@ class Run(Parented):
     not specified directly on the run and its effective value is taken from
     the style hierarchy.
     """
+
+    __slots__ = ('_r', '_element', 'element')
+
     def __init__(self, r, parent):
         super(Run, self).__init__(parent)
         self._r = self._element = self.element = r
@@ -61,6 +64,7 @@ class Run(Parented):
         """
         inline = self.part.new_pic_inline(image_path_or_stream, width, height)
         self._r.add_drawing(inline)
+        self.part.index_inline(inline)
         return InlineShape(inline)
 
     def add_tab(self):
@@ -96,6 +100,8 @@ class Run(Parented):
         Return reference to this run after removing all its content. All run
         formatting is preserved.
         """
+        if self._r.xpath("./w:drawing"):
+            self.part.reset_inline_index()
         self._r.clear_content()
         return self
 
@@ -160,6 +166,8 @@ class Run(Parented):
 
     @text.setter
     def text(self, text):
+        if self._r.xpath("./w:drawing"):
+            self.part.reset_inline_index()
         self._r.text = text
 
     @property
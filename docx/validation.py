@@ -0,0 +1,256 @@
+# encoding: utf-8
+
+"""Validation of the XML parts of a document against the WordprocessingML schemas.
+
+The schemas are the XSD files of ECMA-376 in the `ref/xsd` directory of the
+python-docx source tree, which is not installed with the package; another directory
+holding them can be given instead. Compiling them takes around a tenth of a second,
+far longer than validating a typical part, so each thread validating parts compiles
+them once and keeps them for the life of the process. Parts are validated on a pool
+of worker threads kept for the same reason; lxml releases the GIL while it
+validates.
+
+Parts are checked as Word reads them, after Markup Compatibility processing:
+elements and attributes in a namespace a part declares ignorable, like the Word
+2010 `w14` extensions, are set aside, and the fallback of each
+`mc:AlternateContent` element stands in for it. Parts whose root element is not in
+a namespace of the schemas, like the core properties, are not checked.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import copy
+import os
+import threading
+
+from lxml import etree
+
+from docx.compat import Unicode
+from docx.opc.part import XmlPart
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:  # pragma: no cover
+    # ---Python 2 without the `futures` backport---
+    ThreadPoolExecutor = None
+
+try:
+    from urllib.request import pathname2url
+except ImportError:  # pragma: no cover
+    from urllib import pathname2url
+
+# ---default location of the schemas, the `ref/xsd` directory of a source tree---
+SCHEMA_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ref", "xsd"
+)
+
+_MC = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+_MC_ALTERNATE_CONTENT = "{%s}AlternateContent" % _MC
+_MC_FALLBACK = "{%s}Fallback" % _MC
+_MC_IGNORABLE = "{%s}Ignorable" % _MC
+
+_declaring_ignorable = etree.XPath("//*[@mc:Ignorable]", namespaces={"mc": _MC})
+
+# ---target namespace and schema file of each part vocabulary checked---
+_SCHEMAS = (
+    ("http://schemas.openxmlformats.org/wordprocessingml/2006/main", "wml.xsd"),
+    ("http://schemas.openxmlformats.org/drawingml/2006/main", "dml-main.xsd"),
+    (
+        "http://schemas.openxmlformats.org/officeDocument/2006/extended-properties",
+        "shared-documentPropertiesExtended.xsd",
+    ),
+)
+
+# ---the schemas import the `xml` namespace without giving a location for it---
+_XML_NAMESPACE_XSD = b"""\
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
+           targetNamespace="http://www.w3.org/XML/1998/namespace">
+  <xs:attribute name="lang" type="xs:language"/>
+  <xs:attribute name="space">
+    <xs:simpleType>
+      <xs:restriction base="xs:NCName">
+        <xs:enumeration value="default"/>
+        <xs:enumeration value="preserve"/>
+      </xs:restriction>
+    </xs:simpleType>
+  </xs:attribute>
+  <xs:attribute name="base" type="xs:anyURI"/>
+  <xs:attribute name="id" type="xs:ID"/>
+</xs:schema>
+"""
+
+_MAX_WORKERS = 4
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def validate(document, schema_dir=None):
+    """Return list of |SchemaViolation| objects for the XML parts of *document*.
+
+    The list is empty when each part is valid. *schema_dir* is the directory holding
+    the ECMA-376 XSD files, `SCHEMA_DIR` when |None|. Validating reads the element
+    tree of each part without sharing it, so a part keeps the serialized XML it holds.
+    """
+    if ThreadPoolExecutor is None:  # pragma: no cover
+        raise ImportError(
+            "validating a document on Python 2 requires the 'futures' package"
+        )
+    schema_dir = os.path.abspath(SCHEMA_DIR if schema_dir is None else schema_dir)
+    if not os.path.isfile(os.path.join(schema_dir, _SCHEMAS[0][1])):
+        raise IOError(
+            "no WordprocessingML schemas in '%s', expected the ECMA-376 XSD files "
+            "of the 'ref/xsd' directory of the python-docx source tree; pass the "
+            "directory holding them as *schema_dir*" % schema_dir
+        )
+    namespaces = frozenset(namespace for namespace, _ in _SCHEMAS)
+    parts = [
+        part
+        for part in document.part.package.iter_parts()
+        if isinstance(part, XmlPart)
+        and etree.QName(part._element).namespace in namespaces
+    ]
+    results = _pool().map(lambda part: _validate_part(part, schema_dir), parts)
+    return [violation for violations in results for violation in violations]
+
+
+class SchemaViolation(object):
+    """One way a part of a document does not conform to the schemas."""
+
+    def __init__(self, partname, path, message):
+        super(SchemaViolation, self).__init__()
+        self._partname = partname
+        self._path = path
+        self._message = message
+
+    def __repr__(self):
+        return "SchemaViolation(%r, %r, %r)" % (
+            self._partname,
+            self._path,
+            self._message,
+        )
+
+    def __str__(self):
+        return "%s:%s: %s" % (self._partname, self._path, self._message)
+
+    @property
+    def message(self):
+        """Description of the violation, as reported by libxml2."""
+        return self._message
+
+    @property
+    def partname(self):
+        """|PackURI| partname of the part, like "/word/document.xml"."""
+        return self._partname
+
+    @property
+    def path(self):
+        """XPath of the offending element in the part, like "/w:document/w:body/w:p[3]".
+
+        Positions are counted after Markup Compatibility processing, so can be lower
+        than in the part when it holds ignorable elements.
+        """
+        return self._path
+
+
+class _XmlNamespaceResolver(etree.Resolver):
+    """Provides the schema of the `xml` namespace the OOXML schemas import."""
+
+    def resolve(self, system_url, public_id, context):
+        if system_url.endswith("xml.xsd"):
+            return self.resolve_string(_XML_NAMESPACE_XSD, context)
+        return None
+
+
+class _Schemas(threading.local):
+    """The schemas compiled in each thread, by schema directory.
+
+    A compiled schema is not shared between threads because lxml collects the
+    errors of each validation in the schema object.
+    """
+
+    def __init__(self):
+        super(_Schemas, self).__init__()
+        self.by_dir = {}
+
+    def get(self, schema_dir):
+        """Return |XMLSchema| for the schemas in *schema_dir*, compiled if need be."""
+        schema = self.by_dir.get(schema_dir)
+        if schema is None:
+            schema = self.by_dir[schema_dir] = _compile(schema_dir)
+        return schema
+
+
+_schemas = _Schemas()
+
+
+def _compile(schema_dir):
+    """Return |XMLSchema| combining the OOXML schemas in *schema_dir*."""
+    base_url = "file:%s/" % pathname2url(schema_dir)
+    imports = "".join(
+        '<xsd:import namespace="%s" schemaLocation="%s%s"/>'
+        % (namespace, base_url, filename)
+        for namespace, filename in _SCHEMAS
+    )
+    driver = (
+        '<xsd:schema xmlns:xsd="http://www.w3.org/2001/XMLSchema">'
+        '<xsd:import namespace="http://www.w3.org/XML/1998/namespace"'
+        ' schemaLocation="xml.xsd"/>%s</xsd:schema>' % imports
+    )
+    parser = etree.XMLParser()
+    parser.resolvers.add(_XmlNamespaceResolver())
+    return etree.XMLSchema(
+        etree.fromstring(driver.encode("utf-8"), parser, base_url=base_url)
+    )
+
+
+def _pool():
+    """Return the executor validating parts, created on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(_MAX_WORKERS)
+        return _executor
+
+
+def _understood(element):
+    """Return *element*, or a copy of it, after Markup Compatibility processing.
+
+    *element* itself is returned when it uses no Markup Compatibility markup.
+    """
+    if (
+        not _declaring_ignorable(element)
+        and next(element.iter(_MC_ALTERNATE_CONTENT), None) is None
+    ):
+        return element
+    element = copy.deepcopy(element)
+    ignorable = set()
+    for elm in _declaring_ignorable(element):
+        for prefix in elm.get(_MC_IGNORABLE).split():
+            if prefix in elm.nsmap:
+                ignorable.add(elm.nsmap[prefix])
+        del elm.attrib[_MC_IGNORABLE]
+    for alternate_content in list(element.iter(_MC_ALTERNATE_CONTENT)):
+        fallback = alternate_content.find(_MC_FALLBACK)
+        for child in [] if fallback is None else list(fallback):
+            alternate_content.addprevious(child)
+        alternate_content.getparent().remove(alternate_content)
+    for elm in list(element.iter(etree.Element)):
+        if etree.QName(elm).namespace in ignorable:
+            elm.getparent().remove(elm)
+            continue
+        for name in list(elm.attrib):
+            if etree.QName(name).namespace in ignorable:
+                del elm.attrib[name]
+    return element
+
+
+def _validate_part(part, schema_dir):
+    """Return list of |SchemaViolation| objects for XML *part*."""
+    schema = _schemas.get(schema_dir)
+    if schema.validate(_understood(part._element)):
+        return []
+    return [
+        SchemaViolation(part.partname, Unicode(error.path), Unicode(error.message))
+        for error in schema.error_log
+    ]
@@ -35,7 +35,8 @@ LICENSE = text_of("LICENSE")
 PACKAGES = find_packages(exclude=["tests", "tests.*"])
 PACKAGE_DATA = {"docx": ["templates/*.xml", "templates/*.docx"]}
 
-INSTALL_REQUIRES = ["lxml>=2.3.2"]
+INSTALL_REQUIRES = ["lxml>=2.3.2", 'futures>=3.0; python_version < "3"']
+EXTRAS_REQUIRE = {"images": ["Pillow"]}
 TEST_SUITE = "tests"
 TESTS_REQUIRE = ["behave", "mock", "pyparsing", "pytest"]
 
@@ -73,6 +74,7 @@ params = {
     "packages": PACKAGES,
     "package_data": PACKAGE_DATA,
     "install_requires": INSTALL_REQUIRES,
+    "extras_require": EXTRAS_REQUIRE,
     "tests_require": TESTS_REQUIRE,
     "test_suite": TEST_SUITE,
     "classifiers": CLASSIFIERS,
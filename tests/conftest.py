@@ -0,0 +1,8 @@
+# encoding: utf-8
+
+"""pytest configuration for the unit test suite"""
+
+import sys
+
+# ---the asyncio support, and its tests, use syntax added in Python 3.5---
+collect_ignore = [] if sys.version_info >= (3, 5) else ["test_aio.py"]
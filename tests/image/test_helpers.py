@@ -31,6 +31,24 @@ class DescribeStreamReader(object):
         long_ = stream_rdr.read_long(offset)
         assert long_ == expected_int
 
+    def it_can_find_bytes_at_or_after_an_offset(self):
+        stream_rdr = StreamReader(BytesIO(b'\xFF\x00\xFF\x01\xFF'), BIG_ENDIAN, 1)
+
+        assert stream_rdr.find(b'\xFF', 0) == 1
+        assert stream_rdr.find(b'\xFF', 1, 1) == 3
+        with pytest.raises(UnexpectedEndOfFileError):
+            stream_rdr.find(b'\xFE', 0)
+
+    def it_reads_without_seeking_in_the_stream(self):
+        stream = BytesIO(b'\x01\x02foobar\x03\x04')
+        stream_rdr = StreamReader(stream, BIG_ENDIAN)
+
+        stream_rdr.seek(2)
+
+        assert stream_rdr.read(6) == b'foobar'
+        assert stream_rdr.tell() == 8
+        assert stream.tell() == 0
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=[
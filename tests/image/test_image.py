@@ -37,7 +37,7 @@ class DescribeImage(object):
         image = Image.from_blob(blob_)
 
         BytesIO_.assert_called_once_with(blob_)
-        _from_stream_.assert_called_once_with(stream_, blob_)
+        _from_stream_.assert_called_once_with(stream_, blob_, None)
         assert image is image_
 
     def it_can_construct_from_an_image_path(self, from_path_fixture):
@@ -0,0 +1,91 @@
+# encoding: utf-8
+
+"""Unit test suite for the docx.image.policy module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from io import BytesIO
+
+import pytest
+
+import docx
+from docx.image.image import Image
+from docx.image.policy import ImagePolicy
+from docx.shared import Inches
+
+from ..unitutil.file import test_file
+
+
+class DescribeImagePolicy(object):
+
+    def it_is_a_hashable_value(self):
+        policy = ImagePolicy(max_dpi=150, jpeg_quality=80)
+
+        assert policy == ImagePolicy(max_dpi=150, jpeg_quality=80)
+        assert policy != ImagePolicy(max_dpi=150)
+        assert hash(policy) == hash(ImagePolicy(max_dpi=150, jpeg_quality=80))
+
+    @pytest.mark.parametrize("kwargs", [{"max_dpi": 0}, {"jpeg_quality": 96}])
+    def it_validates_its_limits(self, kwargs):
+        with pytest.raises(ValueError):
+            ImagePolicy(**kwargs)
+
+    @pytest.mark.parametrize(
+        "width, height, expected_value",
+        [
+            (Inches(1), None, (100, 68)),
+            (Inches(1), Inches(2), (100, 200)),
+            (None, None, (287, 193)),
+            (Inches(10), None, None),
+        ],
+    )
+    def it_knows_the_size_an_image_is_resampled_to(
+        self, width, height, expected_value
+    ):
+        # ---300-dpi.png is 860 x 579 px at 300 dpi---
+        image = Image.from_file(test_file("300-dpi.png"))
+        policy = ImagePolicy(max_dpi=100)
+
+        assert policy.target_px_size(image, width, height) == expected_value
+
+    @pytest.mark.parametrize(
+        "filename, expected_content_type",
+        [("exif-420-dpi.jpg", "image/jpeg"), ("300-dpi.TIF", "image/png")],
+    )
+    def it_can_resample_an_image(self, filename, expected_content_type):
+        pytest.importorskip("PIL")
+        image = Image.from_file(test_file(filename))
+        policy = ImagePolicy(max_dpi=96, jpeg_quality=70)
+
+        resampled = policy.transform(image, 60, 40)
+
+        assert resampled.content_type == expected_content_type
+        assert (resampled.px_width, resampled.px_height) == (60, 40)
+        assert (resampled.horz_dpi, resampled.vert_dpi) == (96, 96)
+        assert resampled.filename.split(".")[0] == filename.split(".")[0]
+        assert Image.from_blob(resampled.blob).sha1 == resampled.sha1
+
+    def it_keeps_an_image_it_cannot_resample(self):
+        pytest.importorskip("PIL")
+        with open(test_file("300-dpi.png"), "rb") as f:
+            blob = bytearray(f.read())
+        idat = blob.index(b"IDAT") + 4
+        blob[idat:idat + 50] = bytearray(50)
+        image = Image.from_blob(bytes(blob))
+
+        assert ImagePolicy(max_dpi=96).transform(image, 60, 40) is image
+
+    def it_keeps_the_shown_size_of_an_added_picture(self):
+        pytest.importorskip("PIL")
+        document = docx.Document()
+        document.image_policy = ImagePolicy(max_dpi=50)
+        with open(test_file("300-dpi.png"), "rb") as f:
+            blob = f.read()
+
+        inline_shape = document.add_picture(BytesIO(blob), width=Inches(2))
+        document.add_picture(BytesIO(blob), width=Inches(2))
+
+        image_parts = document.part.package.image_parts
+        assert len(image_parts) == 1
+        assert next(iter(image_parts)).image.px_width == 100
+        assert inline_shape.width == Inches(2)
@@ -0,0 +1,73 @@
+# encoding: utf-8
+
+"""Unit test suite for the docx.opc.instrument module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from io import BytesIO
+
+import pytest
+
+import docx
+from docx.opc import instrument
+from docx.opc.instrument import PhaseEvent, add_hook, emit, remove_hook, start
+
+from ..unitutil.file import test_file
+
+
+class DescribeInstrumentHooks(object):
+
+    def it_reads_no_clock_when_no_hook_is_registered(self):
+        assert start() is None
+
+    def it_calls_each_hook_when_a_phase_completes(self, hooks_):
+        events = []
+        add_hook(events.append)
+
+        emit("part.parse", start(), partname="/word/document.xml", size=42)
+
+        event = events[0]
+        assert isinstance(event, PhaseEvent)
+        assert event.phase == "part.parse"
+        assert event.duration >= 0.0
+        assert event.details == {"partname": "/word/document.xml", "size": 42}
+
+    def it_can_stop_calling_a_hook(self, hooks_):
+        events = []
+        add_hook(events.append)
+        remove_hook(events.append)
+
+        assert start() is None
+        with pytest.raises(ValueError):
+            remove_hook(events.append)
+
+    def it_reports_the_phases_of_opening_and_saving(self, hooks_):
+        events = []
+        add_hook(events.append)
+
+        document = docx.Document(test_file("test.docx"))
+        document.add_picture(test_file("monty-truth.png"))
+        document.add_picture(test_file("monty-truth.png"))
+        document.save(BytesIO())
+
+        phases = [event.phase for event in events]
+        parse = next(
+            e for e in events if e.details.get("partname") == "/word/document.xml"
+        )
+        assert parse.details["element_count"] > 0
+        assert phases.index("package.unmarshal") < phases.index("package.open")
+        assert [e.details["is_new"] for e in events if e.phase == "image.add"] == [
+            True,
+            False,
+        ]
+        assert phases[-1] == "package.write"
+        assert phases.count("part.serialize") == events[-1].details["part_count"]
+
+
+# fixtures -----------------------------------------------------------
+
+@pytest.fixture
+def hooks_(request):
+    def restore(hooks=list(instrument._hooks)):
+        instrument._hooks[:] = hooks
+    request.addfinalizer(restore)
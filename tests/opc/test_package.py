@@ -4,6 +4,8 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import pickle
+
 import pytest
 
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
@@ -14,7 +16,9 @@ from docx.opc.part import Part
 from docx.opc.parts.coreprops import CorePropertiesPart
 from docx.opc.pkgreader import PackageReader
 from docx.opc.rel import _Relationship, Relationships
+from docx.package import Package
 
+from ..unitutil.file import test_file
 from ..unitutil.mock import (
     call,
     class_mock,
@@ -115,6 +119,96 @@ class DescribeOpcPackage(object):
         PackURI_.assert_called_once_with(expected_value)
         assert partname is packuri_
 
+    def it_walks_the_parts_only_once_per_partname_template(self, request, iter_parts_):
+        iter_parts_.return_value = iter(
+            [
+                instance_mock(request, Part, partname="/foo/bar/baz%d.xml" % n)
+                for n in (1, 3)
+            ]
+        )
+        package = OpcPackage()
+
+        partnames = [package.next_partname("/foo/bar/baz%d.xml") for _ in range(3)]
+
+        assert partnames == [
+            "/foo/bar/baz2.xml", "/foo/bar/baz4.xml", "/foo/bar/baz5.xml"
+        ]
+        iter_parts_.assert_called_once_with(package)
+
+    def it_finds_the_partnames_again_once_a_part_it_did_not_name_is_added(self):
+        package = OpcPackage()
+        main_part = Part(PackURI("/foo/main.xml"), "text/xml", package=package)
+        package.relate_to(main_part, RT.OFFICE_DOCUMENT)
+        template = "/foo/bar/baz%d.xml"
+        main_part.relate_to(
+            Part(package.next_partname(template), "text/xml", package=package),
+            RT.HEADER,
+        )
+        assert package.next_partname(template) == "/foo/bar/baz2.xml"
+
+        main_part.relate_to(
+            Part(PackURI("/foo/bar/baz3.xml"), "text/xml", package=package), RT.HEADER
+        )
+
+        assert package.next_partname(template) == "/foo/bar/baz4.xml"
+
+    def and_it_finds_them_again_once_a_part_is_renamed(self):
+        package = OpcPackage()
+        part = Part(PackURI("/foo/main.xml"), "text/xml", package=package)
+        package.relate_to(part, RT.OFFICE_DOCUMENT)
+        assert package.next_partname("/foo/bar/baz%d.xml") == "/foo/bar/baz1.xml"
+
+        part.partname = PackURI("/foo/bar/baz2.xml")
+
+        assert package.next_partname("/foo/bar/baz%d.xml") == "/foo/bar/baz3.xml"
+
+    def and_it_finds_them_again_after_dropping_its_caches(self, iter_parts_):
+        iter_parts_.return_value = []
+        package = OpcPackage()
+        package.next_partname("/foo/bar/baz%d.xml")
+
+        package.drop_caches()
+        partname = package.next_partname("/foo/bar/baz%d.xml")
+
+        assert iter_parts_.call_count == 3
+        assert partname == "/foo/bar/baz2.xml"
+
+    def it_can_report_the_memory_usage_of_its_parts(self, iter_parts_, parts_):
+        iter_parts_.return_value = iter(parts_)
+        package = OpcPackage()
+
+        report = package.memory_report()
+
+        assert report == [part_.memory_usage.return_value for part_ in parts_]
+
+    def it_can_drop_the_caches_of_its_parts(self, iter_parts_, parts_):
+        iter_parts_.return_value = iter(parts_)
+        package = OpcPackage()
+
+        package.drop_caches()
+
+        for part_ in parts_:
+            part_.drop_caches.assert_called_once_with()
+
+    def it_can_be_pickled(self):
+        package = Package.open(test_file("having-images.docx"))
+        package.main_document_part.element.body.clear_content()
+        package.main_document_part.relate_to("http://foo", RT.HYPERLINK, True)
+
+        clone = pickle.loads(pickle.dumps(package, pickle.HIGHEST_PROTOCOL))
+
+        parts, clone_parts = package.parts, clone.parts
+        assert type(clone) is Package
+        assert [(type(p), p.partname, p.blob) for p in clone_parts] == [
+            (type(p), p.partname, p.blob) for p in parts
+        ]
+        rel_attrs = [
+            [(r.rId, r.reltype, r.is_external, r.target_ref) for r in pkg.iter_rels()]
+            for pkg in (clone, package)
+        ]
+        assert rel_attrs[0] == rel_attrs[1]
+        assert len(clone.image_parts) == len(package.image_parts) > 0
+
     def it_can_find_a_part_related_by_reltype(self, related_part_fixture_):
         pkg, reltype, related_part_ = related_part_fixture_
         related_part = pkg.part_related_by(reltype)
@@ -8,6 +8,8 @@ import pytest
 
 from docx.opc.packuri import PackURI
 
+from ..unitutil.mock import function_mock
+
 
 class DescribePackURI(object):
 
@@ -78,6 +80,21 @@ class DescribePackURI(object):
             pack_uri = PackURI(uri_str)
             assert pack_uri.relative_ref(baseURI) == expected_relative_ref
 
+    def it_is_interned(self):
+        pack_uri = PackURI('/word/document.xml')
+        assert PackURI('/word/document.xml') is pack_uri
+        assert PackURI(pack_uri) is pack_uri
+        assert PackURI.from_rel_ref('/word', 'document.xml') is pack_uri
+
+    def it_computes_a_relative_ref_only_once(self, relpath_):
+        relpath_.return_value = '../media/relref1.png'
+        pack_uri = PackURI('/word/media/relref1.png')
+
+        relative_refs = [pack_uri.relative_ref('/word/foo') for _ in range(2)]
+
+        relpath_.assert_called_once_with(pack_uri, '/word/foo')
+        assert relative_refs == ['../media/relref1.png'] * 2
+
     def it_can_calculate_rels_uri(self):
         expected_values = (
             '/_rels/.rels',
@@ -86,3 +103,9 @@ class DescribePackURI(object):
         )
         for pack_uri, expected_rels_uri in self.cases(expected_values):
             assert pack_uri.rels_uri == expected_rels_uri
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def relpath_(self, request):
+        return function_mock(request, 'docx.opc.packuri.posixpath.relpath')
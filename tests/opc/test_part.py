@@ -62,6 +62,18 @@ class DescribePart(object):
         part, load_blob = blob_fixture
         assert part.blob is load_blob
 
+    def it_can_report_its_memory_usage(self):
+        part = Part(PackURI("/word/media/image1.png"), "image/png", b"foobar")
+
+        usage = part.memory_usage()
+
+        assert usage.partname == "/word/media/image1.png"
+        assert usage.content_type == "image/png"
+        assert usage.blob_size == 6
+        assert usage.cache_names == ()
+        assert usage.element_count is None
+        assert usage.xml_size is None
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -450,6 +462,79 @@ class DescribeXmlPart(object):
         serialize_part_xml_.assert_called_once_with(element_)
         assert blob is serialize_part_xml_.return_value
 
+    def it_reuses_its_xml_while_its_element_is_not_handed_out(
+        self, element_, serialize_part_xml_
+    ):
+        xml_part = XmlPart(None, None, element_, None)
+
+        blobs = [xml_part.blob, xml_part.blob]
+
+        serialize_part_xml_.assert_called_once_with(element_)
+        assert blobs == [serialize_part_xml_.return_value] * 2
+
+    def it_serializes_again_after_being_marked_dirty(
+        self, element_, serialize_part_xml_
+    ):
+        xml_part = XmlPart(None, None, element_, None)
+        xml_part.blob
+
+        xml_part.mark_dirty()
+        xml_part.blob
+
+        assert serialize_part_xml_.call_count == 2
+
+    def it_serializes_each_time_once_its_element_is_handed_out(
+        self, element_, serialize_part_xml_
+    ):
+        xml_part = XmlPart(None, None, element_, None)
+        xml_part.blob
+
+        element = xml_part.element
+        xml_part.blob
+        xml_part.blob
+
+        assert element is element_
+        assert serialize_part_xml_.call_count == 3
+
+    def it_can_be_loaded_lazily(self, parse_xml_, element_):
+        xml_part = XmlPart.load_lazily(PackURI("/word/foo.xml"), None, b"<foo/>", None)
+
+        blob = xml_part.blob
+        xml_part.drop_caches()
+        xml_part.mark_dirty()
+        assert parse_xml_.call_count == 0
+        assert xml_part.memory_usage().element_count is None
+
+        element = xml_part.element
+
+        parse_xml_.assert_called_once_with(b"<foo/>")
+        assert blob == b"<foo/>"
+        assert element is element_
+        assert xml_part._element is element_
+
+    def it_can_report_its_memory_usage(self):
+        elm = element('w:p/(w:pPr/w:jc{w:val=center},w:r/w:t"foo")')
+        xml_part = XmlPart(PackURI("/word/document.xml"), "application/xml", elm, None)
+
+        usage = xml_part.memory_usage()
+        xml_part.blob
+        cached_usage = xml_part.memory_usage()
+
+        assert usage.element_count == 5
+        assert usage.xml_size == 82
+        assert (usage.blob_size, usage.cache_names) == (0, ())
+        assert cached_usage.blob_size > 0
+        assert cached_usage.cache_names == ("blob",)
+
+    def it_can_drop_its_serialized_xml(self, element_, serialize_part_xml_):
+        xml_part = XmlPart(None, None, element_, None)
+        xml_part.blob
+
+        xml_part.drop_caches()
+        xml_part.blob
+
+        assert serialize_part_xml_.call_count == 2
+
     def it_knows_its_the_part_for_its_child_objects(self, part_fixture):
         xml_part = part_fixture
         assert xml_part.part is xml_part
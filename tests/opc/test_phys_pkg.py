@@ -123,6 +123,34 @@ class DescribeZipPkgReader(object):
         rels_xml = phys_reader.rels_xml_for(partname)
         assert rels_xml is None
 
+    @pytest.mark.parametrize('buffer_type', [bytes, bytearray, memoryview])
+    def it_reads_a_package_held_in_a_buffer(self, buffer_type):
+        with open(zip_pkg_path, 'rb') as f:
+            buffer = buffer_type(f.read())
+
+        phys_reader = PhysPkgReader(buffer)
+
+        blob = phys_reader.blob_for(PackURI('/word/document.xml'))
+        sha1 = hashlib.sha1(blob).hexdigest()
+        assert isinstance(phys_reader, _ZipPkgReader)
+        assert sha1 == 'b9b4a98bcac7c5a162825b60c3db7df11e02ac5f'
+
+    def it_returns_a_stored_member_as_a_slice_of_its_buffer(self):
+        stream = BytesIO()
+        with ZipFile(stream, 'w') as zipf:
+            zipf.writestr('word/media/image1.png', b'\x89PNG-foobar')
+            zipf.writestr('word/document.xml', b'<w:document/>', ZIP_DEFLATED)
+        buffer = memoryview(stream.getvalue())
+        phys_reader = _ZipPkgReader(buffer)
+
+        image_blob = phys_reader.blob_for(PackURI('/word/media/image1.png'))
+        xml_blob = phys_reader.blob_for(PackURI('/word/document.xml'))
+
+        assert isinstance(image_blob, memoryview)
+        assert image_blob.obj is buffer.obj
+        assert image_blob.tobytes() == b'\x89PNG-foobar'
+        assert xml_blob == b'<w:document/>'
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture(scope='class')
@@ -6,7 +6,11 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import pytest
 
-from docx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TARGET_MODE as RTM
+from docx.opc.constants import (
+    CONTENT_TYPE as CT,
+    RELATIONSHIP_TARGET_MODE as RTM,
+    RELATIONSHIP_TYPE as RT,
+)
 from docx.opc.packuri import PackURI
 from docx.opc.phys_pkg import _ZipPkgReader
 from docx.opc.pkgreader import (
@@ -18,6 +22,7 @@ from docx.opc.pkgreader import (
 )
 
 from .unitdata.types import a_Default, a_Types, an_Override
+from ..unitutil.file import test_file
 from ..unitutil.mock import (
     ANY,
     call,
@@ -55,6 +60,17 @@ class DescribePackageReader(object):
         _init_.assert_called_once_with(ANY, content_types, pkg_srels, sparts)
         assert isinstance(pkg_reader, PackageReader)
 
+    def it_can_read_only_the_package_parts_of_given_reltypes(self):
+        parts = PackageReader.read_package_parts(
+            test_file('test.docx'), (RT.OFFICE_DOCUMENT, RT.IMAGE)
+        )
+
+        assert list(parts) == [RT.OFFICE_DOCUMENT]
+        partname, content_type, blob = parts[RT.OFFICE_DOCUMENT]
+        assert partname == '/word/document.xml'
+        assert content_type == CT.WML_DOCUMENT_MAIN
+        assert blob.startswith(b'<?xml')
+
     def it_can_iterate_over_the_serialized_parts(self, iter_sparts_fixture):
         pkg_reader, expected_iter_spart_items = iter_sparts_fixture
         iter_spart_items = list(pkg_reader.iter_sparts())
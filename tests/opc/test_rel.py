@@ -138,6 +138,29 @@ class DescribeRelationships(object):
         next_rId = rels._next_rId
         assert next_rId == expected_next_rId
 
+    def it_reuses_the_rId_of_a_removed_relationship(self):
+        rels = Relationships(None)
+        for rId in ('rId1', 'rId2', 'rId3'):
+            rels.add_relationship('reltype', 'http://%s' % rId, rId, True)
+        assert rels._next_rId == 'rId4'
+
+        del rels['rId2']
+
+        assert rels._next_rId == 'rId2'
+        assert rels.get_or_add_ext_rel('reltype', 'http://rId2') == 'rId2'
+        assert rels._next_rId == 'rId4'
+
+    def it_finds_a_remaining_match_after_a_removal(self):
+        rels = Relationships(None)
+        part = Mock(name='part')
+        rels.add_relationship('reltype', part, 'rId1')
+        rels.add_relationship('reltype', part, 'rId2')
+
+        del rels['rId1']
+
+        assert rels.get_or_add('reltype', part).rId == 'rId2'
+        assert 'rId1' not in rels.related_parts
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -6,12 +6,14 @@ Test suite for pptx.oxml.__init__.py module, primarily XML parser-related.
 
 from __future__ import print_function, unicode_literals
 
+import threading
+
 import pytest
 
 from lxml import etree
 
 from docx.oxml import (
-    OxmlElement, oxml_parser, parse_xml, register_element_cls
+    _oxml_parsers, OxmlElement, oxml_parser, parse_xml, register_element_cls
 )
 from docx.oxml.ns import qn
 from docx.oxml.shared import BaseOxmlElement
@@ -87,6 +89,23 @@ class DescribeParseXml(object):
         element = parse_xml(xml_bytes)
         assert isinstance(element, CustElmCls)
 
+    def it_parses_with_a_separate_parser_in_each_thread(self, xml_bytes):
+        register_element_cls('a:foo', CustElmCls)
+        results = []
+
+        def parse():
+            results.append((_oxml_parsers.parser, parse_xml(xml_bytes)))
+
+        threads = [threading.Thread(target=parse) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        parsers = [parser for parser, _ in results]
+        assert len(set(parsers + [oxml_parser])) == 3
+        assert all(isinstance(element, CustElmCls) for _, element in results)
+
     # fixture components ---------------------------------------------
 
     @pytest.fixture
@@ -49,6 +49,83 @@ class DescribeCT_Row(object):
         return tr, col_idx
 
 
+class DescribeCT_Tbl(object):
+
+    def it_can_merge_a_batch_of_ranges(self, merge_ranges_fixture):
+        tbl, ranges, expected_xml = merge_ranges_fixture
+        merged_tcs = tbl.merge_ranges(ranges)
+        assert tbl.xml == expected_xml
+        assert merged_tcs == [
+            tbl.tr_lst[top].tc_at_grid_col(left) for top, left in (
+                (min(r[0], r[2]), min(r[1], r[3])) for r in ranges
+            )
+        ]
+
+    def it_raises_on_invalid_merge_range(self, merge_ranges_raise_fixture):
+        tbl, ranges, exception_type = merge_ranges_raise_fixture
+        with pytest.raises(exception_type):
+            tbl.merge_ranges(ranges)
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ([(0, 0, 0, 1)],
+         'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol,w:gridCol),'
+         'w:tr/(w:tc/(w:tcPr/w:gridSpan{w:val=2},w:p/w:r/w:t"a",'
+         'w:p/w:r/w:t"b"),w:tc/w:p),'
+         'w:tr/(w:tc/w:p,w:tc/w:p,w:tc/w:p/w:r/w:t"c"))'),
+        ([(0, 0, 1, 0)],
+         'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol,w:gridCol),'
+         'w:tr/(w:tc/(w:tcPr/w:vMerge{w:val=restart},w:p/w:r/w:t"a"),'
+         'w:tc/w:p/w:r/w:t"b",w:tc/w:p),'
+         'w:tr/(w:tc/(w:tcPr/w:vMerge,w:p),w:tc/w:p,'
+         'w:tc/w:p/w:r/w:t"c"))'),
+        ([(0, 0, 1, 1)],
+         'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol,w:gridCol),'
+         'w:tr/(w:tc/(w:tcPr/(w:gridSpan{w:val=2},'
+         'w:vMerge{w:val=restart}),w:p/w:r/w:t"a",w:p/w:r/w:t"b"),'
+         'w:tc/w:p),'
+         'w:tr/(w:tc/(w:tcPr/(w:gridSpan{w:val=2},w:vMerge),w:p),'
+         'w:tc/w:p/w:r/w:t"c"))'),
+        ([(0, 0, 0, 1), (1, 1, 1, 2)],
+         'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol,w:gridCol),'
+         'w:tr/(w:tc/(w:tcPr/w:gridSpan{w:val=2},w:p/w:r/w:t"a",'
+         'w:p/w:r/w:t"b"),w:tc/w:p),'
+         'w:tr/(w:tc/w:p,w:tc/(w:tcPr/w:gridSpan{w:val=2},'
+         'w:p/w:r/w:t"c")))'),
+        ([(1, 2, 0, 0)],
+         'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol,w:gridCol),'
+         'w:tr/w:tc/(w:tcPr/(w:gridSpan{w:val=3},'
+         'w:vMerge{w:val=restart}),w:p/w:r/w:t"a",w:p/w:r/w:t"b",'
+         'w:p/w:r/w:t"c"),'
+         'w:tr/w:tc/(w:tcPr/(w:gridSpan{w:val=3},w:vMerge),w:p))'),
+    ])
+    def merge_ranges_fixture(self, request):
+        ranges, expected_cxml = request.param
+        tbl = element(self._tbl_cxml)
+        expected_xml = xml(expected_cxml)
+        return tbl, ranges, expected_xml
+
+    @pytest.fixture(params=[
+        ([(2, 0, 0, 0)],               IndexError),
+        ([(0, 3, 0, 0)],               IndexError),
+        ([(0, 0, 0, 1), (0, 0, 1, 0)], InvalidSpanError),  # inverted-L
+        ([(0, 0, 0, 1), (1, 1, 0, 2)], InvalidSpanError),  # straddles span
+    ])
+    def merge_ranges_raise_fixture(self, request):
+        ranges, exception_type = request.param
+        tbl = element(self._tbl_cxml)
+        return tbl, ranges, exception_type
+
+    # fixture components ---------------------------------------------
+
+    _tbl_cxml = (
+        'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol,w:gridCol),'
+        'w:tr/(w:tc/w:p/w:r/w:t"a",w:tc/w:p/w:r/w:t"b",w:tc/w:p),'
+        'w:tr/(w:tc/w:p,w:tc/w:p,w:tc/w:p/w:r/w:t"c"))'
+    )
+
+
 class DescribeCT_Tc(object):
 
     def it_can_merge_to_another_tc(
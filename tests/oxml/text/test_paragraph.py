@@ -0,0 +1,48 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.oxml.text.paragraph module.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import pytest
+
+from ...unitutil.cxml import element, xml
+
+
+class DescribeCT_P(object):
+
+    def it_can_normalize_its_runs(self, normalize_fixture):
+        p, expected_xml = normalize_fixture
+        p.normalize_runs()
+        assert p.xml == expected_xml
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('w:p/(w:r/w:t"a",w:r/w:t"b")', 'w:p/w:r/w:t"ab"'),
+        ('w:p/(w:r/(w:rPr/(w:b,w:i),w:t"a"),w:r/(w:rPr/(w:b,w:i),w:t"b"))',
+         'w:p/w:r/(w:rPr/(w:b,w:i),w:t"ab")'),
+        ('w:p/(w:r/(w:rPr/w:b,w:t"a"),w:r/(w:rPr/w:i,w:t"b"))',
+         'w:p/(w:r/(w:rPr/w:b,w:t"a"),w:r/(w:rPr/w:i,w:t"b"))'),
+        ('w:p/(w:r/(w:rPr/w:sz{w:val=24},w:t"a"),w:r/(w:rPr/w:sz{w:val=28},w:t"b"))',
+         'w:p/(w:r/(w:rPr/w:sz{w:val=24},w:t"a"),w:r/(w:rPr/w:sz{w:val=28},w:t"b"))'),
+        ('w:p/(w:r/(w:t"a",w:lastRenderedPageBreak),w:proofErr,w:r/(w:tab,w:t"b"))',
+         'w:p/w:r/(w:t"a",w:tab,w:t"b")'),
+        ('w:p/(w:r/w:t"a",w:r,w:r/w:t,w:r/w:t"b")', 'w:p/w:r/w:t"ab"'),
+        ('w:p/(w:r/w:t"a",w:r/w:drawing,w:r/w:t"b")',
+         'w:p/(w:r/w:t"a",w:r/w:drawing,w:r/w:t"b")'),
+        ('w:p/(w:r/w:t"a",w:bookmarkStart,w:r/w:t"b")',
+         'w:p/(w:r/w:t"a",w:bookmarkStart,w:r/w:t"b")'),
+        ('w:p/(w:r/w:t"a",w:hyperlink/(w:r/w:t"b",w:r/w:t"c"))',
+         'w:p/(w:r/w:t"a",w:hyperlink/w:r/w:t"bc")'),
+        ('w:p/(w:r/w:t"a ",w:r/w:t"b",w:r/w:t"c")', 'w:p/w:r/w:t"a bc"'),
+    ])
+    def normalize_fixture(self, request):
+        p_cxml, expected_cxml = request.param
+        p = element(p_cxml)
+        expected_xml = xml(expected_cxml)
+        return p, expected_xml
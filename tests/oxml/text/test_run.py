@@ -33,3 +33,17 @@ class DescribeCT_R(object):
         r = element(initial_cxml)
         expected_xml = xml(expected_cxml)
         return r, text, expected_xml
+
+
+class DescribeCT_Text(object):
+
+    @pytest.mark.parametrize('initial_cxml, text, expected_cxml', [
+        ('w:t"foo"', 'bar', 'w:t"bar"'),
+        ('w:t', ' bar', 'w:t{xml:space=preserve}" bar"'),
+        ('w:t{xml:space=preserve}" foo"', 'bar', 'w:t{xml:space=preserve}"bar"'),
+    ])
+    def it_can_set_its_text_preserving_edge_whitespace(
+            self, initial_cxml, text, expected_cxml):
+        t = element(initial_cxml)
+        t.set_text(text)
+        assert t.xml == xml(expected_cxml)
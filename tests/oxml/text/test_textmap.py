@@ -0,0 +1,97 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.oxml.text.textmap module.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import re
+
+import pytest
+
+from docx.oxml.text.textmap import TextMap
+
+from ...unitutil.cxml import element, xml
+
+
+class DescribeTextMap(object):
+
+    def it_maps_the_text_of_a_paragraph(self, text_fixture):
+        p, expected_text = text_fixture
+        assert TextMap(p).text == expected_text
+
+    def it_knows_which_pieces_hold_a_span_of_text(self):
+        p = element('w:p/(w:r/w:t"foo",w:r/(w:tab,w:t"bar"),w:r/w:t"baz")')
+        text_map = TextMap(p)
+
+        pieces = text_map.pieces_in(2, 5)
+
+        assert [piece.text for piece in pieces] == ['foo', '\t', 'bar']
+        assert [piece.start for piece in pieces] == [0, 3, 4]
+
+    def it_can_replace_text_spanning_runs(self, replace_fixture):
+        p, pattern, repl, count, expected_count, expected_xml = replace_fixture
+        text_map = TextMap(p)
+
+        replaced_count = text_map.replace(re.compile(pattern), repl, count)
+
+        assert replaced_count == expected_count
+        assert p.xml == expected_xml
+
+    def it_can_replace_using_a_callable(self):
+        p = element('w:p/(w:r/w:t"{a} {b",w:r/w:t"}")')
+        values = {'a': '1', 'b': '2'}
+
+        TextMap(p).replace(
+            re.compile(r'\{(\w)\}'), lambda match: values[match.group(1)]
+        )
+
+        assert p.xml == xml('w:p/w:r/w:t"1 2"')
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('w:p/(w:r/w:t"foo", w:r/w:t"bar")', 'o', 'x', 0, 2,
+         'w:p/(w:r/w:t"fxx", w:r/w:t"bar")'),
+        ('w:p/(w:r/w:t"{{na", w:r/(w:rPr/w:b,w:t"me}} x"))', r'\{\{name\}\}',
+         'Bob', 0, 1, 'w:p/(w:r/w:t"Bob", w:r/(w:rPr/w:b,w:t{xml:space=preserve}'
+         '" x"))'),
+        ('w:p/(w:r/w:t"a{{x",w:r/w:t"}}b{{x}}")', r'\{\{x\}\}', '-', 1, 1,
+         'w:p/(w:r/w:t"a-",w:r/w:t"b{{x}}")'),
+        ('w:p/w:r/(w:t"a",w:tab,w:t"b")', r'a\tb', 'c', 0, 1,
+         'w:p/w:r/w:t"c"'),
+        ('w:p/w:r/(w:t"a",w:tab,w:t"b")', r'\t', 'T', 0, 1,
+         'w:p/w:r/(w:t"a",w:t"T",w:t"b")'),
+        ('w:p/w:r/(w:t"a",w:br,w:t"b")', r'\n', '', 0, 1,
+         'w:p/w:r/(w:t"a",w:t"b")'),
+        ('w:p/w:r/w:t"ab"', r'(a)(b)', r'\2\1', 0, 1, 'w:p/w:r/w:t"ba"'),
+        ('w:p/w:r/w:t"ab"', r'^', r'-', 0, 1, 'w:p/w:r/w:t"-ab"'),
+        ('w:p/(w:r/w:t"a",w:r/(w:rPr/w:b,w:t"b"))', r'b', r'', 0, 1,
+         'w:p/w:r/w:t"a"'),
+        ('w:p', r'^', r'x', 0, 1, 'w:p/w:r/w:t"x"'),
+        ('w:p/w:r/w:t"ab"', r'z', r'x', 0, 0, 'w:p/w:r/w:t"ab"'),
+        ('w:p/w:hyperlink/w:r/w:t"ab"', r'b', r'c', 0, 1,
+         'w:p/w:hyperlink/w:r/w:t"ac"'),
+    ])
+    def replace_fixture(self, request):
+        p_cxml, pattern, repl, count, expected_count, expected_cxml = (
+            request.param
+        )
+        p = element(p_cxml)
+        expected_xml = xml(expected_cxml)
+        return p, pattern, repl, count, expected_count, expected_xml
+
+    @pytest.fixture(params=[
+        ('w:p', ''),
+        ('w:p/w:r', ''),
+        ('w:p/w:r/w:t"foo"', 'foo'),
+        ('w:p/(w:r/w:t"foo",w:r/(w:tab,w:br,w:cr,w:t"bar"))', 'foo\t\n\nbar'),
+        ('w:p/(w:pPr,w:r/w:t"a",w:hyperlink/w:r/w:t"b")', 'ab'),
+        ('w:p/w:r/(w:rPr/w:b,w:drawing,w:t)', ''),
+    ])
+    def text_fixture(self, request):
+        p_cxml, expected_text = request.param
+        return element(p_cxml), expected_text
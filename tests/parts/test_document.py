@@ -6,20 +6,26 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import pytest
 
+from docx.enum.section import WD_HEADER_FOOTER
 from docx.enum.style import WD_STYLE_TYPE
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.coreprops import CoreProperties
+from docx.opc.packuri import PackURI
+from docx.opc.rel import Relationships
 from docx.package import Package
 from docx.parts.document import DocumentPart
 from docx.parts.hdrftr import FooterPart, HeaderPart
+from docx.parts.image import ImagePart
 from docx.parts.numbering import NumberingPart
 from docx.parts.settings import SettingsPart
 from docx.parts.styles import StylesPart
 from docx.settings import Settings
+from docx.shared import ProxyCache
 from docx.styles.style import BaseStyle
 from docx.styles.styles import Styles
 
 from ..oxml.parts.unitdata.document import a_body, a_document
+from ..unitutil.cxml import element, xml
 from ..unitutil.mock import class_mock, instance_mock, method_mock, property_mock
 
 
@@ -49,6 +55,27 @@ class DescribeDocumentPart(object):
         assert header_part is header_part_
         assert rId == "rId7"
 
+    def it_can_add_a_section_break(self):
+        document_elm = element("w:document/w:body/(w:p,w:sectPr{w:code=1})")
+        document_part = DocumentPart(None, None, document_elm, None)
+        sectPr_lst = document_part.sectPr_lst
+
+        sentinel_sectPr = document_part.add_section_break()
+
+        assert document_elm.xml == xml(
+            "w:document/w:body/(w:p,w:p/w:pPr/w:sectPr,w:sectPr{w:code=1})"
+        )
+        assert sentinel_sectPr is document_elm.body.sectPr
+        assert document_part.sectPr_lst is sectPr_lst
+        assert sectPr_lst == document_elm.xpath("//w:sectPr")
+
+    def it_can_drop_a_specified_footer_part(self, drop_rel_):
+        document_part = DocumentPart(None, None, None, None)
+
+        document_part.drop_footer_part("rId42")
+
+        drop_rel_.assert_called_once_with(document_part, "rId42")
+
     def it_can_drop_a_specified_header_part(self, drop_rel_):
         document_part = DocumentPart(None, None, None, None)
 
@@ -80,6 +107,117 @@ class DescribeDocumentPart(object):
         related_parts_.__getitem__.assert_called_once_with("rId11")
         assert header_part is header_part_
 
+    @pytest.mark.parametrize(
+        "refs, idx, expected_idx",
+        (
+            ((0, 0, 0), 0, None),
+            ((0, 0, 0), 2, 0),
+            ((1, 0, 0), 2, 0),
+            ((0, 1, 0), 1, 0),
+            ((0, 1, 0), 2, 1),
+            ((1, 1, 0, 0), 3, 1),
+        ),
+    )
+    def it_knows_which_section_a_header_inherits_from(self, refs, idx, expected_idx):
+        ref = "w:headerReference{w:type=default,r:id=rId1}"
+        sectPr_cxmls = ["w:sectPr/%s" % ref if r else "w:sectPr" for r in refs]
+        body_cxmls = ["w:p/w:pPr/%s" % c for c in sectPr_cxmls[:-1]]
+        body_cxmls.append(sectPr_cxmls[-1])
+        document_elm = element("w:document/w:body/(%s)" % ",".join(body_cxmls))
+        sectPrs = document_elm.xpath("//w:sectPr")
+        document_part = DocumentPart(None, None, document_elm, None)
+
+        source_sectPr = document_part.header_source_sectPr(
+            sectPrs[idx], WD_HEADER_FOOTER.PRIMARY
+        )
+
+        expected_sectPr = None if expected_idx is None else sectPrs[expected_idx]
+        assert source_sectPr is expected_sectPr
+        assert document_part.footer_source_sectPr(
+            sectPrs[idx], WD_HEADER_FOOTER.PRIMARY
+        ) is (None if idx == 0 else sectPrs[0])
+
+    def and_it_resolves_sources_again_after_a_definition_is_added(
+        self, package_, HeaderPart_, header_part_, relate_to_
+    ):
+        document_elm = element(
+            "w:document/w:body/(w:p/w:pPr/w:sectPr,w:p/w:pPr/w:sectPr,w:sectPr)"
+        )
+        sectPrs = document_elm.xpath("//w:sectPr")
+        HeaderPart_.new.return_value = header_part_
+        relate_to_.return_value = "rId7"
+        document_part = DocumentPart(None, None, document_elm, package_)
+        type_ = WD_HEADER_FOOTER.PRIMARY
+        assert document_part.header_source_sectPr(sectPrs[2], type_) is sectPrs[0]
+
+        _, rId = document_part.add_header_part()
+        sectPrs[1].add_headerReference(type_, rId)
+
+        assert document_part.header_source_sectPr(sectPrs[2], type_) is sectPrs[1]
+
+    def it_maintains_an_index_of_its_sections(self):
+        document_elm = element(
+            "w:document/w:body/(w:p/w:pPr/w:sectPr,w:p/w:pPr/w:sectPr,w:sectPr)"
+        )
+        sectPrs = document_elm.xpath("//w:sectPr")
+        document_part = DocumentPart(None, None, document_elm, None)
+
+        assert document_part.sectPr_lst == sectPrs
+        assert document_part.sectPr_lst is document_part.sectPr_lst
+        assert document_part.preceding_sectPr(sectPrs[0]) is None
+        assert document_part.preceding_sectPr(sectPrs[2]) is sectPrs[1]
+
+    def and_it_rebuilds_the_index_when_a_section_is_removed(self):
+        document_elm = element(
+            "w:document/w:body/(w:p/w:pPr/w:sectPr,w:p/w:pPr/w:sectPr,w:sectPr)"
+        )
+        sectPrs = document_elm.xpath("//w:sectPr")
+        document_part = DocumentPart(None, None, document_elm, None)
+        document_part.sectPr_lst
+
+        document_elm.body.remove(document_elm.body[1])
+
+        assert document_part.sectPr_lst == [sectPrs[0], sectPrs[2]]
+        assert document_part.preceding_sectPr(sectPrs[2]) is sectPrs[0]
+        assert document_part.header_source_sectPr(
+            sectPrs[2], WD_HEADER_FOOTER.PRIMARY
+        ) is sectPrs[0]
+
+    def but_it_keeps_the_index_when_other_body_content_changes(self, request):
+        document_elm = element("w:document/w:body/(w:p/w:pPr/w:sectPr,w:p,w:sectPr)")
+        document_part = DocumentPart(None, None, document_elm, None)
+        sectPr_lst = document_part.sectPr_lst
+        _index_sectPrs_ = method_mock(request, DocumentPart, "_index_sectPrs")
+
+        document_elm.body.add_p()
+
+        assert document_part.sectPr_lst is sectPr_lst
+        assert document_part.sectPr_lst is sectPr_lst
+        _index_sectPrs_.assert_not_called()
+
+    def and_it_rebuilds_the_index_on_request(self):
+        document_elm = element("w:document/w:body/(w:p,w:sectPr)")
+        document_part = DocumentPart(None, None, document_elm, None)
+        document_part.sectPr_lst
+        p = document_elm.body[0]
+        p.set_sectPr(element("w:sectPr"))
+
+        document_part.reset_section_index()
+
+        assert document_part.sectPr_lst == document_elm.xpath("//w:sectPr")
+
+    def and_it_drops_the_index_with_its_other_caches(self):
+        document_elm = element("w:document/w:body/(w:p/w:pPr/w:sectPr,w:sectPr)")
+        sectPrs = document_elm.xpath("//w:sectPr")
+        document_part = DocumentPart(None, None, document_elm, None)
+        document_part.sectPr_lst
+        assert document_part.memory_usage().cache_names == ("section_index",)
+
+        document_part.drop_caches()
+
+        assert document_part.memory_usage().cache_names == ()
+        assert document_part.preceding_sectPr(sectPrs[1]) is sectPrs[0]
+
     def it_can_save_the_package_to_a_file(self, save_fixture):
         document, file_ = save_fixture
         document.save(file_)
@@ -107,6 +245,81 @@ class DescribeDocumentPart(object):
         InlineShapes_.assert_called_once_with(body_elm, document)
         assert inline_shapes is InlineShapes_.return_value
 
+    def it_can_find_each_use_of_an_image(self, request, header_part_):
+        image_part_ = instance_mock(request, ImagePart, sha1="c0ffee")
+        other_image_part_ = instance_mock(request, ImagePart, sha1="beef")
+        document_part = DocumentPart(PackURI("/word/document.xml"), None, None, None)
+        document_part.rels.add_relationship(RT.IMAGE, image_part_, "rId1")
+        document_part.rels.add_relationship(RT.IMAGE, other_image_part_, "rId2")
+        document_part.rels.add_relationship(RT.HEADER, header_part_, "rId3")
+        document_part.rels.add_relationship(RT.HYPERLINK, "http://x", "rId4", True)
+        header_part_.rels = Relationships(None)
+        header_part_.rels.add_relationship(RT.IMAGE, image_part_, "rId6")
+        inlines = [element("wp:inline{id=%d}" % n) for n in range(3)]
+        inlines_for_rId_ = method_mock(
+            request, DocumentPart, "inlines_for_rId", return_value=inlines[:2]
+        )
+        header_part_.inlines_for_rId.return_value = inlines[2:]
+
+        inline_shapes = document_part.inline_shapes_for_image("c0ffee")
+
+        inlines_for_rId_.assert_called_once_with(document_part, "rId1")
+        header_part_.inlines_for_rId.assert_called_once_with("rId6")
+        assert [shape._inline for shape in inline_shapes] == inlines
+
+    def it_can_iterate_its_story_parts(self, header_part_, footer_part_, styles_part_):
+        document_part = DocumentPart(PackURI("/word/document.xml"), None, None, None)
+        rels = document_part.rels
+        rels.add_relationship(RT.STYLES, styles_part_, "rId1")
+        rels.add_relationship(RT.HEADER, header_part_, "rId2")
+        rels.add_relationship(RT.FOOTER, footer_part_, "rId3")
+        rels.add_relationship(RT.HYPERLINK, "http://x", "rId4", True)
+
+        story_parts = list(document_part.iter_story_parts())
+
+        assert story_parts == [document_part, header_part_, footer_part_]
+
+    def it_can_turn_proxy_caching_on_and_off(self, header_part_):
+        document_part = DocumentPart(PackURI("/word/document.xml"), None, None, None)
+        document_part.rels.add_relationship(RT.HEADER, header_part_, "rId1")
+        header_part_._proxies = ProxyCache()
+        assert document_part.cache_proxies is False
+
+        document_part.cache_proxies = True
+        assert document_part.cache_proxies is True
+
+        document_part.cache_proxies = False
+        assert document_part.cache_proxies is False
+        assert header_part_._proxies is None
+
+    @pytest.mark.parametrize("has_numbering_part", (True, False))
+    def it_can_create_a_list_labeler_for_its_paragraphs(
+        self,
+        has_numbering_part,
+        part_related_by_,
+        numbering_part_,
+        _styles_part_prop_,
+        styles_part_,
+        ListLabeler_,
+    ):
+        numbering, styles = element("w:numbering"), element("w:styles")
+        numbering_part_.element = numbering
+        styles_part_.element = styles
+        if has_numbering_part:
+            part_related_by_.return_value = numbering_part_
+        else:
+            part_related_by_.side_effect = KeyError
+        _styles_part_prop_.return_value = styles_part_
+        document_part = DocumentPart(None, None, None, None)
+
+        list_labeler = document_part.new_list_labeler()
+
+        part_related_by_.assert_called_once_with(document_part, RT.NUMBERING)
+        ListLabeler_.assert_called_once_with(
+            numbering if has_numbering_part else None, styles
+        )
+        assert list_labeler is ListLabeler_.return_value
+
     def it_provides_access_to_the_numbering_part(
         self, part_related_by_, numbering_part_
     ):
@@ -127,7 +340,7 @@ class DescribeDocumentPart(object):
 
         numbering_part = document_part.numbering_part
 
-        NumberingPart_.new.assert_called_once_with()
+        NumberingPart_.new.assert_called_once_with(None)
         relate_to_.assert_called_once_with(document_part, numbering_part_, RT.NUMBERING)
         assert numbering_part is numbering_part_
 
@@ -272,6 +485,10 @@ class DescribeDocumentPart(object):
     def NumberingPart_(self, request):
         return class_mock(request, 'docx.parts.document.NumberingPart')
 
+    @pytest.fixture
+    def ListLabeler_(self, request):
+        return class_mock(request, "docx.parts.document.ListLabeler")
+
     @pytest.fixture
     def numbering_part_(self, request):
         return instance_mock(request, NumberingPart)
@@ -11,7 +11,7 @@ from docx.opc.part import PartFactory
 from docx.package import Package
 from docx.parts.hdrftr import FooterPart, HeaderPart
 
-from ..unitutil.cxml import element
+from ..unitutil.cxml import element, xml
 from ..unitutil.mock import function_mock, initializer_mock, instance_mock, method_mock
 
 
@@ -31,23 +31,34 @@ class DescribeFooterPart(object):
         FooterPart_load_.assert_called_once_with(partname, content_type, blob, package_)
         assert part is footer_part_
 
-    def it_can_create_a_new_footer_part(
-        self, package_, _default_footer_xml_, parse_xml_, _init_
-    ):
+    def it_can_create_a_new_footer_part(self, package_, _new_footer_element_, _init_):
         ftr = element("w:ftr")
         package_.next_partname.return_value = "/word/footer24.xml"
-        _default_footer_xml_.return_value = "<w:ftr>"
-        parse_xml_.return_value = ftr
+        _new_footer_element_.return_value = ftr
 
         footer_part = FooterPart.new(package_)
 
         package_.next_partname.assert_called_once_with("/word/footer%d.xml")
-        _default_footer_xml_.assert_called_once_with()
-        parse_xml_.assert_called_once_with("<w:ftr>")
+        _new_footer_element_.assert_called_once_with()
         _init_.assert_called_once_with(
             footer_part, "/word/footer24.xml", CT.WML_FOOTER, ftr, package_
         )
 
+    def it_parses_the_default_footer_template_only_once_to_help(
+        self, monkeypatch, _default_footer_xml_, parse_xml_
+    ):
+        monkeypatch.setattr(FooterPart, "_default_ftr", None)
+        _default_footer_xml_.return_value = "<w:ftr>"
+        parse_xml_.return_value = element("w:ftr/w:p")
+
+        ftr = FooterPart._new_footer_element()
+        ftr_2 = FooterPart._new_footer_element()
+
+        _default_footer_xml_.assert_called_once_with()
+        parse_xml_.assert_called_once_with("<w:ftr>")
+        assert ftr is not ftr_2
+        assert ftr.xml == ftr_2.xml == xml("w:ftr/w:p")
+
     def it_loads_default_footer_XML_from_a_template_to_help(self):
         # ---tests integration with OS---
         xml_bytes = FooterPart._default_footer_xml()
@@ -75,6 +86,10 @@ class DescribeFooterPart(object):
     def _init_(self, request):
         return initializer_mock(request, FooterPart)
 
+    @pytest.fixture
+    def _new_footer_element_(self, request):
+        return method_mock(request, FooterPart, "_new_footer_element", autospec=False)
+
     @pytest.fixture
     def package_(self, request):
         return instance_mock(request, Package)
@@ -100,23 +115,34 @@ class DescribeHeaderPart(object):
         HeaderPart_load_.assert_called_once_with(partname, content_type, blob, package_)
         assert part is header_part_
 
-    def it_can_create_a_new_header_part(
-        self, package_, _default_header_xml_, parse_xml_, _init_
-    ):
+    def it_can_create_a_new_header_part(self, package_, _new_header_element_, _init_):
         hdr = element("w:hdr")
         package_.next_partname.return_value = "/word/header42.xml"
-        _default_header_xml_.return_value = "<w:hdr>"
-        parse_xml_.return_value = hdr
+        _new_header_element_.return_value = hdr
 
         header_part = HeaderPart.new(package_)
 
         package_.next_partname.assert_called_once_with("/word/header%d.xml")
-        _default_header_xml_.assert_called_once_with()
-        parse_xml_.assert_called_once_with("<w:hdr>")
+        _new_header_element_.assert_called_once_with()
         _init_.assert_called_once_with(
             header_part, "/word/header42.xml", CT.WML_HEADER, hdr, package_
         )
 
+    def it_parses_the_default_header_template_only_once_to_help(
+        self, monkeypatch, _default_header_xml_, parse_xml_
+    ):
+        monkeypatch.setattr(HeaderPart, "_default_hdr", None)
+        _default_header_xml_.return_value = "<w:hdr>"
+        parse_xml_.return_value = element("w:hdr/w:p")
+
+        hdr = HeaderPart._new_header_element()
+        hdr_2 = HeaderPart._new_header_element()
+
+        _default_header_xml_.assert_called_once_with()
+        parse_xml_.assert_called_once_with("<w:hdr>")
+        assert hdr is not hdr_2
+        assert hdr.xml == hdr_2.xml == xml("w:hdr/w:p")
+
     def it_loads_default_header_XML_from_a_template_to_help(self):
         # ---tests integration with OS---
         xml_bytes = HeaderPart._default_header_xml()
@@ -144,6 +170,10 @@ class DescribeHeaderPart(object):
     def _init_(self, request):
         return initializer_mock(request, HeaderPart)
 
+    @pytest.fixture
+    def _new_header_element_(self, request):
+        return method_mock(request, HeaderPart, "_new_header_element", autospec=False)
+
     @pytest.fixture
     def package_(self, request):
         return instance_mock(request, Package)
@@ -50,6 +50,27 @@ class DescribeImagePart(object):
         image_part, expected_filename = filename_fixture
         assert image_part.filename == expected_filename
 
+    def it_can_drop_its_parsed_image_keeping_the_filename(self):
+        image = Image.from_file(test_file('monty-truth.png'))
+        image_part = ImagePart.from_image(image, PackURI('/word/media/image1.png'))
+        assert image_part.memory_usage().cache_names == ('image',)
+
+        image_part.drop_caches()
+
+        assert image_part.memory_usage().cache_names == ()
+        assert image_part.filename == 'monty-truth.png'
+        assert image_part.image.px_width == image.px_width
+        assert image_part.image is not image
+
+    def and_it_names_the_image_it_parses_again_after_the_original(self):
+        image = Image.from_file(test_file('monty-truth.png'))
+        image_part = ImagePart.from_image(image, PackURI('/word/media/image1.png'))
+
+        image_part.drop_caches()
+
+        assert image_part.image.filename == 'monty-truth.png'
+        assert image_part.filename == 'monty-truth.png'
+
     def it_knows_the_sha1_of_its_image(self):
         blob = b'fO0Bar'
         image_part = ImagePart(None, None, blob)
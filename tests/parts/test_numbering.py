@@ -8,15 +8,27 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import pytest
 
+from docx.opc.constants import CONTENT_TYPE as CT
+from docx.opc.package import OpcPackage
 from docx.oxml.numbering import CT_Numbering
 from docx.parts.numbering import NumberingPart, _NumberingDefinitions
 
 from ..oxml.unitdata.numbering import a_num, a_numbering
+from ..unitutil.cxml import xml
 from ..unitutil.mock import class_mock, instance_mock
 
 
 class DescribeNumberingPart(object):
 
+    def it_can_create_a_new_numbering_part(self, package_):
+        numbering_part = NumberingPart.new(package_)
+
+        assert isinstance(numbering_part, NumberingPart)
+        assert numbering_part.partname == '/word/numbering.xml'
+        assert numbering_part.content_type == CT.WML_NUMBERING
+        assert numbering_part.package is package_
+        assert numbering_part.element.xml == xml('w:numbering')
+
     def it_provides_access_to_the_numbering_definitions(
             self, num_defs_fixture):
         (numbering_part, _NumberingDefinitions_, numbering_elm_,
@@ -39,6 +51,10 @@ class DescribeNumberingPart(object):
 
     # fixture components ---------------------------------------------
 
+    @pytest.fixture
+    def package_(self, request):
+        return instance_mock(request, OpcPackage)
+
     @pytest.fixture
     def _NumberingDefinitions_(self, request, numbering_definitions_):
         return class_mock(
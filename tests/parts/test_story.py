@@ -13,9 +13,11 @@ from docx.package import Package
 from docx.parts.document import DocumentPart
 from docx.parts.image import ImagePart
 from docx.parts.story import BaseStoryPart
+from docx.shared import ProxyCache
 from docx.styles.style import BaseStyle
+from docx.text.paragraph import Paragraph
 
-from ..unitutil.cxml import element
+from ..unitutil.cxml import element, xml
 from ..unitutil.file import snippet_text
 from ..unitutil.mock import instance_mock, method_mock, property_mock
 
@@ -30,7 +32,7 @@ class DescribeBaseStoryPart(object):
 
         rId, image = story_part.get_or_add_image("image.png")
 
-        package_.get_or_add_image_part.assert_called_once_with("image.png")
+        package_.get_or_add_image_part.assert_called_once_with("image.png", None, None)
         relate_to_.assert_called_once_with(story_part, image_part_, RT.IMAGE)
         assert rId == "rId42"
         assert image is image_
@@ -72,10 +74,156 @@ class DescribeBaseStoryPart(object):
 
         inline = story_part.new_pic_inline("foo/bar.png", width=100, height=200)
 
-        get_or_add_image_.assert_called_once_with(story_part, "foo/bar.png")
+        get_or_add_image_.assert_called_once_with(story_part, "foo/bar.png", 100, 200)
         image_.scaled_dimensions.assert_called_once_with(100, 200)
         assert inline.xml == expected_xml
 
+    def it_indexes_the_inline_shapes_in_its_story(self):
+        hdr = element(
+            "w:hdr/(w:p/w:r/w:drawing/wp:inline{id=1},w:tbl/w:tr/w:tc/w:p/w:r/"
+            "w:drawing/wp:inline{id=2},w:p/w:hyperlink/w:r/w:drawing/wp:inline{id=3})"
+        )
+        story_part = BaseStoryPart(None, None, hdr, None)
+
+        inline_lst = story_part.inline_lst
+
+        assert [inline.get("id") for inline in inline_lst] == ["1", "2"]
+        assert story_part.inline_lst is inline_lst
+        assert story_part.inline_at(-1) is inline_lst[1]
+
+    @pytest.mark.parametrize(
+        "hdr_cxml, new_idx",
+        (
+            ("w:hdr/(w:p/%s,w:p/%s,w:p/w:r)", 2),
+            ("w:hdr/(w:p/%s,w:p/w:r,w:p/%s)", 1),
+            ("w:hdr/(w:p/(w:r,%s),w:p/%s)", 0),
+        ),
+    )
+    def it_adds_a_new_inline_shape_to_its_index(self, hdr_cxml, new_idx):
+        r_cxml = "w:r/w:drawing/wp:inline"
+        hdr = element(hdr_cxml % (r_cxml, r_cxml))
+        story_part = BaseStoryPart(None, None, hdr, None)
+        inline_lst = story_part.inline_lst
+        empty_r = [r for r in hdr.xpath(".//w:r") if not len(r)][0]
+        inline = element("wp:inline{id=42}")
+        empty_r.add_drawing(inline)
+
+        story_part.index_inline(inline)
+
+        assert story_part.inline_lst is inline_lst
+        assert inline_lst.index(inline) == new_idx
+        assert inline_lst == hdr.xpath(".//wp:inline")
+
+    def it_rebuilds_its_inline_index_when_a_shape_is_removed(self):
+        hdr = element(
+            "w:hdr/(w:p/w:r/w:drawing/wp:inline{id=1},w:p/w:r/w:drawing/"
+            "wp:inline{id=2})"
+        )
+        story_part = BaseStoryPart(None, None, hdr, None)
+        assert story_part.inline_at(0).get("id") == "1"
+        hdr.remove(hdr[0])
+
+        assert story_part.inline_at(0).get("id") == "2"
+        assert len(story_part.inline_lst) == 1
+
+    def it_checks_only_the_inline_it_returns(self, request):
+        hdr = element("w:hdr/(%s)" % ",".join(["w:p/w:r/w:drawing/wp:inline"] * 50))
+        story_part = BaseStoryPart(None, None, hdr, None)
+        _is_in_story_ = method_mock(
+            request, BaseStoryPart, "_is_in_story", return_value=True
+        )
+        inline_lst = story_part.inline_lst
+
+        for idx in range(50):
+            assert story_part.inline_at(idx) is inline_lst[idx]
+            assert len(story_part.inline_lst) == 50
+
+        assert story_part.inline_lst is inline_lst
+        assert _is_in_story_.call_count == 50
+
+    def it_rebuilds_its_inline_index_after_a_reset(self):
+        hdr = element("w:hdr/w:p/w:r/w:drawing/wp:inline")
+        story_part = BaseStoryPart(None, None, hdr, None)
+        assert len(story_part.inline_lst) == 1
+        hdr.append(element("w:p/w:r/w:drawing/wp:inline"))
+
+        story_part.reset_inline_index()
+
+        assert len(story_part.inline_lst) == 2
+
+    def it_can_normalize_the_runs_of_its_paragraphs(self):
+        hdr = element(
+            'w:hdr/(w:p/(w:r/w:t"a",w:r/w:t"b"),w:tbl/w:tr/w:tc/w:p/(w:r/w:t"c",'
+            'w:r/w:t"d"))'
+        )
+        story_part = BaseStoryPart(None, None, hdr, None)
+        story_part.blob
+        story_part.inline_lst
+
+        story_part.normalize_runs()
+
+        assert hdr.xml == xml(
+            'w:hdr/(w:p/w:r/w:t"ab",w:tbl/w:tr/w:tc/w:p/w:r/w:t"cd")'
+        )
+        assert story_part.memory_usage().cache_names == ()
+
+    def it_drops_its_inline_index_with_its_other_caches(self):
+        hdr = element("w:hdr/w:p/w:r/w:drawing/wp:inline")
+        story_part = BaseStoryPart(None, None, hdr, None)
+        story_part.inline_lst
+        assert story_part.memory_usage().cache_names == ("inline_index",)
+
+        story_part.drop_caches()
+
+        assert story_part.memory_usage().cache_names == ()
+        assert len(story_part.inline_lst) == 1
+
+    @pytest.mark.parametrize("cache_proxies", (True, False))
+    def it_provides_access_to_its_proxy_cache(
+        self, package_, document_part_, cache_proxies
+    ):
+        package_.main_document_part = document_part_
+        document_part_.cache_proxies = cache_proxies
+        story_part = BaseStoryPart(None, None, element("w:hdr/w:p"), package_)
+
+        proxy_cache = story_part._proxy_cache
+
+        if cache_proxies:
+            assert isinstance(proxy_cache, ProxyCache)
+            assert story_part._proxy_cache is proxy_cache
+        else:
+            assert proxy_cache is None
+
+    def it_drops_its_proxy_cache_with_its_other_caches(
+        self, package_, document_part_
+    ):
+        package_.main_document_part = document_part_
+        document_part_.cache_proxies = True
+        hdr = element("w:hdr/w:p")
+        story_part = BaseStoryPart(None, None, hdr, package_)
+        paragraph = story_part._proxy_cache.proxy(Paragraph, hdr[0], None)
+        assert story_part.memory_usage().cache_names == ("proxy_cache",)
+
+        story_part.drop_caches()
+
+        assert story_part.memory_usage().cache_names == ()
+        assert story_part._proxy_cache.proxy(Paragraph, hdr[0], None) is not paragraph
+
+    def it_can_find_the_inline_shapes_that_embed_an_image(self):
+        hdr = element(
+            "w:hdr/(w:p/w:r/w:drawing/wp:inline{id=1}/a:graphic/a:graphicData/pic:pic/"
+            "pic:blipFill/a:blip{r:embed=rId1},w:p/w:r/w:drawing/wp:inline{id=2}/"
+            "a:graphic/a:graphicData/pic:pic/pic:blipFill/a:blip{r:embed=rId2},w:p/"
+            "w:r/w:drawing/wp:inline{id=3}/a:graphic/a:graphicData/pic:pic/"
+            "pic:blipFill/a:blip{r:embed=rId1})"
+        )
+        story_part = BaseStoryPart(None, None, hdr, None)
+
+        inlines = story_part.inlines_for_rId("rId1")
+
+        assert [inline.get("id") for inline in inlines] == ["1", "3"]
+        assert story_part.inlines_for_rId("rId9") == []
+
     def it_knows_the_next_available_xml_id(self, next_id_fixture):
         story_element, expected_value = next_id_fixture
         story_part = BaseStoryPart(None, None, story_element, None)
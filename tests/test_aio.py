@@ -0,0 +1,130 @@
+# encoding: utf-8
+
+"""Unit test suite for the docx.aio module"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+import pytest
+
+import docx
+from docx import aio
+from docx.document import Document
+
+from .unitutil.file import test_file
+
+
+class DescribeOpenAsync(object):
+
+    def it_opens_a_document_from_a_path(self):
+        document = _run(docx.open_async(test_file("test.docx")))
+
+        assert isinstance(document, Document)
+
+    def it_opens_a_document_from_bytes(self):
+        with open(test_file("test.docx"), "rb") as f:
+            blob = f.read()
+
+        document = _run(docx.open_async(blob))
+
+        assert isinstance(document, Document)
+
+    def it_opens_a_document_from_an_async_file(self):
+        with open(test_file("test.docx"), "rb") as f:
+            source = _AsyncFile(f.read())
+
+        document = _run(docx.open_async(source))
+
+        assert isinstance(document, Document)
+
+    def it_uses_the_configured_executor(self, configure_):
+        executor = _CountingExecutor(1)
+        aio.configure(executor=executor)
+
+        document = _run(docx.open_async())
+
+        assert isinstance(document, Document)
+        assert executor.submit_count == 1
+
+
+class DescribeSaveAsync(object):
+
+    def it_saves_a_document_to_a_stream(self):
+        stream = BytesIO()
+
+        _run(docx.Document().save_async(stream))
+
+        assert isinstance(docx.Document(stream), Document)
+
+    def it_saves_a_document_to_an_async_sink(self, monkeypatch):
+        monkeypatch.setattr(aio, "_CHUNK_SIZE", 1024)
+        sink = _AsyncFile()
+
+        _run(docx.Document().save_async(sink))
+
+        assert sink.write_count > 1
+        assert isinstance(docx.Document(BytesIO(sink.getvalue())), Document)
+
+    def it_bounds_how_many_documents_are_saved_at_once(self, configure_, monkeypatch):
+        counts = {"active": 0, "max_active": 0}
+
+        async def _save(document, path_or_stream):
+            counts["active"] += 1
+            counts["max_active"] = max(counts["max_active"], counts["active"])
+            await asyncio.sleep(0.01)
+            counts["active"] -= 1
+
+        monkeypatch.setattr(aio, "_save", _save)
+        aio.configure(max_concurrency=2)
+        document = docx.Document()
+
+        async def save_all():
+            await asyncio.gather(*(document.save_async(BytesIO()) for _ in range(5)))
+
+        _run(save_all())
+
+        assert counts["max_active"] == 2
+
+
+# fixtures -----------------------------------------------------------
+
+@pytest.fixture
+def configure_(request):
+    request.addfinalizer(aio.configure)
+
+
+# helpers ----------------------------------------------------------
+
+class _AsyncFile(BytesIO):
+    """File-like object having coroutine read and write methods."""
+
+    def __init__(self, blob=b""):
+        super(_AsyncFile, self).__init__(blob)
+        self.write_count = 0
+
+    async def read(self):
+        return super(_AsyncFile, self).read()
+
+    async def write(self, blob):
+        self.write_count += 1
+        super(_AsyncFile, self).write(blob)
+        await asyncio.sleep(0)
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    """Thread pool counting the calls submitted to it."""
+
+    submit_count = 0
+
+    def submit(self, *args, **kwargs):
+        self.submit_count += 1
+        return super(_CountingExecutor, self).submit(*args, **kwargs)
+
+
+def _run(awaitable):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(awaitable)
+    finally:
+        loop.close()
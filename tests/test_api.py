@@ -8,6 +8,9 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+import threading
+from io import BytesIO
+
 import pytest
 
 import docx
@@ -26,6 +29,27 @@ class DescribeDocument(object):
         Package_.open.assert_called_once_with(docx)
         assert document is document_
 
+    def it_can_open_edit_and_save_documents_in_several_threads_at_once(self):
+        results = {}
+
+        def work(n):
+            document = docx.Document()
+            for i in range(50):
+                document.add_paragraph('%d-%d' % (n, i))
+            stream = BytesIO()
+            document.save(stream)
+            results[n] = [p.text for p in docx.Document(stream).paragraphs]
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == dict(
+            (n, ['%d-%d' % (n, i) for i in range(50)]) for n in range(8)
+        )
+
     def it_opens_the_default_docx_if_none_specified(self, default_fixture):
         docx, Package_, document_ = default_fixture
         document = Document()
@@ -9,6 +9,7 @@ import pytest
 from docx.blkcntnr import BlockItemContainer
 from docx.shared import Inches
 from docx.table import Table
+from docx.text.parfmt import ParagraphFormatSpec
 from docx.text.paragraph import Paragraph
 
 from .unitutil.cxml import element, xml
@@ -30,6 +31,16 @@ class DescribeBlockItemContainer(object):
         assert paragraph.style == style
         assert paragraph is paragraph_
 
+    def it_can_add_a_paragraph_having_a_format(self, _add_paragraph_):
+        paragraph = Paragraph(element('w:p'), None)
+        _add_paragraph_.return_value = paragraph
+        blkcntnr = BlockItemContainer(None, None)
+        spec = ParagraphFormatSpec(keep_with_next=True)
+
+        blkcntnr.add_paragraph('Foo', format=spec)
+
+        assert paragraph._p.xml == xml('w:p/(w:pPr/w:keepNext,w:r/w:t"Foo")')
+
     def it_can_add_a_table(self, add_table_fixture):
         blkcntnr, rows, cols, width, expected_xml = add_table_fixture
         table = blkcntnr.add_table(rows, cols, width)
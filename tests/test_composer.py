@@ -0,0 +1,216 @@
+# encoding: utf-8
+
+"""Unit test suite for the docx.composer module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from docx.api import Document
+from docx.composer import Composer
+from docx.enum.style import WD_STYLE_TYPE
+from docx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from docx.opc.packuri import PackURI
+from docx.opc.part import XmlPart
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+
+from .unitutil.file import test_file
+
+
+class DescribeComposer(object):
+
+    def it_appends_the_body_content_of_a_document(self):
+        master = Document()
+        master.add_paragraph("master")
+        source = Document()
+        source.add_paragraph("foo")
+        source.add_table(rows=1, cols=1).cell(0, 0).text = "bar"
+
+        Composer(master).append(source)
+
+        assert [p.text for p in master.paragraphs] == ["master", "foo"]
+        assert master.tables[0].cell(0, 0).text == "bar"
+        assert master.element.body[-1].tag.endswith("sectPr")
+        assert [p.text for p in source.paragraphs] == ["foo"]
+
+    def it_copies_the_styles_the_content_uses(self):
+        master = Document()
+        master.styles["Quote"].font.bold = True
+        source = Document()
+        base = source.styles.add_style("Base", WD_STYLE_TYPE.PARAGRAPH)
+        custom = source.styles.add_style("Custom", WD_STYLE_TYPE.PARAGRAPH)
+        custom.base_style = base
+        source.add_paragraph("foo", style=custom)
+        source.add_paragraph("bar", style="Quote")
+
+        Composer(master).append(source)
+
+        assert master.paragraphs[0].style.name == "Custom"
+        assert master.styles["Custom"].base_style.name == "Base"
+        assert master.paragraphs[1].style.name == "Quote 1"
+        assert master.paragraphs[1].style.font.bold is None
+        assert master.styles["Quote"].font.bold is True
+
+    def it_shares_one_copy_of_a_style_between_sources(self):
+        master = Document()
+        style_count = len(master.styles)
+        composer = Composer(master)
+        for _ in range(2):
+            source = Document()
+            custom = source.styles.add_style("Custom", WD_STYLE_TYPE.PARAGRAPH)
+            custom.font.bold = True
+            source.add_paragraph("foo", style=custom)
+            source.add_paragraph("bar", style="Quote")
+            composer.append(source)
+
+        assert len(master.styles) == style_count + 1
+        assert [p.style.name for p in master.paragraphs] == [
+            "Custom", "Quote", "Custom", "Quote"
+        ]
+
+    def it_shares_one_copy_of_an_image_between_sources(self):
+        master = Document()
+        composer = Composer(master)
+        for _ in range(3):
+            source = Document()
+            source.add_picture(test_file("monty-truth.png"))
+            composer.append(source)
+
+        rIds = [
+            shape._inline.graphic.graphicData.pic.blipFill.blip.embed
+            for shape in master.inline_shapes
+        ]
+        assert len(master.inline_shapes) == 3
+        assert len(set(rIds)) == 1
+        assert len(master.part.package.image_parts) == 1
+
+    def it_gives_each_drawing_it_adds_a_new_id(self):
+        master = Document()
+        master.add_picture(test_file("monty-truth.png"))
+        composer = Composer(master)
+        for _ in range(2):
+            source = Document()
+            source.add_picture(test_file("monty-truth.png"))
+            composer.append(source)
+
+        ids = master.element.xpath("//wp:docPr/@id")
+        assert len(ids) == 3
+        assert len(set(ids)) == 3
+
+    def it_copies_the_footnotes_the_content_refers_to(self):
+        master = Document()
+        composer = Composer(master)
+        for text in ("foo", "bar"):
+            source = Document()
+            source.part.relate_to(
+                XmlPart(
+                    PackURI("/word/footnotes.xml"),
+                    CT.WML_FOOTNOTES,
+                    parse_xml(
+                        '<w:footnotes %s><w:footnote w:type="separator" w:id="-1"/>'
+                        '<w:footnote w:id="1"><w:p><w:r><w:t>%s</w:t></w:r></w:p>'
+                        "</w:footnote></w:footnotes>" % (nsdecls("w"), text)
+                    ),
+                    source.part.package,
+                ),
+                RT.FOOTNOTES,
+            )
+            source.add_paragraph()._p.append(
+                parse_xml(
+                    '<w:r %s><w:footnoteReference w:id="1"/></w:r>' % nsdecls("w")
+                )
+            )
+            composer.append(source)
+
+        footnotes = master.part.part_related_by(RT.FOOTNOTES).element
+        ref_ids = master.element.xpath("//w:footnoteReference/@w:id")
+        assert [f.get(qn("w:id")) for f in footnotes] == ["-1", "1", "2"]
+        assert ref_ids == ["1", "2"]
+        assert [t.text for t in footnotes.iter(qn("w:t"))] == ["foo", "bar"]
+
+    def it_copies_the_headers_of_the_sections_it_adds(self):
+        master = Document()
+        composer = Composer(master)
+        for text in ("foo", "bar"):
+            source = Document()
+            header = source.sections[0].header
+            header.is_linked_to_previous = False
+            header.paragraphs[0].text = text
+            source.add_section()
+            composer.append(source)
+
+        headers = [section.header for section in master.sections]
+        assert [h.paragraphs[0].text for h in headers] == ["foo", "bar", "bar"]
+        assert headers[0].part is not headers[1].part
+
+    def it_remaps_hyperlinks_to_relationships_of_the_master(self):
+        master = Document()
+        source = Document()
+        rId = source.part.relate_to("http://foo", RT.HYPERLINK, is_external=True)
+        source.add_paragraph()._p.append(
+            parse_xml('<w:hyperlink %s r:id="%s"/>' % (nsdecls("w", "r"), rId))
+        )
+        master.part.relate_to("http://bar", RT.HYPERLINK, is_external=True)
+
+        Composer(master).append(source)
+
+        new_rId = master.element.xpath("//w:hyperlink/@r:id")[0]
+        assert master.part.rels[new_rId].target_ref == "http://foo"
+
+    def it_numbers_a_copied_list_definition_after_each_in_the_master(self):
+        master = Document()
+        numbering = master.part.numbering_part.element
+        for abstractNumId in (91, 90):
+            numbering._insert_abstractNum(
+                parse_xml(
+                    '<w:abstractNum %s w:abstractNumId="%d"><w:lvl w:ilvl="0">'
+                    '<w:numFmt w:val="ordinal"/></w:lvl></w:abstractNum>'
+                    % (nsdecls("w"), abstractNumId)
+                )
+            )
+        source = Document()
+        source_numbering = source.part.numbering_part.element
+        source_numbering._insert_abstractNum(
+            parse_xml(
+                '<w:abstractNum %s w:abstractNumId="42"><w:lvl w:ilvl="0">'
+                '<w:numFmt w:val="cardinalText"/></w:lvl></w:abstractNum>'
+                % nsdecls("w")
+            )
+        )
+        numId = source_numbering.add_num(42).numId
+        numPr = source.add_paragraph()._p.get_or_add_pPr().get_or_add_numPr()
+        numPr.get_or_add_numId().val = numId
+
+        Composer(master).append(source)
+
+        abstractNumIds = [a.abstractNumId for a in numbering.abstractNum_lst]
+        assert abstractNumIds[-1] == 92
+        assert len(set(abstractNumIds)) == len(abstractNumIds)
+
+    def it_shares_list_definitions_between_sources(self):
+        master = Document()
+        numbering = master.part.numbering_part.element
+        abstractNum_count = len(numbering.abstractNum_lst)
+        composer = Composer(master)
+        for _ in range(2):
+            source = Document()
+            source_numbering = source.part.numbering_part.element
+            source_numbering._insert_abstractNum(
+                parse_xml(
+                    '<w:abstractNum %s w:abstractNumId="42"><w:nsid w:val="1"/>'
+                    '<w:lvl w:ilvl="0"><w:numFmt w:val="cardinalText"/></w:lvl>'
+                    "</w:abstractNum>" % nsdecls("w")
+                )
+            )
+            numId = source_numbering.add_num(42).numId
+            numPr = source.add_paragraph()._p.get_or_add_pPr().get_or_add_numPr()
+            numPr.get_or_add_numId().val = numId
+            composer.append(source)
+
+        numIds = [int(v) for v in master.element.xpath("//w:numPr/w:numId/@w:val")]
+        abstractNumIds = [
+            numbering.num_having_numId(numId).abstractNumId.val for numId in numIds
+        ]
+        assert len(numbering.abstractNum_lst) == abstractNum_count + 1
+        assert numIds[0] != numIds[1]
+        assert abstractNumIds[0] == abstractNumIds[1]
+        assert abstractNumIds[0] == numbering.abstractNum_lst[-1].abstractNumId
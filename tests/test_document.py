@@ -4,23 +4,30 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import pickle
+
 import pytest
 
+import docx
+
 from docx.document import _Body, Document
 from docx.enum.section import WD_SECTION
 from docx.enum.text import WD_BREAK
+from docx.image.policy import ImagePolicy
 from docx.opc.coreprops import CoreProperties
 from docx.parts.document import DocumentPart
+from docx.parts.hdrftr import HeaderPart
 from docx.section import Section, Sections
 from docx.settings import Settings
 from docx.shape import InlineShape, InlineShapes
 from docx.shared import Length
 from docx.styles.styles import Styles
-from docx.table import Table
+from docx.table import Table, _Cell
 from docx.text.paragraph import Paragraph
 from docx.text.run import Run
 
 from .unitutil.cxml import element, xml
+from .unitutil.file import test_file
 from .unitutil.mock import class_mock, instance_mock, method_mock, property_mock
 
 
@@ -58,7 +65,7 @@ class DescribeDocument(object):
     def it_can_add_a_paragraph(self, add_paragraph_fixture):
         document, text, style, paragraph_ = add_paragraph_fixture
         paragraph = document.add_paragraph(text, style)
-        document._body.add_paragraph.assert_called_once_with(text, style)
+        document._body.add_paragraph.assert_called_once_with(text, style, None)
         assert paragraph is paragraph_
 
     def it_can_add_a_picture(self, add_picture_fixture):
@@ -70,14 +77,15 @@ class DescribeDocument(object):
     def it_can_add_a_section(
         self, add_section_fixture, Section_, section_, document_part_
     ):
-        document_elm, start_type, expected_xml = add_section_fixture
+        sectPr, start_type, expected_xml = add_section_fixture
+        document_part_.add_section_break.return_value = sectPr
         Section_.return_value = section_
-        document = Document(document_elm, document_part_)
+        document = Document(None, document_part_)
 
         section = document.add_section(start_type)
 
-        assert document.element.xml == expected_xml
-        sectPr = document.element.xpath('w:body/w:sectPr')[0]
+        document_part_.add_section_break.assert_called_once_with()
+        assert sectPr.xml == expected_xml
         Section_.assert_called_once_with(sectPr, document_part_)
         assert section is section_
 
@@ -98,10 +106,168 @@ class DescribeDocument(object):
         core_properties = document.core_properties
         assert core_properties is core_properties_
 
+    def it_can_normalize_the_runs_of_each_story(self, request, document_part_):
+        header_part_ = instance_mock(request, HeaderPart)
+        document_part_.iter_story_parts.return_value = iter(
+            [document_part_, header_part_]
+        )
+        document = Document(None, document_part_)
+
+        document.normalize_runs()
+
+        document_part_.normalize_runs.assert_called_once_with()
+        header_part_.normalize_runs.assert_called_once_with()
+
+    def it_can_report_and_drop_the_memory_held_by_its_parts(self, document_part_):
+        package_ = document_part_.package
+        document = Document(None, document_part_)
+
+        report = document.memory_report()
+        document.drop_caches()
+
+        assert report is package_.memory_report.return_value
+        package_.drop_caches.assert_called_once_with()
+
+    def it_can_change_its_image_policy(self):
+        document = docx.Document()
+        policy = ImagePolicy(max_dpi=150)
+
+        document.image_policy = policy
+
+        assert document.image_policy is policy
+        assert document.part.package.image_parts.policy is policy
+
+    def it_can_reuse_the_proxy_objects_of_its_elements(self):
+        document = docx.Document()
+        document.add_paragraph("foo")
+        document.add_table(rows=2, cols=2)
+        header = document.sections[0].header
+        paragraph = document.paragraphs[0]
+        assert document.paragraphs[0] is not paragraph
+
+        document.cache_proxies = True
+
+        assert document.cache_proxies is True
+        paragraph, table = document.paragraphs[0], document.tables[0]
+        run, row, cell = paragraph.runs[0], table.rows[1], table.cell(0, 0)
+        header_paragraph = header.paragraphs[0]
+        assert document.paragraphs[0] is paragraph
+        assert document.tables[0] is table
+        assert document.paragraphs[0].runs[0] is run
+        assert list(table.rows)[1] is row
+        assert table.row_cells(0)[0] is cell
+        assert table.columns[0].cells[0] is cell
+        assert header.paragraphs[0] is header_paragraph
+        assert next(document.iter_list_labels())[0] is paragraph
+        new_paragraph = document.add_paragraph()
+        new_run = new_paragraph.add_run("bar")
+        new_table = document.add_table(rows=1, cols=2)
+        new_row = new_table.add_row()
+        earlier_paragraph = new_paragraph.insert_paragraph_before()
+        merged_cell = new_table.cell(0, 0).merge(new_table.cell(0, 1))
+        assert document.paragraphs[-1] is new_paragraph
+        assert document.paragraphs[-2] is earlier_paragraph
+        assert new_paragraph.runs[0] is new_run
+        assert document.tables[-1] is new_table
+        assert new_table.rows[-1] is new_row
+        assert new_table.cell(0, 0) is merged_cell
+        assert new_table.merge_ranges([(1, 0, 1, 1)])[0] is new_table.cell(1, 0)
+
+    def it_keeps_its_inline_shapes_current_as_content_is_removed(self):
+        document = docx.Document()
+        image_path = test_file("monty-truth.png")
+        for _ in range(4):
+            document.add_paragraph().add_run().add_picture(image_path)
+        cell = document.add_table(rows=1, cols=1).cell(0, 0)
+        cell.paragraphs[0].add_run().add_picture(image_path)
+        inline_shapes = document.inline_shapes
+        inlines = [shape._inline for shape in inline_shapes]
+
+        document.paragraphs[0].clear()
+        assert inline_shapes[1]._inline is inlines[2]
+        document.paragraphs[1].runs[0].text = "foo"
+        assert inline_shapes[1]._inline is inlines[3]
+        cell.text = "bar"
+        assert len(inline_shapes) == 2
+        document._body.clear_content()
+        assert len(inline_shapes) == 0
+
+    def it_can_be_pickled(self):
+        document = docx.Document()
+        document.add_paragraph("foo")
+
+        clone = pickle.loads(pickle.dumps(document))
+        clone.add_paragraph("bar")
+
+        assert isinstance(clone, Document)
+        assert [p.text for p in clone.paragraphs] == ["foo", "bar"]
+        assert [p.text for p in document.paragraphs] == ["foo"]
+
     def it_provides_access_to_its_inline_shapes(self, inline_shapes_fixture):
         document, inline_shapes_ = inline_shapes_fixture
         assert document.inline_shapes is inline_shapes_
 
+    def it_can_label_the_numbered_paragraphs_in_it(self, document_part_, request):
+        document_elm = element('w:document/w:body/(w:p,w:tbl/w:tr/w:tc/w:p,w:p)')
+        list_labeler_ = document_part_.new_list_labeler.return_value
+        list_labeler_.label.side_effect = ['1.', None, '2.']
+        document_part_._proxy_cache = None
+        document = Document(document_elm, document_part_)
+        ps = document_elm.xpath('//w:p')
+
+        pairs = list(document.iter_list_labels())
+
+        document_part_.new_list_labeler.assert_called_once_with()
+        assert [call[0][0] for call in list_labeler_.label.call_args_list] == ps
+        assert [(paragraph._p, label) for paragraph, label in pairs] == [
+            (ps[0], '1.'), (ps[1], None), (ps[2], '2.')
+        ]
+        assert all(isinstance(paragraph, Paragraph) for paragraph, _ in pairs)
+
+    def it_labels_a_numbered_list_inside_a_table_cell(self):
+        document = docx.Document()
+        document.add_paragraph('a', style='List Number')
+        cell = document.add_table(rows=1, cols=1).cell(0, 0)
+        cell.paragraphs[0].style = 'List Number'
+        cell.add_paragraph('b', style='List Number')
+        document.add_paragraph('c', style='List Number')
+
+        pairs = list(document.iter_list_labels())
+
+        assert [label for _, label in pairs] == ['1.', '2.', '3.', '4.']
+        assert [type(paragraph._parent) for paragraph, _ in pairs] == [
+            _Body, _Cell, _Cell, _Body
+        ]
+        assert pairs[1][0]._parent._tc is cell._tc
+        assert pairs[1][0]._parent._parent._tbl is document.tables[0]._tbl
+
+    @pytest.mark.parametrize('count, expected_count, expected_texts', (
+        (0, 3, ['a-b', 'c-', '-']),
+        (2, 2, ['a-b', 'c-', '{x}']),
+    ))
+    def it_can_replace_text_throughout_its_stories(
+        self, request, document_part_, count, expected_count, expected_texts
+    ):
+        document_elm = element(
+            'w:document/w:body/(w:p/(w:r/w:t"a{",w:r/w:t"x}b"),w:tbl/w:tr/w:tc/'
+            'w:p/w:r/w:t"c{x}")'
+        )
+        header_part_ = instance_mock(
+            request, HeaderPart, element=element('w:hdr/w:p/w:r/w:t"{x}"')
+        )
+        document_part_.element = document_elm
+        document_part_.iter_story_parts.return_value = iter(
+            [document_part_, header_part_]
+        )
+        document = Document(document_elm, document_part_)
+
+        replaced_count = document.replace(r'\{x\}', '-', count)
+
+        assert replaced_count == expected_count
+        document_part_.reset_inline_index.assert_called_once_with()
+        ps = document_elm.xpath('//w:p') + header_part_.element.xpath('//w:p')
+        assert [Paragraph(p, None).text for p in ps] == expected_texts
+
     def it_provides_access_to_its_paragraphs(self, paragraphs_fixture):
         document, paragraphs_ = paragraphs_fixture
         paragraphs = document.paragraphs
@@ -187,12 +353,9 @@ class DescribeDocument(object):
     ])
     def add_section_fixture(self, request):
         sentinel, start_type, new_sentinel = request.param
-        document_elm = element('w:document/w:body/(w:p,%s)' % sentinel)
-        expected_xml = xml(
-            'w:document/w:body/(w:p,w:p/w:pPr/%s,%s)' %
-            (sentinel, new_sentinel)
-        )
-        return document_elm, start_type, expected_xml
+        sectPr = element(sentinel)
+        expected_xml = xml(new_sentinel)
+        return sectPr, start_type, expected_xml
 
     @pytest.fixture
     def add_table_fixture(self, _block_width_prop_, body_prop_, table_):
@@ -356,10 +519,11 @@ class DescribeDocument(object):
 class Describe_Body(object):
 
     def it_can_clear_itself_of_all_content_it_holds(self, clear_fixture):
-        body, expected_xml = clear_fixture
+        body, document_part_, expected_xml = clear_fixture
         _body = body.clear_content()
         assert body._body.xml == expected_xml
         assert _body is body
+        document_part_.reset_section_index.assert_called_once_with()
 
     # fixtures -------------------------------------------------------
 
@@ -371,6 +535,8 @@ class Describe_Body(object):
     ])
     def clear_fixture(self, request):
         before_cxml, after_cxml = request.param
-        body = _Body(element(before_cxml), None)
+        document_ = instance_mock(request, Document)
+        document_.part = document_part_ = instance_mock(request, DocumentPart)
+        body = _Body(element(before_cxml), document_)
         expected_xml = xml(after_cxml)
-        return body, expected_xml
+        return body, document_part_, expected_xml
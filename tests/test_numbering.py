@@ -0,0 +1,218 @@
+# encoding: utf-8
+
+"""Unit test suite for the docx.numbering module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import pytest
+
+from docx.numbering import ListLabeler, _format_number
+from docx.oxml.shared import CT_DecimalNumber
+
+from .unitutil.cxml import element
+
+
+class DescribeListLabeler(object):
+
+    def it_labels_the_levels_of_a_list(self):
+        labeler = self._labeler("w:abstractNum{w:abstractNumId=0}/(%s)" % _OUTLINE)
+        numPrs = [(1, 0), (1, 1), (1, 1), (1, 2), (1, 2), (1, 0), (1, 1), (None, None)]
+
+        labels = [labeler.label(_p(*numPr)) for numPr in numPrs]
+
+        assert labels == ["1.", "1.a", "1.b", "1.b.i", "1.b.ii", "2.", "2.a", None]
+
+    def it_keeps_counting_a_level_that_never_restarts(self):
+        abstractNum = "w:abstractNum{w:abstractNumId=0}/(%s,%s)" % (
+            _lvl(0, "decimal", "%1"),
+            _lvl(1, "decimal", "%2-", extra=",w:lvlRestart{w:val=0}"),
+        )
+        labeler = self._labeler(abstractNum)
+        ps = [_p(1, 0), _p(1, 1), _p(1, 1), _p(1, 0), _p(1, 1)]
+
+        labels = [labeler.label(p_) for p_ in ps]
+
+        assert labels == ["1", "1-", "2-", "2", "3-"]
+
+    def it_continues_a_list_across_nums_sharing_an_abstract_definition(self):
+        labeler = self._labeler(
+            "w:abstractNum{w:abstractNumId=0}/(%s)" % _OUTLINE,
+            nums=(
+                "w:num{w:numId=1}/w:abstractNumId{w:val=0}",
+                "w:num{w:numId=2}/w:abstractNumId{w:val=0}",
+                "w:num{w:numId=3}/(w:abstractNumId{w:val=0},w:lvlOverride{w:ilvl=0}"
+                "/w:startOverride{w:val=7})",
+            ),
+        )
+        ps = [_p(1, 0), _p(2, 0), _p(3, 0), _p(3, 0), _p(1, 0)]
+
+        labels = [labeler.label(p_) for p_ in ps]
+
+        assert labels == ["1.", "2.", "7.", "8.", "9."]
+
+    def it_applies_a_level_override(self):
+        labeler = self._labeler(
+            "w:abstractNum{w:abstractNumId=0}/(%s)" % _OUTLINE,
+            nums=(
+                "w:num{w:numId=1}/(w:abstractNumId{w:val=0},w:lvlOverride{w:ilvl=0}"
+                "/%s)" % _lvl(0, "upperRoman", "%1-", start=3),
+            ),
+        )
+
+        labels = [labeler.label(p_) for p_ in (_p(1, 0), _p(1, 1), _p(1, 0))]
+
+        assert labels == ["III-", "III.a", "IV-"]
+
+    def it_renders_all_levels_as_decimals_for_a_legal_level(self):
+        abstractNum = "w:abstractNum{w:abstractNumId=0}/(%s,%s)" % (
+            _lvl(0, "upperRoman", "%1."),
+            _lvl(1, "lowerLetter", "%1.%2", extra=",w:isLgl"),
+        )
+        labeler = self._labeler(abstractNum)
+
+        labels = [labeler.label(p_) for p_ in (_p(1, 0), _p(1, 0), _p(1, 1))]
+
+        assert labels == ["I.", "II.", "2.1"]
+
+    def it_inherits_numbering_from_the_paragraph_style(self):
+        abstractNum = "w:abstractNum{w:abstractNumId=0}/(%s,%s)" % (
+            _lvl(0, "decimal", "%1."),
+            _lvl(1, "lowerLetter", "%2-", extra=",w:pStyle{w:val=Sub}"),
+        )
+        styles = element(
+            "w:styles/(w:style{w:type=paragraph,w:styleId=Clause}/w:pPr/w:numPr/("
+            "w:ilvl{w:val=0},w:numId{w:val=1}),w:style{w:type=paragraph,w:styleId="
+            "Clause2}/w:basedOn{w:val=Clause},w:style{w:type=paragraph,w:styleId=Sub}"
+            "/w:pPr/w:numPr/w:numId{w:val=1})"
+        )
+        labeler = self._labeler(abstractNum, styles=styles)
+        ps = [
+            _p(style="Clause"),
+            _p(style="Sub"),
+            _p(style="Clause2"),
+            _p(ilvl=1, style="Clause"),
+        ]
+
+        labels = [labeler.label(p_) for p_ in ps]
+
+        assert labels == ["1.", "a-", "2.", "a-"]
+
+    def it_follows_a_numbering_style_link(self):
+        labeler = self._labeler(
+            "w:abstractNum{w:abstractNumId=0}/(%s)" % _OUTLINE,
+            "w:abstractNum{w:abstractNumId=1}/w:numStyleLink{w:val=Outline}",
+            nums=(
+                "w:num{w:numId=1}/w:abstractNumId{w:val=0}",
+                "w:num{w:numId=2}/w:abstractNumId{w:val=1}",
+            ),
+            styles=element(
+                "w:styles/w:style{w:type=numbering,w:styleId=Outline}/w:pPr/w:numPr/"
+                "w:numId{w:val=1}"
+            ),
+        )
+
+        labels = [labeler.label(p_) for p_ in (_p(2, 0), _p(1, 0), _p(2, 1))]
+
+        assert labels == ["1.", "2.", "2.a"]
+
+    @pytest.mark.parametrize(
+        "numbering_cxml, numId",
+        (
+            (None, 1),
+            ("w:numbering", 1),
+            ("w:numbering/w:num{w:numId=1}/w:abstractNumId{w:val=0}", 1),
+            ("w:numbering/w:num{w:numId=0}/w:abstractNumId{w:val=0}", 0),
+        ),
+    )
+    def it_does_not_label_a_paragraph_outside_any_list(self, numbering_cxml, numId):
+        numbering = None if numbering_cxml is None else element(numbering_cxml)
+        labeler = ListLabeler(numbering, element("w:styles"))
+
+        assert labeler.label(_p(numId, 0)) is None
+
+    # fixture components ---------------------------------------------
+
+    def _labeler(self, *abstractNums, **kwargs):
+        nums = kwargs.get("nums", ("w:num{w:numId=1}/w:abstractNumId{w:val=0}",))
+        styles = kwargs.get("styles", element("w:styles"))
+        numbering = element("w:numbering/(%s)" % ",".join(abstractNums + nums))
+        return ListLabeler(numbering, styles)
+
+
+class Describe_format_number(object):
+
+    @pytest.mark.parametrize(
+        "value, num_fmt, expected_value",
+        (
+            (3, "decimal", "3"),
+            (3, "decimalZero", "03"),
+            (12, "decimalZero", "12"),
+            (1, "lowerLetter", "a"),
+            (28, "lowerLetter", "bb"),
+            (26, "upperLetter", "Z"),
+            (4, "lowerRoman", "iv"),
+            (1994, "upperRoman", "MCMXCIV"),
+            (0, "lowerRoman", "0"),
+            (5, "bullet", ""),
+            (5, "none", ""),
+            (5, "ordinalText", "5"),
+        ),
+    )
+    def it_renders_a_number_in_a_list_number_format(
+        self, value, num_fmt, expected_value
+    ):
+        assert _format_number(value, num_fmt) == expected_value
+
+
+class DescribeCT_Lvl(object):
+
+    @pytest.mark.parametrize(
+        "lvl_cxml, expected_value",
+        (("w:lvl{w:ilvl=0}", 0), ("w:lvl{w:ilvl=0}/w:start{w:val=3}", 3)),
+    )
+    def it_knows_its_start_value(self, lvl_cxml, expected_value):
+        assert element(lvl_cxml).start_val == expected_value
+
+    def but_it_leaves_a_start_element_elsewhere_alone(self):
+        tcPr = element(
+            "w:tcPr/(w:tcBorders/w:start{w:val=single,w:sz=4},"
+            "w:tcMar/w:start{w:w=108,w:type=dxa})"
+        )
+        starts = tcPr.xpath(".//w:start")
+
+        assert len(starts) == 2
+        assert not any(isinstance(start, CT_DecimalNumber) for start in starts)
+
+
+# helpers ----------------------------------------------------------
+
+def _lvl(ilvl, fmt, text, start=1, extra=""):
+    return (
+        "w:lvl{w:ilvl=%d}/(w:start{w:val=%d},w:numFmt{w:val=%s}%s,"
+        "w:lvlText{w:val=%s})" % (ilvl, start, fmt, extra, text)
+    )
+
+
+_OUTLINE = ",".join(
+    (
+        _lvl(0, "decimal", "%1."),
+        _lvl(1, "lowerLetter", "%1.%2"),
+        _lvl(2, "lowerRoman", "%1.%2.%3"),
+    )
+)
+
+
+def _p(numId=None, ilvl=None, style=None):
+    pPr_children = []
+    if style is not None:
+        pPr_children.append("w:pStyle{w:val=%s}" % style)
+    numPr_children = []
+    if ilvl is not None:
+        numPr_children.append("w:ilvl{w:val=%d}" % ilvl)
+    if numId is not None:
+        numPr_children.append("w:numId{w:val=%d}" % numId)
+    if numPr_children:
+        pPr_children.append("w:numPr/(%s)" % ",".join(numPr_children))
+    if not pPr_children:
+        return element("w:p")
+    return element("w:p/w:pPr/(%s)" % ",".join(pPr_children))
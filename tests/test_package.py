@@ -7,6 +7,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 import pytest
 
 from docx.image.image import Image
+from docx.image.policy import ImagePolicy
 from docx.opc.packuri import PackURI
 from docx.package import ImageParts, Package
 from docx.parts.image import ImagePart
@@ -26,7 +27,9 @@ class DescribePackage(object):
 
         image_part = package.get_or_add_image_part("image.png")
 
-        image_parts_.get_or_add_image_part.assert_called_once_with("image.png")
+        image_parts_.get_or_add_image_part.assert_called_once_with(
+            "image.png", None, None
+        )
         assert image_part is image_part_
 
     def it_gathers_package_image_parts_after_unmarshalling(self):
@@ -36,6 +39,16 @@ class DescribePackage(object):
         for image_part in image_parts:
             assert isinstance(image_part, ImagePart)
 
+    def it_drops_the_caches_of_its_image_parts_collection(
+        self, image_parts_prop_, image_parts_
+    ):
+        image_parts_prop_.return_value = image_parts_
+        package = Package()
+
+        package.drop_caches()
+
+        image_parts_.drop_caches.assert_called_once_with()
+
     # fixture components ---------------------------------------------
 
     @pytest.fixture
@@ -83,6 +96,51 @@ class DescribeImageParts(object):
         _add_image_part_.assert_called_once_with(image_parts, image_)
         assert image_part is image_part_
 
+    def it_resamples_the_image_as_its_policy_requires(
+        self, Image_, image_, policy_, resampled_image_, _get_by_sha1_, image_part_
+    ):
+        Image_.from_file.return_value = image_
+        image_.sha1 = "f005ba11"
+        policy_.target_px_size.return_value = (40, 30)
+        policy_.transform.return_value = resampled_image_
+        resampled_image_.sha1 = "c0ffee"
+        _get_by_sha1_.return_value = image_part_
+        image_part_.image.sha1 = "c0ffee"
+        image_parts = ImageParts()
+        image_parts.policy = policy_
+
+        image_parts.get_or_add_image_part("image.jpg", 100, 200)
+        image_part = image_parts.get_or_add_image_part("image.jpg", 100, 200)
+
+        policy_.target_px_size.assert_called_with(image_, 100, 200)
+        policy_.transform.assert_called_once_with(image_, 40, 30)
+        _get_by_sha1_.assert_called_with(image_parts, "c0ffee")
+        assert image_part is image_part_
+
+    def it_resamples_again_once_the_resampled_image_part_is_gone(
+        self, Image_, image_, policy_, resampled_image_, _get_by_sha1_
+    ):
+        Image_.from_file.return_value = image_
+        image_.sha1 = "f005ba11"
+        policy_.target_px_size.return_value = (40, 30)
+        policy_.transform.return_value = resampled_image_
+        resampled_image_.sha1 = "c0ffee"
+        _get_by_sha1_.return_value = None
+        image_parts = ImageParts()
+        image_parts.policy = policy_
+
+        assert image_parts._apply_policy(image_, 100, 200) is resampled_image_
+        assert image_parts._apply_policy(image_, 100, 200) is resampled_image_
+        assert policy_.transform.call_count == 2
+
+    def it_forgets_resampled_images_when_it_drops_its_caches(self):
+        image_parts = ImageParts()
+        image_parts._transformed_images[("f005ba11", None, 40, 30)] = "c0ffee"
+
+        image_parts.drop_caches()
+
+        assert image_parts._transformed_images == {}
+
     def it_knows_the_next_available_image_partname(self, next_partname_fixture):
         image_parts, ext, expected_partname = next_partname_fixture
         assert image_parts._next_image_partname(ext) == expected_partname
@@ -135,6 +193,14 @@ class DescribeImageParts(object):
     def Image_(self, request):
         return class_mock(request, 'docx.package.Image')
 
+    @pytest.fixture
+    def policy_(self, request):
+        return instance_mock(request, ImagePolicy)
+
+    @pytest.fixture
+    def resampled_image_(self, request):
+        return instance_mock(request, Image)
+
     @pytest.fixture
     def image_(self, request):
         return instance_mock(request, Image)
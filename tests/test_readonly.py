@@ -0,0 +1,100 @@
+# encoding: utf-8
+
+"""Unit test suite for the docx.readonly module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from io import BytesIO
+
+import pytest
+
+from lxml import etree
+
+import docx
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from docx.readonly import ReadOnlyDocument
+
+from .unitutil.cxml import element
+from .unitutil.file import test_file
+
+
+class DescribeReadOnlyDocument(object):
+
+    def it_gives_the_same_text_and_style_ids_as_a_full_document(self):
+        document = docx.Document()
+        paragraph = document.add_paragraph("foo\tbar", style="Quote")
+        paragraph.add_run(" baz", style="Strong").add_break()
+        table = document.add_table(rows=2, cols=2)
+        table.style = "Light Grid"
+        table.cell(1, 1).text = "qux"
+        table.cell(1, 1).add_table(rows=1, cols=1)
+        stream = BytesIO()
+        document.save(stream)
+
+        read_only = docx.Document(stream, read_only=True)
+
+        assert isinstance(read_only, ReadOnlyDocument)
+        assert [p.text for p in read_only.paragraphs] == [
+            p.text for p in document.paragraphs
+        ]
+        assert read_only.paragraphs[0].style_id == "Quote"
+        assert [r.style_id for r in read_only.paragraphs[0].runs] == [None, "Strong"]
+        assert [r.text for r in read_only.paragraphs[0].runs] == ["foo\tbar", " baz\n"]
+        assert read_only.tables[0].style_id == "LightGrid"
+        assert [[c.text for c in row.cells] for row in read_only.tables[0].rows] == [
+            ["", ""],
+            ["", "qux\n"],
+        ]
+        assert len(read_only.tables[0].rows[1].cells[1].tables) == 1
+
+    def it_provides_the_core_properties(self):
+        read_only = docx.Document(test_file("test.docx"), read_only=True)
+
+        core_properties = read_only.core_properties
+
+        assert core_properties.title == docx.Document(
+            test_file("test.docx")
+        ).core_properties.title
+
+    def it_parses_without_the_custom_element_classes(self):
+        read_only = docx.Document(test_file("test.docx"), read_only=True)
+
+        assert type(read_only.element) is etree._Element
+        assert type(read_only.paragraphs[0].element) is etree._Element
+
+    def it_raises_on_a_package_that_is_not_a_Word_document(self):
+        stream = BytesIO()
+        document = docx.Document()
+        document.part._content_type = "application/foo+xml"
+        document.save(stream)
+
+        with pytest.raises(ValueError):
+            docx.Document(stream, read_only=True)
+
+
+class DescribeReadOnlyParagraph(object):
+
+    def it_knows_its_text_and_style_id(self):
+        p = element('w:p/(w:pPr/w:pStyle{w:val=Foo},w:r/(w:t"a",w:tab,w:cr,w:t"b"))')
+
+        paragraph = _read_only(p).paragraphs[0]
+
+        assert paragraph.text == "a\t\nb"
+        assert paragraph.style_id == "Foo"
+
+    def it_has_no_style_id_when_none_is_applied(self):
+        paragraph = _read_only(element("w:p/w:r/w:t\"a\"")).paragraphs[0]
+
+        assert paragraph.style_id is None
+
+
+# helpers ----------------------------------------------------------
+
+def _read_only(p):
+    """Return |ReadOnlyDocument| having *p* as the only paragraph of its body."""
+    document = parse_xml(
+        "<w:document %s><w:body/></w:document>" % nsdecls("w")
+    )
+    document[0].append(p)
+    return ReadOnlyDocument(document, None)
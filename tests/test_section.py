@@ -19,9 +19,9 @@ from .unitutil.mock import call, class_mock, instance_mock, method_mock, propert
 class DescribeSections(object):
 
     def it_knows_how_many_sections_it_contains(self):
-        sections = Sections(
-            element("w:document/w:body/(w:p/w:pPr/w:sectPr, w:sectPr)"), None
-        )
+        document_elm = element("w:document/w:body/(w:p/w:pPr/w:sectPr, w:sectPr)")
+        document_part = DocumentPart(None, None, document_elm, None)
+        sections = Sections(document_elm, document_part)
         assert len(sections) == 2
 
     def it_can_iterate_over_its_Section_instances(
@@ -29,6 +29,7 @@ class DescribeSections(object):
     ):
         document_elm = element("w:document/w:body/(w:p/w:pPr/w:sectPr, w:sectPr)")
         sectPrs = document_elm.xpath("//w:sectPr")
+        document_part_.sectPr_lst = sectPrs
         Section_.return_value = section_
         sections = Sections(document_elm, document_part_)
 
@@ -46,6 +47,7 @@ class DescribeSections(object):
             "w:document/w:body/(w:p/w:pPr/w:sectPr,w:p/w:pPr/w:sectPr,w:sectPr)"
         )
         sectPrs = document_elm.xpath("//w:sectPr")
+        document_part_.sectPr_lst = sectPrs
         Section_.return_value = section_
         sections = Sections(document_elm, document_part_)
 
@@ -65,6 +67,7 @@ class DescribeSections(object):
             "w:document/w:body/(w:p/w:pPr/w:sectPr,w:p/w:pPr/w:sectPr,w:sectPr)"
         )
         sectPrs = document_elm.xpath("//w:sectPr")
+        document_part_.sectPr_lst = sectPrs
         Section_.return_value = section_
         sections = Sections(document_elm, document_part_)
 
@@ -653,7 +656,7 @@ class Describe_Footer(object):
         footer._drop_definition()
 
         assert sectPr.xml == xml("w:sectPr{r:a=b}")
-        document_part_.drop_rel.assert_called_once_with("rId42")
+        document_part_.drop_footer_part.assert_called_once_with("rId42")
 
     def it_knows_when_it_has_a_definition_to_help(self, has_definition_fixture):
         sectPr, expected_value = has_definition_fixture
@@ -668,21 +671,26 @@ class Describe_Footer(object):
     ):
         doc_elm = element("w:document/(w:sectPr,w:sectPr)")
         prior_sectPr, sectPr = doc_elm[0], doc_elm[1]
+        document_part_.footer_source_sectPr.return_value = prior_sectPr
         footer = _Footer(sectPr, document_part_, WD_HEADER_FOOTER.EVEN_PAGE)
         # ---mock must occur after construction of "real" footer---
         _Footer_ = class_mock(request, "docx.section._Footer", return_value=footer_)
 
         prior_footer = footer._prior_headerfooter
 
+        document_part_.footer_source_sectPr.assert_called_once_with(
+            sectPr, WD_HEADER_FOOTER.EVEN_PAGE
+        )
         _Footer_.assert_called_once_with(
             prior_sectPr, document_part_, WD_HEADER_FOOTER.EVEN_PAGE
         )
         assert prior_footer is footer_
 
-    def but_it_returns_None_when_its_the_first_footer(self):
+    def but_it_returns_None_when_its_the_first_footer(self, document_part_):
         doc_elm = element("w:document/w:sectPr")
         sectPr = doc_elm[0]
-        footer = _Footer(sectPr, None, None)
+        document_part_.footer_source_sectPr.return_value = None
+        footer = _Footer(sectPr, document_part_, None)
 
         prior_footer = footer._prior_headerfooter
 
@@ -764,21 +772,26 @@ class Describe_Header(object):
     ):
         doc_elm = element("w:document/(w:sectPr,w:sectPr)")
         prior_sectPr, sectPr = doc_elm[0], doc_elm[1]
+        document_part_.header_source_sectPr.return_value = prior_sectPr
         header = _Header(sectPr, document_part_, WD_HEADER_FOOTER.PRIMARY)
         # ---mock must occur after construction of "real" header---
         _Header_ = class_mock(request, "docx.section._Header", return_value=header_)
 
         prior_header = header._prior_headerfooter
 
+        document_part_.header_source_sectPr.assert_called_once_with(
+            sectPr, WD_HEADER_FOOTER.PRIMARY
+        )
         _Header_.assert_called_once_with(
             prior_sectPr, document_part_, WD_HEADER_FOOTER.PRIMARY
         )
         assert prior_header is header_
 
-    def but_it_returns_None_when_its_the_first_header(self):
+    def but_it_returns_None_when_its_the_first_header(self, document_part_):
         doc_elm = element("w:document/w:sectPr")
         sectPr = doc_elm[0]
-        header = _Header(sectPr, None, None)
+        document_part_.header_source_sectPr.return_value = None
+        header = _Header(sectPr, document_part_, None)
 
         prior_header = header._prior_headerfooter
 
@@ -10,6 +10,7 @@ import pytest
 
 from docx.enum.shape import WD_INLINE_SHAPE
 from docx.oxml.ns import nsmap
+from docx.parts.document import DocumentPart
 from docx.shape import InlineShape, InlineShapes
 from docx.shared import Length
 
@@ -62,11 +63,13 @@ class DescribeInlineShapes(object):
 
     @pytest.fixture
     def inline_shapes_fixture(self):
-        body = element(
-            'w:body/w:p/(w:r/w:drawing/wp:inline, w:r/w:drawing/wp:inline)'
+        document = element(
+            'w:document/w:body/(w:p/(w:r/w:drawing/wp:inline, w:r/w:drawing/'
+            'wp:inline),w:tbl/w:tr/w:tc/w:p/w:r/w:drawing/wp:inline)'
         )
-        inline_shapes = InlineShapes(body, None)
-        expected_count = 2
+        document_part = DocumentPart(None, None, document, None)
+        inline_shapes = InlineShapes(document.body, document_part)
+        expected_count = 3
         return inline_shapes, expected_count
 
     # fixture components ---------------------------------------------
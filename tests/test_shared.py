@@ -8,12 +8,17 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+import gc
+
 import pytest
 
 from docx.opc.part import XmlPart
 from docx.shared import (
-    ElementProxy, Length, Cm, Emu, Inches, Mm, Pt, RGBColor, Twips
+    ElementProxy, Length, Cm, Emu, Inches, Mm, Parented, ProxyCache, Pt,
+    RGBColor, Twips
 )
+from docx.text.paragraph import Paragraph
+from docx.text.run import Run
 
 from .unitutil.cxml import element
 from .unitutil.mock import instance_mock
@@ -117,6 +122,86 @@ class DescribeLength(object):
         return emu, units_prop_name, expected_length_in_units, type_
 
 
+class DescribeParented(object):
+
+    def it_has_no_instance_dict(self):
+        paragraph = Paragraph(element('w:p'), None)
+        with pytest.raises(AttributeError):
+            paragraph.foo = 42
+
+    def it_makes_a_new_proxy_when_caching_is_off(self):
+        parent = Parented(None)
+        p = element('w:p')
+        new_paragraph = parent._proxy_factory(Paragraph)
+
+        paragraph = new_paragraph(p)
+
+        assert isinstance(paragraph, Paragraph)
+        assert paragraph._p is p
+        assert paragraph._parent is parent
+        assert new_paragraph(p) is not paragraph
+
+    def it_reuses_a_proxy_from_the_proxy_cache_when_on(self, request):
+        parent_ = instance_mock(request, Paragraph)
+        parent_._proxy_cache = ProxyCache()
+        parent = Parented(parent_)
+        p = element('w:p')
+        new_paragraph = parent._proxy_factory(Paragraph)
+
+        paragraph = new_paragraph(p)
+
+        assert paragraph._parent is parent
+        assert new_paragraph(p) is paragraph
+
+
+class DescribeProxyCache(object):
+
+    def it_returns_the_proxy_it_holds_for_an_element(self):
+        cache, p = ProxyCache(), element('w:p')
+
+        paragraph = cache.proxy(Paragraph, p, None)
+
+        assert cache.proxy(Paragraph, p, None) is paragraph
+        assert len(cache) == 1
+
+    def it_makes_a_new_proxy_when_the_type_differs(self):
+        cache, r = ProxyCache(), element('w:r')
+        paragraph = cache.proxy(Paragraph, r, None)
+
+        run = cache.proxy(Run, r, None)
+
+        assert isinstance(run, Run)
+        assert run is not paragraph
+        assert cache.proxy(Run, r, None) is run
+
+    def it_makes_a_new_proxy_when_the_parent_differs(self):
+        cache, p = ProxyCache(), element('w:p')
+        parent, other_parent = object(), object()
+        paragraph = cache.proxy(Paragraph, p, parent)
+
+        other_paragraph = cache.proxy(Paragraph, p, other_parent)
+
+        assert other_paragraph is not paragraph
+        assert other_paragraph._parent is other_parent
+        assert cache.proxy(Paragraph, p, parent) is paragraph
+
+    def it_holds_a_proxy_only_while_it_is_referenced(self):
+        cache, p = ProxyCache(), element('w:p')
+        cache.proxy(Paragraph, p, None)
+        gc.collect()
+
+        assert len(cache) == 0
+
+    def it_can_forget_the_proxies_it_holds(self):
+        cache, p = ProxyCache(), element('w:p')
+        paragraph = cache.proxy(Paragraph, p, None)
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.proxy(Paragraph, p, None) is not paragraph
+
+
 class DescribeRGBColor(object):
 
     def it_is_natively_constructed_using_three_ints_0_to_255(self):
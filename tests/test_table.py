@@ -11,7 +11,7 @@ from docx.enum.table import (
     WD_ALIGN_VERTICAL, WD_ROW_HEIGHT, WD_TABLE_ALIGNMENT, WD_TABLE_DIRECTION
 )
 from docx.oxml import parse_xml
-from docx.oxml.table import CT_Tc
+from docx.oxml.table import CT_Tbl, CT_Tc
 from docx.parts.document import DocumentPart
 from docx.shared import Inches
 from docx.table import _Cell, _Column, _Columns, _Row, _Rows, Table
@@ -21,7 +21,7 @@ from .oxml.unitdata.table import a_gridCol, a_tbl, a_tblGrid, a_tc, a_tr
 from .oxml.unitdata.text import a_p
 from .unitutil.cxml import element, xml
 from .unitutil.file import snippet_seq
-from .unitutil.mock import instance_mock, property_mock
+from .unitutil.mock import instance_mock, method_mock, property_mock
 
 
 class DescribeTable(object):
@@ -59,6 +59,20 @@ class DescribeTable(object):
         columns = table.columns
         assert isinstance(columns, _Columns)
 
+    def it_can_merge_a_batch_of_cell_ranges(self, tbl_, part_prop_, document_part_):
+        tc_, tc_2_ = element('w:tc'), element('w:tc')
+        tbl_.merge_ranges.return_value = [tc_, tc_2_]
+        table = Table(tbl_, None)
+        ranges = [(0, 0, 1, 1), (2, 0, 2, 1)]
+
+        merged_cells = table.merge_ranges(ranges)
+
+        document_part_.reset_inline_index.assert_called_once_with()
+        tbl_.merge_ranges.assert_called_once_with(ranges)
+        assert [cell._tc for cell in merged_cells] == [tc_, tc_2_]
+        assert all(isinstance(cell, _Cell) for cell in merged_cells)
+        assert all(cell._parent is table for cell in merged_cells)
+
     def it_provides_access_to_the_cells_in_a_column(self, col_cells_fixture):
         table, column_idx, expected_cells = col_cells_fixture
         column_cells = table.column_cells(column_idx)
@@ -67,6 +81,9 @@ class DescribeTable(object):
     def it_provides_access_to_the_cells_in_a_row(self, row_cells_fixture):
         table, row_idx, expected_cells = row_cells_fixture
         row_cells = table.row_cells(row_idx)
+        table._tr_cells.assert_called_once_with(
+            table, table._tbl.tr_lst[row_idx]
+        )
         assert row_cells == expected_cells
 
     def it_knows_its_alignment_setting(self, alignment_get_fixture):
@@ -126,6 +143,26 @@ class DescribeTable(object):
             for idx in matching_idxs[1:]:
                 assert cells[idx] is cells[comparator_idx]
 
+    def it_provides_the_cells_of_one_row_to_help(self, tr_cells_fixture):
+        table, tr, expected_cells = tr_cells_fixture
+        cells = table._tr_cells(tr)
+        assert [cell._tc for cell in cells] == [c._tc for c in expected_cells]
+        for idx, cell in enumerate(cells[1:]):
+            assert (cell is cells[idx]) is (cell._tc is cells[idx]._tc)
+
+    def it_stops_at_a_short_row_above_a_vertical_merge(self):
+        tbl = element(
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/w:tc/w:p,'
+            'w:tr/(w:tc/w:p,w:tc/(w:tcPr/w:vMerge{w:val=restart},w:p)),'
+            'w:tr/w:tc/w:p,w:tr/(w:tc/w:p,w:tc/(w:tcPr/w:vMerge,w:p)))'
+        )
+        table = Table(tbl, None)
+        tr = tbl.tr_lst[3]
+
+        cells = table._tr_cells(tr)
+
+        assert [cell._tc for cell in cells] == tr.tc_lst
+
     def it_knows_its_column_count_to_help(self, column_count_fixture):
         table, expected_value = column_count_fixture
         column_count = table._column_count
@@ -261,14 +298,25 @@ class DescribeTable(object):
         return table, new_value, expected_xml
 
     @pytest.fixture
-    def row_cells_fixture(self, _cells_, _column_count_):
-        table = Table(None, None)
-        _cells_.return_value = [0, 1, 2, 3, 4, 5, 6, 7, 8]
-        _column_count_.return_value = 3
+    def row_cells_fixture(self, _tr_cells_):
+        tbl = element('w:tbl/(w:tr,w:tr,w:tr)')
+        table = Table(tbl, None)
         row_idx = 1
-        expected_cells = [3, 4, 5]
+        _tr_cells_.return_value = expected_cells = [3, 4, 5]
         return table, row_idx, expected_cells
 
+    @pytest.fixture(params=[
+        (0, 0), (0, 2), (1, 0), (2, 1), (3, 1), (4, 0), (4, 1), (4, 2),
+    ])
+    def tr_cells_fixture(self, request):
+        snippet_idx, row_idx = request.param
+        tbl = parse_xml(snippet_seq('tbl-cells')[snippet_idx])
+        table = Table(tbl, None)
+        col_count = table._column_count
+        start = row_idx * col_count
+        expected_cells = table._cells[start:start+col_count]
+        return table, tbl.tr_lst[row_idx], expected_cells
+
     @pytest.fixture
     def style_get_fixture(self, part_prop_):
         style_id = 'Barbaz'
@@ -317,6 +365,14 @@ class DescribeTable(object):
             request, Table, 'part', return_value=document_part_
         )
 
+    @pytest.fixture
+    def tbl_(self, request):
+        return instance_mock(request, CT_Tbl)
+
+    @pytest.fixture
+    def _tr_cells_(self, request):
+        return method_mock(request, Table, '_tr_cells')
+
     @pytest.fixture
     def table(self):
         tbl = _tbl_bldr(rows=2, cols=2).element
@@ -396,7 +452,9 @@ class Describe_Cell(object):
     def it_can_merge_itself_with_other_cells(self, merge_fixture):
         cell, other_cell, merged_tc_ = merge_fixture
         merged_cell = cell.merge(other_cell)
+        cell.part.reset_inline_index.assert_called_once_with()
         cell._tc.merge.assert_called_once_with(other_cell._tc)
+        cell._parent._proxy_factory.assert_called_once_with(_Cell)
         assert isinstance(merged_cell, _Cell)
         assert merged_cell._tc is merged_tc_
         assert merged_cell._parent is cell._parent
@@ -455,6 +513,7 @@ class Describe_Cell(object):
     def merge_fixture(self, tc_, tc_2_, parent_, merged_tc_):
         cell, other_cell = _Cell(tc_, parent_), _Cell(tc_2_, parent_)
         tc_.merge.return_value = merged_tc_
+        parent_._proxy_factory.return_value = lambda tc: _Cell(tc, parent_)
         return cell, other_cell, merged_tc_
 
     @pytest.fixture
@@ -655,6 +714,15 @@ class Describe_Columns(object):
             column = columns[idx]
             assert isinstance(column, _Column)
 
+    def it_provides_sliced_access_to_columns(self, columns_fixture):
+        columns, column_count = columns_fixture
+        slice_of_columns = columns[1:]
+        assert len(slice_of_columns) == column_count - 1
+        gridCol_lst = columns._gridCol_lst
+        for idx, column in enumerate(slice_of_columns):
+            assert isinstance(column, _Column)
+            assert column._gridCol is gridCol_lst[idx+1]
+
     def it_raises_on_indexed_access_out_of_range(self, columns_fixture):
         columns, column_count = columns_fixture
         too_low = -1 - column_count
@@ -711,9 +779,9 @@ class Describe_Row(object):
         assert row._tr.xml == expected_xml
 
     def it_provides_access_to_its_cells(self, cells_fixture):
-        row, row_idx, expected_cells = cells_fixture
+        row, expected_cells = cells_fixture
         cells = row.cells
-        row.table.row_cells.assert_called_once_with(row_idx)
+        row.table._tr_cells.assert_called_once_with(row._tr)
         assert cells == expected_cells
 
     def it_provides_access_to_the_table_it_belongs_to(self, table_fixture):
@@ -727,12 +795,11 @@ class Describe_Row(object):
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def cells_fixture(self, _index_, table_prop_, table_):
-        row = _Row(None, None)
-        _index_.return_value = row_idx = 6
+    def cells_fixture(self, table_prop_, table_):
+        row = _Row(element('w:tr'), None)
         expected_cells = (1, 2, 3)
-        table_.row_cells.return_value = list(expected_cells)
-        return row, row_idx, expected_cells
+        table_._tr_cells.return_value = list(expected_cells)
+        return row, expected_cells
 
     @pytest.fixture(params=[
         ('w:tr',                               None),
@@ -823,10 +890,6 @@ class Describe_Row(object):
 
     # fixture components ---------------------------------------------
 
-    @pytest.fixture
-    def _index_(self, request):
-        return property_mock(request, _Row, '_index')
-
     @pytest.fixture
     def parent_(self, request):
         return instance_mock(request, Table)
@@ -888,7 +951,7 @@ class Describe_Rows(object):
     def rows_fixture(self):
         row_count = 2
         tbl = _tbl_bldr(rows=row_count, cols=2).element
-        rows = _Rows(tbl, None)
+        rows = _Rows(tbl, Table(tbl, None))
         return rows, row_count
 
     @pytest.fixture(params=[
@@ -898,7 +961,7 @@ class Describe_Rows(object):
     def slice_fixture(self, request):
         row_count, start, end, expected_count = request.param
         tbl = _tbl_bldr(rows=row_count, cols=2).element
-        rows = _Rows(tbl, None)
+        rows = _Rows(tbl, Table(tbl, None))
         return rows, start, end, expected_count
 
     @pytest.fixture
@@ -0,0 +1,99 @@
+# encoding: utf-8
+
+"""Unit test suite for the docx.template module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import pytest
+
+from docx.api import Document
+from docx.template import Template, compile_template
+
+
+class Describe_compile_template(object):
+
+    def it_locates_the_placeholders_of_a_document(self):
+        document = Document()
+        paragraph = document.add_paragraph("Dear {{ na")
+        paragraph.add_run("me }}, {{ total }}")
+        document.sections[0].header.paragraphs[0].text = "{{ customer.id }}"
+
+        template = compile_template(document)
+
+        assert isinstance(template, Template)
+        assert template.fields == {"name", "total", "customer.id"}
+
+    def it_leaves_the_document_unchanged(self):
+        document = Document()
+        paragraph = document.add_paragraph("Dear {{ na")
+        paragraph.add_run("me }}")
+
+        compile_template(document)
+
+        assert [run.text for run in paragraph.runs] == ["Dear {{ na", "me }}"]
+
+    def it_raises_on_a_list_field_outside_a_table_row(self):
+        document = Document()
+        document.add_paragraph("{{ items.name }}")
+
+        with pytest.raises(ValueError):
+            compile_template(document, list_fields=["items"])
+
+
+class DescribeTemplate(object):
+
+    def it_renders_a_document_filled_from_a_record(self):
+        document = Document()
+        paragraph = document.add_paragraph("Dear {{ na")
+        paragraph.add_run("me }}, you owe {{total}} ")
+        document.sections[0].header.paragraphs[0].text = "For {{ customer.id }}"
+        template = compile_template(document)
+
+        rendered = template.render(
+            {"name": "Bob", "total": 42, "customer": {"id": "C-7"}}
+        )
+
+        assert rendered is not document
+        assert rendered.paragraphs[-1].text == "Dear Bob, you owe 42 "
+        assert rendered.sections[0].header.paragraphs[0].text == "For C-7"
+        assert paragraph.text == "Dear {{ name }}, you owe {{total}} "
+
+    def it_repeats_a_table_row_for_each_item_of_a_list_field(self):
+        document = Document()
+        table = document.add_table(rows=3, cols=2)
+        table.cell(0, 0).text = "Item"
+        table.cell(1, 0).text = "{{ items.name }}"
+        table.cell(1, 1).text = "{{ items.qty }} of {{ total }}"
+        table.cell(2, 0).text = "Total {{ total }}"
+        template = compile_template(document, list_fields=["items"])
+
+        rendered = template.render(
+            {"total": 3, "items": [{"name": "a", "qty": 1}, {"name": "b", "qty": 2}]}
+        )
+
+        rows = rendered.tables[0].rows
+        assert [[cell.text for cell in row.cells] for row in rows] == [
+            ["Item", ""],
+            ["a", "1 of 3"],
+            ["b", "2 of 3"],
+            ["Total 3", ""],
+        ]
+
+    def it_renders_each_record_from_the_same_template(self):
+        document = Document()
+        document.add_paragraph("{{ name }}")
+        template = compile_template(document)
+
+        first = template.render({"name": "Ann"})
+        second = template.render({"name": "Bob"})
+
+        assert first.paragraphs[-1].text == "Ann"
+        assert second.paragraphs[-1].text == "Bob"
+
+    def it_raises_when_a_record_lacks_a_field(self):
+        document = Document()
+        document.add_paragraph("{{ name }}")
+        template = compile_template(document)
+
+        with pytest.raises(KeyError):
+            template.render({})
@@ -0,0 +1,110 @@
+# encoding: utf-8
+
+"""Unit test suite for the docx.validation module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import pytest
+
+import docx
+from docx.oxml import parse_xml
+from docx.oxml.ns import qn
+from docx.validation import SCHEMA_DIR, SchemaViolation, _Schemas, _understood
+
+from .unitutil.file import test_file
+
+_MC_DECLS = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006" '
+    'xmlns:w14="http://schemas.microsoft.com/office/word/2010/wordml"'
+)
+
+
+class DescribeValidate(object):
+
+    def it_finds_no_violation_in_a_valid_document(self):
+        document = docx.Document(test_file("test.docx"))
+        document.add_paragraph("foobar", style="Heading 1")
+
+        assert docx.validate(document) == []
+
+    def it_reports_the_part_and_element_of_each_violation(self):
+        document = docx.Document(test_file("test.docx"))
+        p = document.add_paragraph("foobar")._p
+        p.append(p.makeelement(qn("w:bogus")))
+        p_idx = len(document.element.body.xpath("./w:p"))
+
+        violations = docx.validate(document)
+
+        assert len(violations) == 1
+        violation = violations[0]
+        assert isinstance(violation, SchemaViolation)
+        assert violation.partname == "/word/document.xml"
+        assert violation.path == "/w:document/w:body/w:p[%d]/w:bogus" % p_idx
+        assert "bogus" in violation.message
+
+    def it_leaves_the_cached_xml_of_each_part_in_place(self):
+        document = docx.Document(test_file("test.docx"))
+        package = document.part.package
+        for part in package.iter_parts():
+            part.blob
+        cache_names = [usage.cache_names for usage in package.memory_report()]
+
+        docx.validate(document)
+
+        assert [usage.cache_names for usage in package.memory_report()] == (
+            cache_names
+        )
+        assert ("blob",) in cache_names
+
+    def it_raises_when_the_schemas_are_not_found(self, tmpdir):
+        with pytest.raises(IOError):
+            docx.validate(docx.Document(), str(tmpdir))
+
+    def and_it_raises_when_the_default_directory_lacks_them(
+        self, tmpdir, monkeypatch
+    ):
+        monkeypatch.setattr(docx.validation, "SCHEMA_DIR", str(tmpdir))
+        with pytest.raises(IOError):
+            docx.validate(docx.Document())
+
+
+class Describe_Schemas(object):
+
+    def it_compiles_the_schemas_once_in_a_thread(self):
+        schemas = _Schemas()
+
+        schema = schemas.get(SCHEMA_DIR)
+
+        assert schemas.get(SCHEMA_DIR) is schema
+
+
+class Describe_understood(object):
+
+    def it_sets_aside_markup_in_ignorable_namespaces(self):
+        element = parse_xml(
+            '<w:body %s mc:Ignorable="w14"><w:p w14:paraId="1A2B">'
+            "<w14:foo/><w:r/></w:p></w:body>" % _MC_DECLS
+        )
+
+        understood = _understood(element)
+
+        assert understood is not element
+        assert understood.xpath("./w:p/*") == [understood.xpath("./w:p/w:r")[0]]
+        assert understood.xpath("//@*") == []
+        assert element.xpath("//w14:foo")
+
+    def it_keeps_the_fallback_of_alternate_content(self):
+        element = parse_xml(
+            "<w:r %s><mc:AlternateContent><mc:Choice Requires=\"w14\"><w14:foo/>"
+            "</mc:Choice><mc:Fallback><w:t>x</w:t></mc:Fallback>"
+            "</mc:AlternateContent></w:r>" % _MC_DECLS
+        )
+
+        understood = _understood(element)
+
+        assert [child.tag for child in understood] == [qn("w:t")]
+
+    def but_it_returns_the_element_itself_when_it_has_no_such_markup(self):
+        element = parse_xml("<w:p %s><w:r/></w:p>" % _MC_DECLS)
+        assert _understood(element) is element
@@ -9,9 +9,11 @@ from __future__ import (
 )
 
 from docx.dml.color import ColorFormat
+from docx.enum.dml import MSO_THEME_COLOR
 from docx.enum.text import WD_COLOR, WD_UNDERLINE
-from docx.shared import Pt
-from docx.text.font import Font
+from docx.shared import Pt, RGBColor
+from docx.text.font import Font, RunFormat
+from docx.text.run import Run
 
 import pytest
 
@@ -390,3 +392,58 @@ class DescribeFont(object):
         return class_mock(
             request, 'docx.text.font.ColorFormat', return_value=color_
         )
+
+
+class DescribeRunFormat(object):
+
+    def it_can_apply_itself_to_a_run(self, apply_fixture):
+        run_format, run, expected_xml = apply_fixture
+
+        _run = run_format.apply(run)
+
+        assert run._r.xml == expected_xml
+        assert _run is run
+
+    def it_copies_its_template_into_each_run(self):
+        run_format = RunFormat(bold=True)
+        run, run_2 = Run(element('w:r'), None), Run(element('w:r'), None)
+
+        run_format.apply(run)
+        run_format.apply(run_2)
+        run.font.bold = False
+
+        assert run_2.font.bold is True
+
+    def it_validates_the_formatting_when_built(self):
+        with pytest.raises(ValueError):
+            RunFormat(highlight_color='yellow')
+        with pytest.raises(TypeError):
+            RunFormat(color_format=None)
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ({'bold': True, 'size': Pt(9)}, 'w:r/w:t"foo"',
+         'w:r/(w:rPr/(w:b,w:sz{w:val=18}),w:t"foo")'),
+        ({'color': RGBColor(0x12, 0x34, 0x56)}, 'w:r',
+         'w:r/w:rPr/w:color{w:val=123456}'),
+        ({'color': MSO_THEME_COLOR.ACCENT_1}, 'w:r',
+         'w:r/w:rPr/w:color{w:val=000000,w:themeColor=accent1}'),
+        ({'italic': True, 'underline': True},
+         'w:r/w:rPr/(w:rStyle{w:val=Foo},w:b,w:i{w:val=0},w:sz{w:val=24})',
+         'w:r/w:rPr/(w:rStyle{w:val=Foo},w:b,w:i,w:sz{w:val=24},w:u{w:val=single})'),
+        ({}, 'w:r/w:rPr/w:b', 'w:r/w:rPr/w:b'),
+        ({'name': 'Consolas'},
+         'w:r/w:rPr/w:rFonts{w:ascii=Arial,w:eastAsia=SimSun,w:cs=Mangal}',
+         'w:r/w:rPr/w:rFonts{w:ascii=Consolas,w:eastAsia=SimSun,w:cs=Mangal,'
+         'w:hAnsi=Consolas}'),
+        ({'bold': False, 'size': None, 'color': None},
+         'w:r/w:rPr/(w:b,w:color{w:val=FF0000},w:sz{w:val=24})',
+         'w:r/w:rPr/w:b{w:val=0}'),
+    ])
+    def apply_fixture(self, request):
+        properties, r_cxml, expected_cxml = request.param
+        run_format = RunFormat(**properties)
+        run = Run(element(r_cxml), None)
+        expected_xml = xml(expected_cxml)
+        return run_format, run, expected_xml
@@ -4,11 +4,13 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from docx.blkcntnr import BlockItemContainer
 from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.text.paragraph import CT_P
 from docx.oxml.text.run import CT_R
 from docx.parts.document import DocumentPart
+from docx.text.font import RunFormat
 from docx.text.paragraph import Paragraph
 from docx.text.parfmt import ParagraphFormat
 from docx.text.run import Run
@@ -82,6 +84,13 @@ class DescribeParagraph(object):
         if style:
             style_prop_.assert_called_once_with(style)
 
+    def it_can_add_a_run_having_a_format(self):
+        paragraph = Paragraph(element('w:p'), None)
+
+        paragraph.add_run('foo', format=RunFormat(bold=True))
+
+        assert paragraph._p.xml == xml('w:p/w:r/(w:rPr/w:b,w:t"foo")')
+
     def it_can_insert_a_paragraph_before_itself(self, insert_before_fixture):
         text, style, paragraph_, add_run_calls = insert_before_fixture
         paragraph = Paragraph(None, None)
@@ -100,6 +109,14 @@ class DescribeParagraph(object):
         assert paragraph._p.xml == expected_xml
         assert _paragraph is paragraph
 
+    def it_can_normalize_its_runs(self):
+        paragraph = Paragraph(element('w:p/(w:r/w:t"foo",w:r/w:t"bar")'), None)
+
+        _paragraph = paragraph.normalize_runs()
+
+        assert paragraph._p.xml == xml('w:p/w:r/w:t"foobar"')
+        assert _paragraph is paragraph
+
     def it_inserts_a_paragraph_before_to_help(self, _insert_before_fixture):
         paragraph, body, expected_xml = _insert_before_fixture
         new_paragraph = paragraph._insert_paragraph_before()
@@ -175,7 +192,7 @@ class DescribeParagraph(object):
     def _insert_before_fixture(self, request):
         body_cxml, expected_cxml = request.param
         body = element(body_cxml)
-        paragraph = Paragraph(body[0], None)
+        paragraph = Paragraph(body[0], BlockItemContainer(body, None))
         expected_xml = xml(expected_cxml)
         return paragraph, body, expected_xml
 
@@ -11,7 +11,8 @@ from __future__ import (
 
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
 from docx.shared import Pt
-from docx.text.parfmt import ParagraphFormat
+from docx.text.paragraph import Paragraph
+from docx.text.parfmt import ParagraphFormat, ParagraphFormatSpec
 from docx.text.tabstops import TabStops
 
 import pytest
@@ -420,3 +421,50 @@ class DescribeParagraphFormat(object):
     @pytest.fixture
     def tab_stops_(self, request):
         return instance_mock(request, TabStops)
+
+
+class DescribeParagraphFormatSpec(object):
+
+    def it_can_apply_itself_to_a_paragraph(self, apply_fixture):
+        spec, paragraph, expected_xml = apply_fixture
+
+        _paragraph = spec.apply(paragraph)
+
+        assert paragraph._p.xml == expected_xml
+        assert _paragraph is paragraph
+
+    def it_validates_the_formatting_when_built(self):
+        with pytest.raises(ValueError):
+            ParagraphFormatSpec(alignment='center')
+        with pytest.raises(TypeError):
+            ParagraphFormatSpec(tab_stops=None)
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ({'alignment': WD_ALIGN_PARAGRAPH.CENTER}, 'w:p/w:r',
+         'w:p/(w:pPr/w:jc{w:val=center},w:r)'),
+        ({'space_after': Pt(6), 'keep_with_next': True},
+         'w:p/(w:pPr/(w:pStyle{w:val=Foo},w:jc{w:val=left},w:sectPr),w:r)',
+         'w:p/(w:pPr/(w:pStyle{w:val=Foo},w:keepNext,w:spacing{w:after=120},'
+         'w:jc{w:val=left},w:sectPr),w:r)'),
+        ({'line_spacing': Pt(12)},
+         'w:p/w:pPr/w:spacing{w:before=60,w:line=480,w:lineRule=auto}',
+         'w:p/w:pPr/w:spacing{w:before=60,w:line=240,w:lineRule=exact}'),
+        ({'space_before': Pt(3)},
+         'w:p/w:pPr/w:spacing{w:after=60,w:line=480,w:lineRule=auto}',
+         'w:p/w:pPr/w:spacing{w:after=60,w:line=480,w:lineRule=auto,'
+         'w:before=60}'),
+        ({'first_line_indent': Pt(12)},
+         'w:p/w:pPr/w:ind{w:left=720,w:hanging=360}',
+         'w:p/w:pPr/w:ind{w:left=720,w:firstLine=240}'),
+        ({'space_after': None, 'keep_together': False},
+         'w:p/w:pPr/(w:keepLines,w:spacing{w:before=60,w:after=120})',
+         'w:p/w:pPr/(w:keepLines{w:val=0},w:spacing{w:before=60})'),
+    ])
+    def apply_fixture(self, request):
+        properties, p_cxml, expected_cxml = request.param
+        spec = ParagraphFormatSpec(**properties)
+        paragraph = Paragraph(element(p_cxml), None)
+        expected_xml = xml(expected_cxml)
+        return spec, paragraph, expected_xml
@@ -92,6 +92,7 @@ class DescribeRun(object):
 
         run.part.new_pic_inline.assert_called_once_with(image, width, height)
         assert run._r.xml == expected_xml
+        run.part.index_inline.assert_called_once_with(inline)
         InlineShape_.assert_called_once_with(inline)
         assert picture is picture_
 